@@ -4,10 +4,12 @@ from __future__ import absolute_import
 
 import logging
 
+from .core.async_client import AsyncSwimlane
 from .core.client import Swimlane
 from .utils.version import get_package_version
 
 __all__ = [
+    'AsyncSwimlane',
     'Swimlane',
 ]
 
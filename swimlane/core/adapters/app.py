@@ -1,22 +1,84 @@
+import logging
+
+from requests import HTTPError
+
+from swimlane.core.appindex import AppIndex
 from swimlane.core.cache import check_cache
+from swimlane.core.cursor import Cursor
 from swimlane.core.resolver import SwimlaneResolver
 from swimlane.core.resources.app import App
 from swimlane.utils import one_of_keyword_only
 
+logger = logging.getLogger(__name__)
+
+
+class AppCursor(SwimlaneResolver, Cursor):
+    """Lazy list of apps building each App from its raw definition when first accessed
+
+    Apps only parse their field definitions and create their adapters when first used, so listing apps to find them
+    by name or other attributes is cheap
+
+    .. versionadded:: 10.20.0
+    """
+
+    def __init__(self, swimlane, raw_apps):
+        SwimlaneResolver.__init__(self, swimlane)
+        Cursor.__init__(self)
+
+        self.__raw_apps = raw_apps
+        self._elements = [None] * len(raw_apps)
+
+    def __len__(self):
+        return len(self.__raw_apps)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self[index] for index in range(*item.indices(len(self)))]
+
+        app = self._elements[item]
+        if app is None:
+            app = App(self._swimlane, self.__raw_apps[item])
+            self._elements[item] = app
+        return app
+
+    def _evaluate(self):
+        return list(self)
+
 
 class AppAdapter(SwimlaneResolver):
-    """Handles retrieval of Swimlane App resources"""
+    """Handles retrieval of Swimlane App resources
+
+    Apps are found by name or acronym using an :class:`~swimlane.core.appindex.AppIndex` of light app summaries,
+    downloading only the matching app definition. Stored app definitions are used when the client has an
+    :class:`~swimlane.core.appstore.AppStore`, validated against the modified date of each app in the light app list
+
+    Attributes:
+        index (AppIndex): Directory of app ids, names, and acronyms used for lookups
+    """
+
+    def __init__(self, swimlane, index_refresh_interval=300):
+        super(AppAdapter, self).__init__(swimlane)
+
+        self.index = AppIndex(swimlane, index_refresh_interval)
 
     @check_cache(App)
-    @one_of_keyword_only('id', 'name')
+    @one_of_keyword_only('id', 'name', 'acronym')
     def get(self, key, value):
-        """Get single app by one of id or name
+        """Get single app by one of id, name, or acronym
+
+        Supports resource cache and app store
 
-        Supports resource cache
+        .. versionchanged:: 10.20.0
+            Added acronym lookup
 
         Keyword Args:
             id (str): Full app id
             name (str): App name
+            acronym (str): App acronym
 
         Returns:
             App: Corresponding App resource instance
@@ -29,31 +91,131 @@ class AppAdapter(SwimlaneResolver):
         if not value:
             raise ValueError('The value provided for the key "{0}" cannot be empty or None'.format(key))
 
+        store = self._swimlane.app_store
+
         if key == 'id':
-            # Server returns 204 instead of 404 for a non-existent app id
-            response = self._swimlane.request('get', 'app/{}'.format(value))
-            if response.status_code == 204:
+            if store is not None and store.max_age is not None:
+                stored = store.get_app(self.__store_host, value)
+                if stored is not None and store.is_fresh(stored[1]):
+                    return App(self._swimlane, stored[2])
+
+            # Downloading a single app is as cheap as validating it
+            raw_app = self.__get_raw_app(value)
+            if raw_app is None:
                 raise ValueError('No app with id "{}"'.format(value))
 
-            return App(
-                self._swimlane,
-                response.json()
-            )
-        else:
-            # Workaround for lack of support for get by name
-            # Holdover from previous driver support, to be fixed as part of 3.x
-            for app in self.list():
-                if value and value == app.name:
-                    return app
+            return App(self._swimlane, raw_app)
+
+        if store is not None and store.max_age is not None:
+            stored = store.find_app(self.__store_host, key, value)
+            if stored is not None and store.is_fresh(stored[1]):
+                return App(self._swimlane, stored[2])
 
-            # No matching app found
-            raise ValueError('No app with name "{}"'.format(value))
+        if self.index.supported is not False:
+            try:
+                light_app = self.index.find(key, value)
+            except ValueError:
+                # Light app list not supported by server
+                light_app = None
+            else:
+                if light_app is not None:
+                    raw_app = self.__get_validated_raw_app(light_app)
+                    if raw_app is not None:
+                        return App(self._swimlane, raw_app)
+
+                raise ValueError('No app with {} "{}"'.format(key, value))
+
+        # Fall back to scanning all app definitions
+        for app in self.list():
+            if value == getattr(app, key):
+                return app
+
+        # No matching app found
+        raise ValueError('No app with {} "{}"'.format(key, value))
 
     def list(self):
         """Retrieve list of all apps
 
+        With an app store, refreshes the app index and only downloads changed apps unless more than half of the apps
+        changed
+
+        .. versionchanged:: 10.20.0
+            Returns a lazy AppCursor instead of a list
+
         Returns:
-            :class:`list` of :class:`~swimlane.core.resources.app.App`: List of all retrieved apps
+            AppCursor: Lazy list of all retrieved :class:`~swimlane.core.resources.app.App` instances
+        """
+        raw_apps = None
+        if self._swimlane.app_store is not None:
+            raw_apps = self.__list_stored_raw_apps()
+
+        if raw_apps is None:
+            raw_apps = self._swimlane.request('get', 'app').json()
+            if self._swimlane.app_store is not None:
+                self._swimlane.app_store.put_apps(self.__store_host, raw_apps, replace=True)
+
+        return AppCursor(self._swimlane, raw_apps)
+
+    @property
+    def __store_host(self):
+        return str(self._swimlane.host)
+
+    def __get_raw_app(self, app_id):
+        """Download raw app definition, saving it to the app store. Returns None if there is no app with the id"""
+        # Server returns 204 instead of 404 for a non-existent app id
+        response = self._swimlane.request('get', 'app/{}'.format(app_id))
+        if response.status_code == 204:
+            return None
+
+        raw_app = response.json()
+        if self._swimlane.app_store is not None:
+            self._swimlane.app_store.put_apps(self.__store_host, [raw_app])
+
+        return raw_app
+
+    def __get_validated_raw_app(self, light_app):
+        """Return stored raw definition of the light app if unmodified, otherwise download it"""
+        store = self._swimlane.app_store
+        if store is not None and light_app.get('modifiedDate') is not None:
+            stored = store.get_app(self.__store_host, light_app['id'])
+            if stored is not None and stored[0] == light_app['modifiedDate']:
+                return stored[2]
+
+        return self.__get_raw_app(light_app['id'])
+
+    def __list_stored_raw_apps(self):
+        """Return raw definitions of all apps using stored definitions of unchanged apps
+
+        Returns None when the server does not support validating stored apps or more than half of the apps changed,
+        downloading all apps in a single request being faster
         """
-        response = self._swimlane.request('get', 'app')
-        return [App(self._swimlane, item) for item in response.json()]
+        try:
+            light_apps = self.index.refresh()
+        except HTTPError:
+            logger.exception('Failed to refresh app index, downloading all apps')
+            return None
+
+        if light_apps is None or not all('modifiedDate' in light_app for light_app in light_apps):
+            return None
+
+        store = self._swimlane.app_store
+        stored_apps = store.get_apps(self.__store_host)
+
+        changed_ids = [
+            light_app['id'] for light_app in light_apps
+            if stored_apps.get(light_app['id'], (None,))[0] != light_app['modifiedDate']
+        ]
+        if len(changed_ids) * 2 > len(light_apps):
+            return None
+
+        raw_apps_by_id = {app_id: stored[2] for app_id, stored in stored_apps.items()}
+        for app_id in changed_ids:
+            raw_apps_by_id[app_id] = self.__get_raw_app(app_id)
+
+        available_ids = set(light_app['id'] for light_app in light_apps)
+        store.delete_apps(self.__store_host, set(stored_apps) - available_ids)
+
+        return [
+            raw_apps_by_id[light_app['id']] for light_app in light_apps
+            if raw_apps_by_id[light_app['id']] is not None
+        ]
@@ -17,13 +17,15 @@ class AppRevisionAdapter(AppResolver):
             AppRevision[]: Returns all AppRevisions for this Adapter's app.
         """
         raw_revisions = self._swimlane.request('get', 'app/{0}/history'.format(self._app.id)).json()
+        if self._swimlane.app_store is not None:
+            self._swimlane.app_store.put_revisions(str(self._swimlane.host), self._app.id, raw_revisions)
         return [AppRevision(self._swimlane, raw) for raw in raw_revisions]
 
     def get(self, revision_number):
         """
         Gets a specific app revision.
 
-        Supports resource cache
+        Supports resource cache and app store
 
         Keyword Args:
             revision_number (float): App revision number
@@ -43,7 +45,17 @@ class AppRevisionAdapter(AppResolver):
     @check_cache(AppRevision)
     @one_of_keyword_only('app_id_revision')
     def __get(self, key, value):
-        """Underlying get method supporting resource cache."""
+        """Underlying get method supporting resource cache and app store."""
         app_id, revision_number = AppRevision.parse_unique_id(value)
+
+        store = self._swimlane.app_store
+        if store is not None:
+            # Revisions never change once created
+            app_revision_raw = store.get_revision(str(self._swimlane.host), app_id, revision_number)
+            if app_revision_raw is not None:
+                return AppRevision(self._swimlane, app_revision_raw)
+
         app_revision_raw = self._swimlane.request('get', 'app/{0}/history/{1}'.format(app_id, revision_number)).json()
+        if store is not None:
+            store.put_revisions(str(self._swimlane.host), app_id, [app_revision_raw])
         return AppRevision(self._swimlane, app_revision_raw)
@@ -5,6 +5,7 @@ from swimlane.core.cache import check_cache
 from swimlane.core.resolver import AppResolver
 from swimlane.core.resources.record import Record, record_factory
 from swimlane.core.resources.report import Report
+from swimlane.core.search import COUNT
 from swimlane.utils import random_string, one_of_keyword_only, validate_type
 from swimlane.utils.version import requires_swimlane_version
 
@@ -57,11 +58,19 @@ class RecordAdapter(AppResolver):
                 Set to 0 to return all records
             sort: Tuple of (field_name, order) by which results will be sorted
             columns (list(str)): List of strings of field names to populate in the resulting records. Defaults to all
-                available fields
+                available fields. Accessing other fields of a resulting record sends one request retrieving the full
+                record. Use :func:`~swimlane.core.resources.record.load_partial_records` to retrieve many at once
+            exclude_columns (list(str)): List of strings of field names not to populate in the resulting records, used
+                to skip large fields. Cannot be combined with columns
+            prefetch (int): Number of search pages to request concurrently ahead of the page being parsed. Defaults
+                to 0, requesting one page at a time
+            as_dicts (bool): Return :class:`~swimlane.core.resources.record.RecordValues` mappings of field names to
+                python values instead of Record instances. Much cheaper when only reading values
 
         Notes:
             Uses a temporary Report instance with a random name to facilitate search. Records are normally paginated,
-            but are returned as a single list here, potentially causing performance issues with large searches.
+            but are returned as a single list here, potentially causing performance issues with large searches. Use
+            :meth:`iter_search` to process large searches in a single pass without retaining every record.
 
             All provided filters are AND'ed together
 
@@ -95,18 +104,141 @@ class RecordAdapter(AppResolver):
                 # Populate only the specified field and sort results
                 records = app.records.search(columns=['field_name'], sort=('field_name', 'ascending'))
 
+            ::
+
+                # Populate all fields except large ones
+                records = app.records.search(exclude_columns=['Description', 'Raw Event'])
+
+            ::
+
+                # Read field values without building Record instances
+                for values in app.records.search(limit=0, as_dicts=True):
+                    print(values.tracking_id, values['field_name'])
+
+            ::
+
+                # Return all records from app, keeping 4 page requests in flight
+                records = app.records.search(limit=0, prefetch=4)
+
 
         Returns:
             :class:`list` of :class:`~swimlane.core.resources.record.Record`: List of Record instances returned from the
                 search results
         """
+        report = self._build_search_report(filters, filter_type, kwargs)
+
+        return list(report)
+
+    def iter_search(self, *filters, filter_type='And', **kwargs):
+        """Iterator variant of :meth:`search` yielding records as each page of results is retrieved
+
+        .. versionadded:: 10.20.0
+
+        Accepts the same arguments as :meth:`search`
+
+        Notes:
+            Uses a streaming Report, records are not retained after being yielded, keeping memory usage flat at a single
+            page of results regardless of the total number of records returned
+
+        Examples:
+
+            ::
+
+                # Process every record in app in a single pass
+                for record in app.records.iter_search(limit=0):
+                    do_thing(record)
+
+        Returns:
+            Iterator of :class:`~swimlane.core.resources.record.Record` instances returned from the search results
+        """
+        kwargs['stream'] = True
+        report = self._build_search_report(filters, filter_type, kwargs)
+
+        return iter(report)
+
+    def aggregate(self, *filters, group_by=None, metrics=None, filter_type='And', keywords=None):
+        """Compute aggregates of matching records on the server, optionally grouped by field values
+
+        .. versionadded:: 10.20.0
+
+        Args:
+            *filters (tuple): Zero or more filter tuples of (field_name, operator, field_value) selecting aggregated
+                records
+
+        Keyword Args:
+            group_by (str|tuple|list): Field name, or (field_name, group_by_type) tuple, or list of either, to group
+                results by. Group by types are available as constants in `swimlane.core.search`. Defaults to a single
+                row for all matching records
+            metrics (dict): Mapping of result row keys to an aggregate type, or (aggregate_type, field_name) tuple.
+                An aggregate type alone counts records. Defaults to {'count': 'count'}
+            filter_type (str): One of `And` or `Or` combining filters
+            keywords (list(str)): List of keywords to use in search
+
+        Notes:
+            Uses a temporary Report instance with a random name. See :meth:`Report.stats`
+
+        Examples:
+
+            ::
+
+                from swimlane.core import search
+
+                # Count and total amount of open records per severity and month
+                rows = app.records.aggregate(
+                    ('Status', 'equals', 'Open'),
+                    group_by=['Severity', ('Created', search.MONTH)],
+                    metrics={
+                        'records': search.COUNT,
+                        'total': (search.SUM, 'Amount')
+                    }
+                )
+
+                for row in rows:
+                    print(row['Severity'], row['Created'], row['records'], row['total'])
+
+        Returns:
+            :class:`list` of :class:`dict`: One dict per group mapping names of group by fields to the group's values,
+            and metric keys to the aggregate values
+        """
+        report = self._app.reports.build('aggregate-' + random_string(8), keywords=keywords or [])
+
+        for filter_tuples in filters:
+            report.filter(*filter_tuples)
+        report.filter_type(filter_type)
+
+        if group_by is None:
+            group_by = []
+        elif not isinstance(group_by, list):
+            group_by = [group_by]
+        for group in group_by:
+            if isinstance(group, tuple):
+                report.group_by(*group)
+            else:
+                report.group_by(group)
+
+        for label, metric in six.iteritems(metrics or {'count': COUNT}):
+            if isinstance(metric, tuple):
+                aggregate_type, field_name = metric
+            else:
+                aggregate_type, field_name = metric, None
+            report.aggregate(field_name, aggregate_type, label=label)
+
+        return report.stats()
+
+    def _build_search_report(self, filters, filter_type, kwargs):
+        """Build temporary search Report from search() arguments"""
         report = self._app.reports.build(
             'search-' + random_string(8),
             keywords=kwargs.pop('keywords', []),
             limit=kwargs.pop('limit', Report.default_limit),
             page_size=kwargs.pop('page_size', 1000),
             page_start=kwargs.pop('page_start', None),
-            page_end=kwargs.pop('page_end', None)
+            page_end=kwargs.pop('page_end', None),
+            prefetch=kwargs.pop('prefetch', Report.default_prefetch),
+            stream=kwargs.pop('stream', Report.default_stream),
+            as_dicts=kwargs.pop('as_dicts', False),
+            columns=kwargs.pop('columns', None),
+            exclude_columns=kwargs.pop('exclude_columns', None)
         )
 
         for filter_tuples in filters:
@@ -116,13 +248,9 @@ class RecordAdapter(AppResolver):
         if sort_tuple:
             report.sort(*sort_tuple)
 
-        columns = kwargs.pop('columns', None)
-        if columns:
-            report.set_columns(*columns)
-        
-        report.filter_type(filter_type)     
+        report.filter_type(filter_type)
 
-        return list(report)
+        return report
     
   
     def create(self, **fields):
@@ -292,7 +420,7 @@ class RecordAdapter(AppResolver):
         _type = validate_filters_or_records_or_ids(filters_or_records_or_ids)
 
         request_payload = {}
-        record_stub = record_factory(self._app)
+        record_stub = self._app._get_stub_record()
 
         if _type is Record or _type is str:
             the_record_ids = []
@@ -420,7 +548,7 @@ class RecordAdapter(AppResolver):
         # build filters
         else:
             filters = []
-            record_stub = record_factory(self._app)
+            record_stub = self._app._get_stub_record()
             for filter_tuples in filters_or_records_or_ids:
                 field = record_stub.get_field(filter_tuples[0])
 
@@ -10,9 +10,9 @@ from swimlane.utils import one_of_keyword_only
 class GroupListCursor(SwimlaneResolver, PaginatedCursor):
     """Handles retrieval and pagination of group list endpoint"""
 
-    def __init__(self, swimlane, limit=None):
+    def __init__(self, swimlane, limit=None, stream=PaginatedCursor.default_stream):
         SwimlaneResolver.__init__(self, swimlane)
-        PaginatedCursor.__init__(self, limit)
+        PaginatedCursor.__init__(self, limit, stream=stream)
 
     def _parse_raw_element(self, raw_element):
         return Group(self._swimlane, raw_element)
@@ -32,9 +32,13 @@ class GroupListCursor(SwimlaneResolver, PaginatedCursor):
 class GroupAdapter(SwimlaneResolver):
     """Handles retrieval of Swimlane Group resources"""
 
-    def list(self, limit=None):
+    def list(self, limit=None, stream=False):
         """Retrieve list of all groups
 
+        Args:
+            limit (int): Maximum number of groups to return. Defaults to all groups
+            stream (bool): Yield groups without retaining them on the returned cursor
+
         Returns:
             :class:`list` of :class:`~swimlane.core.resources.usergroup.Group`: List of all Groups
         Raises:
@@ -42,7 +46,7 @@ class GroupAdapter(SwimlaneResolver):
         """
 
         if (isinstance(limit, int) and limit > 0) or limit is None:
-            return GroupListCursor(swimlane=self._swimlane, limit=limit)
+            return GroupListCursor(swimlane=self._swimlane, limit=limit, stream=stream)
 
         raise ValueError('Limit should be a positive whole number greater than 0')
 
@@ -86,9 +90,9 @@ class GroupAdapter(SwimlaneResolver):
 class UserListCursor(SwimlaneResolver, PaginatedCursor):
     """Handles retrieval and pagination for user list endpoint"""
 
-    def __init__(self, swimlane, limit=None):
+    def __init__(self, swimlane, limit=None, stream=PaginatedCursor.default_stream):
         SwimlaneResolver.__init__(self, swimlane)
-        PaginatedCursor.__init__(self, limit)
+        PaginatedCursor.__init__(self, limit, stream=stream)
 
     def _parse_raw_element(self, raw_element):
         return User(self._swimlane, raw_element)
@@ -108,9 +112,13 @@ class UserListCursor(SwimlaneResolver, PaginatedCursor):
 class UserAdapter(SwimlaneResolver):
     """Handles retrieval of Swimlane User resources"""
 
-    def list(self, limit=None):
+    def list(self, limit=None, stream=False):
         """Retrieve all users
 
+        Args:
+            limit (int): Maximum number of users to return. Defaults to all users
+            stream (bool): Yield users without retaining them on the returned cursor
+
         Returns:
             :class:`UserListCursor`: Paginated cursor yielding :class:`User` instances
 
@@ -119,7 +127,7 @@ class UserAdapter(SwimlaneResolver):
         """
 
         if (isinstance(limit, int) and limit > 0) or limit is None:
-            return UserListCursor(swimlane=self._swimlane, limit=limit)
+            return UserListCursor(swimlane=self._swimlane, limit=limit, stream=stream)
 
         raise ValueError('Limit should be a positive whole number greater than 0')
 
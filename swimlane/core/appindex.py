@@ -0,0 +1,154 @@
+"""Lightweight directory of app ids, names, and acronyms used to find apps without downloading their definitions
+
+.. versionadded:: 10.20.0
+"""
+import logging
+import threading
+import time
+
+from requests import HTTPError
+
+from swimlane.core.resolver import SwimlaneResolver
+
+logger = logging.getLogger(__name__)
+
+# Keys apps can be looked up by
+INDEX_KEYS = ('id', 'name', 'acronym')
+
+# Light app list response status codes of servers not supporting it
+_UNSUPPORTED_STATUS_CODES = (404, 405)
+
+
+class AppIndex(SwimlaneResolver):
+    """Directory of light app summaries from the light app list, fetched once and refreshed in the background
+
+    Lookups return the light summary of an app, including its id, name, acronym, and modified date when provided by the
+    server, so only the one matching app definition needs to be downloaded. Lookups of apps missing from the directory
+    refresh it once before reporting them missing, finding apps created since the last refresh
+
+    Args:
+        swimlane (Swimlane): Client used to fetch the light app list
+        refresh_interval (float): Seconds after which lookups refresh the directory in a background thread, returning
+            results from the current directory meanwhile. Set None to only refresh on lookup misses and app list
+            retrieval
+
+    Attributes:
+        supported (bool): False when the server does not provide a usable light app list. None until first fetched
+    """
+
+    def __init__(self, swimlane, refresh_interval=300):
+        super(AppIndex, self).__init__(swimlane)
+
+        if refresh_interval is not None and refresh_interval < 0:
+            raise ValueError('refresh_interval should be zero or above, or None')
+
+        self.refresh_interval = refresh_interval
+        self.supported = None
+
+        self.__entries = None
+        self.__indexes = None
+        self.__refreshed_at = None
+        self.__lock = threading.Lock()
+        self.__refresh_thread = None
+
+    def __len__(self):
+        return len(self.__entries or ())
+
+    def refresh(self):
+        """Fetch the light app list, replacing the current directory
+
+        Only a 404 or 405 response, or a malformed response body, mark the light app list as unsupported. The current
+        directory is kept on any other error, retrying on next refresh
+
+        Returns:
+            list: Light app summaries, or None if the light app list is not supported by the server
+
+        Raises:
+            requests.HTTPError: On any other 4xx/5xx HTTP response
+        """
+        if self.supported is False:
+            return None
+
+        try:
+            entries = self._swimlane.request('get', 'app/light').json()
+        except HTTPError as error:
+            if error.response is None or error.response.status_code not in _UNSUPPORTED_STATUS_CODES:
+                raise
+            entries = None
+        except ValueError:
+            entries = None
+
+        if not isinstance(entries, list) or not all('id' in entry and 'name' in entry for entry in entries):
+            logger.debug('Light app list not supported by server, app index disabled')
+            self.supported = False
+            return None
+
+        indexes = {key: {} for key in INDEX_KEYS}
+        for entry in entries:
+            for key in INDEX_KEYS:
+                if entry.get(key) is not None:
+                    indexes[key].setdefault(entry[key], entry)
+
+        with self.__lock:
+            self.__entries = entries
+            self.__indexes = indexes
+            self.__refreshed_at = time.time()
+            self.supported = True
+
+        return entries
+
+    def invalidate(self):
+        """Discard the current directory, fetching it again on next lookup"""
+        with self.__lock:
+            self.__entries = None
+            self.__indexes = None
+            self.__refreshed_at = None
+
+    def find(self, key, value):
+        """Return light summary of the app matching key and value
+
+        Args:
+            key (str): One of `id`, `name`, or `acronym`
+            value (str): Value to match exactly
+
+        Returns:
+            dict: Light app summary, or None if no app matches
+
+        Raises:
+            ValueError: If the light app list is not supported by the server, check `supported` first to fall back to
+                the full app list
+            requests.HTTPError: If the directory could not be fetched for the first lookup, or refreshed on a lookup
+                miss
+        """
+        refreshed = False
+        with self.__lock:
+            indexes = self.__indexes
+            refreshed_at = self.__refreshed_at
+
+        if indexes is None:
+            if self.refresh() is None:
+                raise ValueError('Light app list not supported by server')
+            indexes = self.__indexes
+            refreshed = True
+        elif self.refresh_interval is not None and time.time() - refreshed_at >= self.refresh_interval:
+            self.__refresh_in_background()
+
+        entry = indexes[key].get(value)
+        if entry is None and not refreshed and self.refresh() is not None:
+            entry = self.__indexes[key].get(value)
+
+        return entry
+
+    def __refresh_in_background(self):
+        with self.__lock:
+            if self.__refresh_thread is not None and self.__refresh_thread.is_alive():
+                return
+            self.__refresh_thread = threading.Thread(target=self.__background_refresh, daemon=True)
+            self.__refresh_thread.start()
+
+    def __background_refresh(self):
+        try:
+            self.refresh()
+        except Exception:  # pylint: disable=broad-except
+            # Current directory is kept, refresh is retried by the next lookup
+            logger.exception('Failed to refresh app index in background')
@@ -0,0 +1,254 @@
+"""Persistent on-disk store of raw App definitions and App revisions shared between client processes
+
+Used by :class:`~swimlane.core.adapters.app.AppAdapter` and
+:class:`~swimlane.core.adapters.app_revision.AppRevisionAdapter` when a Swimlane client is created with an `app_store`,
+allowing short-lived processes to skip downloading full app definitions that have not changed since they were stored
+
+.. versionadded:: 10.20.0
+"""
+import sqlite3
+import threading
+import time
+
+from swimlane.core.jsonbackend import get_json_backend
+
+# Increased whenever the schema changes, stores with another version are recreated
+_schema_version = 2
+
+_schema = (
+    '''
+    CREATE TABLE IF NOT EXISTS apps (
+        host TEXT NOT NULL,
+        id TEXT NOT NULL,
+        name TEXT,
+        acronym TEXT,
+        modified_date TEXT,
+        stored_at REAL NOT NULL,
+        raw BLOB NOT NULL,
+        PRIMARY KEY (host, id)
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS apps_name ON apps (host, name)',
+    'CREATE INDEX IF NOT EXISTS apps_acronym ON apps (host, acronym)',
+    '''
+    CREATE TABLE IF NOT EXISTS app_revisions (
+        host TEXT NOT NULL,
+        app_id TEXT NOT NULL,
+        revision_number REAL NOT NULL,
+        raw BLOB NOT NULL,
+        PRIMARY KEY (host, app_id, revision_number)
+    )
+    '''
+)
+
+# Columns apps can be found by
+_lookup_columns = ('id', 'name', 'acronym')
+
+class AppStore(object):
+    """SQLite backed store of raw App definitions and App revisions, keyed by Swimlane host and app id
+
+    Stored apps are validated against the `modifiedDate` of the app on the server before use. Apps stored less than
+    `max_age` seconds ago are trusted without validation. App revisions never change once created and are always used
+    when stored
+
+    Safe to share between threads and between processes using the same file
+
+    Args:
+        path (str): SQLite database file path, created if missing. Use `:memory:` for a store private to the instance
+        max_age (float): Seconds stored apps are used without validating them against the server. Defaults to None,
+            always validating stored apps
+        timeout (float): Seconds to wait for another process to release the database before failing. Defaults to 10
+
+    Raises:
+        ValueError: If max_age is negative
+
+    Examples:
+
+        ::
+
+            from swimlane import Swimlane
+            from swimlane.core.appstore import AppStore
+
+            swimlane = Swimlane(
+                'https://192.168.1.1',
+                'username',
+                'password',
+                app_store=AppStore('/var/cache/swimlane/apps.db', max_age=300)
+            )
+    """
+
+    def __init__(self, path, max_age=None, timeout=10):
+        if max_age is not None and max_age < 0:
+            raise ValueError('max_age should be zero or above, or None')
+
+        self.path = path
+        self.max_age = max_age
+
+        self.__json = get_json_backend()
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        with self.__lock, self.__connection:
+            if self.__connection.execute('PRAGMA user_version').fetchone()[0] != _schema_version:
+                # Stored data is only a cache of server data, discard it rather than migrating it
+                self.__connection.execute('DROP TABLE IF EXISTS apps')
+                self.__connection.execute('DROP TABLE IF EXISTS app_revisions')
+                self.__connection.execute('PRAGMA user_version = {}'.format(_schema_version))
+            for statement in _schema:
+                self.__connection.execute(statement)
+
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.path)
+
+    def close(self):
+        """Close the database connection"""
+        with self.__lock:
+            self.__connection.close()
+
+    def __execute(self, statement, *args):
+        with self.__lock, self.__connection:
+            return self.__connection.execute(statement, args).fetchall()
+
+    def __executemany(self, statement, rows):
+        with self.__lock, self.__connection:
+            self.__connection.executemany(statement, rows)
+
+    def is_fresh(self, stored_at):
+        """Return True if an app stored at `stored_at` epoch seconds can be used without validation"""
+        return self.max_age is not None and time.time() - stored_at < self.max_age
+
+    def get_apps(self, host):
+        """Return all apps stored for host
+
+        Args:
+            host (str): Swimlane host URL
+
+        Returns:
+            dict: Mapping of app id to a (modified_date, stored_at, raw) tuple
+        """
+        return {
+            app_id: (modified_date, stored_at, self.__json.loads(raw))
+            for app_id, modified_date, stored_at, raw in self.__execute(
+                'SELECT id, modified_date, stored_at, raw FROM apps WHERE host = ?',
+                host
+            )
+        }
+
+    def get_app(self, host, app_id):
+        """Return (modified_date, stored_at, raw) tuple of stored app, or None if app is not stored"""
+        rows = self.__execute(
+            'SELECT modified_date, stored_at, raw FROM apps WHERE host = ? AND id = ?',
+            host,
+            app_id
+        )
+        if not rows:
+            return None
+
+        modified_date, stored_at, raw = rows[0]
+        return modified_date, stored_at, self.__json.loads(raw)
+
+    def find_app(self, host, key, value):
+        """Return (modified_date, stored_at, raw) tuple of stored app matching key and value, or None if not stored
+
+        Only the matching app definition is read and decoded
+
+        Args:
+            host (str): Swimlane host URL
+            key (str): One of `id`, `name`, or `acronym`
+            value (str): Value to match exactly
+
+        Raises:
+            ValueError: If key is not one of `id`, `name`, or `acronym`
+        """
+        if key not in _lookup_columns:
+            raise ValueError('Cannot find stored apps by "{}", expected one of {}'.format(
+                key,
+                ', '.join(_lookup_columns)
+            ))
+
+        rows = self.__execute(
+            'SELECT modified_date, stored_at, raw FROM apps WHERE host = ? AND {} = ? LIMIT 1'.format(key),
+            host,
+            value
+        )
+        if not rows:
+            return None
+
+        modified_date, stored_at, raw = rows[0]
+        return modified_date, stored_at, self.__json.loads(raw)
+
+    def put_apps(self, host, raw_apps, replace=False):
+        """Store raw app definitions, replacing any stored definitions of the same apps
+
+        Args:
+            host (str): Swimlane host URL
+            raw_apps (list): Raw app definitions as returned by the API
+            replace (bool): Remove all other apps stored for host and their revisions, used when raw_apps lists all
+                apps available on the server
+        """
+        if replace:
+            app_ids = set(row[0] for row in self.__execute('SELECT id FROM apps WHERE host = ?', host))
+            self.delete_apps(host, app_ids - set(raw['id'] for raw in raw_apps))
+
+        stored_at = time.time()
+        self.__executemany(
+            '''
+            INSERT OR REPLACE INTO apps (host, id, name, acronym, modified_date, stored_at, raw)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''',
+            [
+                (
+                    host,
+                    raw['id'],
+                    raw.get('name'),
+                    raw.get('acronym'),
+                    raw.get('modifiedDate'),
+                    stored_at,
+                    self.__json.dumps(raw)
+                )
+                for raw in raw_apps
+            ]
+        )
+
+    def delete_apps(self, host, app_ids):
+        """Remove stored apps and their revisions, used for apps no longer available on the server"""
+        rows = [(host, app_id) for app_id in app_ids]
+        self.__executemany('DELETE FROM apps WHERE host = ? AND id = ?', rows)
+        self.__executemany('DELETE FROM app_revisions WHERE host = ? AND app_id = ?', rows)
+
+    def get_revision(self, host, app_id, revision_number):
+        """Return raw app revision, or None if revision is not stored"""
+        rows = self.__execute(
+            'SELECT raw FROM app_revisions WHERE host = ? AND app_id = ? AND revision_number = ?',
+            host,
+            app_id,
+            float(revision_number)
+        )
+        if not rows:
+            return None
+
+        return self.__json.loads(rows[0][0])
+
+    def put_revisions(self, host, app_id, raw_revisions):
+        """Store raw app revisions as returned by the API
+
+        Args:
+            host (str): Swimlane host URL
+            app_id (str): Id of the app the revisions belong to
+            raw_revisions (list): Raw app revisions of the app
+        """
+        self.__executemany(
+            'INSERT OR REPLACE INTO app_revisions (host, app_id, revision_number, raw) VALUES (?, ?, ?, ?)',
+            [
+                (host, app_id, float(raw['revisionNumber']), self.__json.dumps(raw))
+                for raw in raw_revisions
+            ]
+        )
+
+    def clear(self, host=None):
+        """Remove all stored apps and revisions, or only those of host when provided"""
+        if host is None:
+            self.__execute('DELETE FROM apps')
+            self.__execute('DELETE FROM app_revisions')
+        else:
+            self.__execute('DELETE FROM apps WHERE host = ?', host)
+            self.__execute('DELETE FROM app_revisions WHERE host = ?', host)
@@ -0,0 +1,512 @@
+"""Asyncio Swimlane client mirroring the blocking client API with awaitable operations"""
+
+import asyncio
+import functools
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+from swimlane.core.client import Swimlane
+from swimlane.core.fields.reference import ReferenceCursor
+from swimlane.core.resources.record import Record
+
+try:
+    _get_running_loop = asyncio.get_running_loop
+except AttributeError:
+    # Python 3.6
+    _get_running_loop = asyncio.get_event_loop
+
+
+class AsyncSwimlane(object):
+    """Asyncio Swimlane API client
+
+    Mirrors the :class:`~swimlane.core.client.Swimlane` client adapters with awaitable methods, reusing the same
+    Resource and Field classes for all parsing. This is not a native asyncio HTTP client: requests are sent by an
+    underlying blocking Swimlane client on a thread pool of `max_concurrency` threads. Any number of operations can be
+    awaited from a single event loop thread, but at most `max_concurrency` of them run at once, the others waiting for
+    a free thread
+
+    Apps and Records are returned wrapped in :class:`AsyncApp` and :class:`AsyncRecord`, running every operation that
+    may send requests on the thread pool, including field access resolving references or values of partial records
+
+    .. versionadded:: 10.20.0
+
+    Args:
+        *args: Positional args passed to :class:`~swimlane.core.client.Swimlane`
+
+    Keyword Args:
+        max_concurrency (int): Number of threads sending requests, the maximum number of operations running at once.
+            Defaults to 10, matching the default connection pool size of the underlying session
+        **kwargs: Remaining keyword args passed to :class:`~swimlane.core.client.Swimlane`
+
+    Attributes:
+        client (Swimlane): Underlying blocking client used to send requests
+        apps (AsyncAppAdapter): Async adapter for App resources
+        users (AsyncUserAdapter): Async adapter for User resources
+        groups (AsyncGroupAdapter): Async adapter for Group resources
+        helpers (AsyncHelperAdapter): Async adapter for helper endpoints
+
+    Notes:
+        Authentication and server version verification run during construction as with the blocking client. Use
+        :meth:`connect` to construct the client without blocking the running event loop
+
+    Examples:
+
+        ::
+
+            async def main():
+                async with await AsyncSwimlane.connect('https://192.168.1.1', access_token='abcdefg') as swimlane:
+                    app = await swimlane.apps.get(name='Target App')
+
+                    records = await asyncio.gather(*[
+                        app.records.get(id=record_id) for record_id in record_ids
+                    ])
+
+                    async for record in app.records.iter_search(('Status', 'equals', 'Open'), limit=0):
+                        await record.set('Status', 'Closed')
+                        await record.save()
+    """
+
+    default_max_concurrency = 10
+
+    def __init__(self, *args, max_concurrency=default_max_concurrency, **kwargs):
+        self._init_client(Swimlane(*args, **kwargs), max_concurrency)
+
+    def _init_client(self, client, max_concurrency):
+        if not isinstance(max_concurrency, int) or max_concurrency <= 0:
+            raise ValueError('max_concurrency should be a positive integer')
+
+        self.client = client
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+        self.apps = AsyncAppAdapter(self, client.apps)
+        self.users = AsyncUserAdapter(self, client.users)
+        self.groups = AsyncGroupAdapter(self, client.groups)
+        self.helpers = AsyncHelperAdapter(self, client.helpers)
+
+    @classmethod
+    def from_client(cls, client, max_concurrency=default_max_concurrency):
+        """Build an AsyncSwimlane client sending requests through an existing Swimlane client
+
+        Args:
+            client (Swimlane): Existing blocking client
+            max_concurrency (int): Maximum number of requests in flight at once
+
+        Returns:
+            AsyncSwimlane: New async client sharing the provided client's session, auth, and resource cache
+        """
+        instance = cls.__new__(cls)
+        instance._init_client(client, max_concurrency)
+        return instance
+
+    @classmethod
+    async def connect(cls, *args, max_concurrency=default_max_concurrency, **kwargs):
+        """Authenticate and build a new AsyncSwimlane client without blocking the running event loop
+
+        Accepts the same arguments as the AsyncSwimlane constructor
+
+        Returns:
+            AsyncSwimlane: New connected async client
+        """
+        loop = _get_running_loop()
+        client = await loop.run_in_executor(None, functools.partial(Swimlane, *args, **kwargs))
+
+        return cls.from_client(client, max_concurrency)
+
+    def __repr__(self):
+        return '<{}: {!r}>'.format(self.__class__.__name__, self.client)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Shutdown thread pool used to send requests, waiting on any requests in flight"""
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, func, *args, **kwargs):
+        """Run blocking function on client thread pool, returning its result"""
+        loop = _get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def request(self, method, api_endpoint, **kwargs):
+        """Awaitable :meth:`Swimlane.request <swimlane.core.client.Swimlane.request>`
+
+        Returns:
+            requests.Response: Successful response instances
+        """
+        return await self._run(self.client.request, method, api_endpoint, **kwargs)
+
+    @property
+    def user(self):
+        """User record instance for authenticated user"""
+        return self.client.user
+
+
+class _AsyncAdapter(object):
+    """Base class for async adapters running blocking adapter methods on the parent AsyncSwimlane thread pool"""
+
+    def __init__(self, swimlane, adapter):
+        self._swimlane = swimlane
+        self._adapter = adapter
+
+    def _run(self, method_name, *args, **kwargs):
+        return self._swimlane._run(getattr(self._adapter, method_name), *args, **kwargs)
+
+
+class AsyncApp(object):
+    """App wrapper exposing async record, report, and revision adapters
+
+    All other attributes are proxied to the wrapped App
+
+    Attributes:
+        app (App): Wrapped App instance
+        records (AsyncRecordAdapter): Async adapter for the App's Records
+        reports (AsyncReportAdapter): Async adapter for the App's Reports
+        revisions (AsyncRevisionAdapter): Async adapter for the App's revisions
+    """
+
+    def __init__(self, swimlane, app):
+        self.app = app
+        self.records = AsyncRecordAdapter(swimlane, app.records)
+        self.reports = AsyncReportAdapter(swimlane, app.reports)
+        self.revisions = AsyncRevisionAdapter(swimlane, app.revisions)
+
+    def __getattr__(self, item):
+        return getattr(self.app, item)
+
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.app)
+
+
+def _wrap_record(swimlane, element):
+    """Wrap Records in AsyncRecord, returning other elements such as RecordValues unchanged"""
+    return AsyncRecord(swimlane, element) if isinstance(element, Record) else element
+
+
+class AsyncRecord(object):
+    """Record wrapper running every operation that may send requests on the client thread pool
+
+    Field values are read and set with awaitable :meth:`get` and :meth:`set` instead of item access, as reading a field
+    may retrieve referenced records or values missing from a partial record. The :meth:`get_field`, :meth:`for_json`,
+    :meth:`validate`, :meth:`save`, :meth:`patch`, :meth:`delete`, :meth:`lock`, :meth:`unlock`,
+    :meth:`add_restriction`, :meth:`remove_restriction`, and :meth:`execute_task` methods of the wrapped Record are
+    awaitable. All other attributes are proxied to the wrapped Record
+
+    .. versionadded:: 10.20.0
+
+    Attributes:
+        record (Record): Wrapped Record instance
+        revisions (AsyncRevisionAdapter): Async adapter for the Record's revisions
+    """
+
+    _async_methods = frozenset([
+        'get_field',
+        'for_json',
+        'validate',
+        'save',
+        'patch',
+        'delete',
+        'lock',
+        'unlock',
+        'add_restriction',
+        'remove_restriction',
+        'execute_task'
+    ])
+
+    def __init__(self, swimlane, record):
+        self._swimlane = swimlane
+        self.record = record
+        self.revisions = AsyncRevisionAdapter(swimlane, record.revisions)
+
+    def __getattr__(self, item):
+        attribute = getattr(self.record, item)
+        if item in self._async_methods:
+            return functools.partial(self._swimlane._run, attribute)
+        return attribute
+
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.record)
+
+    def __eq__(self, other):
+        if isinstance(other, AsyncRecord):
+            other = other.record
+        return self.record == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.record)
+
+    def __getitem__(self, field_name):
+        raise TypeError('Use "await record.get(field_name)" to read field values of an {}'.format(
+            self.__class__.__name__
+        ))
+
+    def __setitem__(self, field_name, value):
+        raise TypeError('Use "await record.set(field_name, value)" to set field values of an {}'.format(
+            self.__class__.__name__
+        ))
+
+    @property
+    def app(self):
+        """Record's App wrapped with async adapters"""
+        return AsyncApp(self._swimlane, self.record.app)
+
+    async def get(self, field_name):
+        """Return value of a field, retrieving any values missing from a partial record and all referenced records of
+        a reference field on the client thread pool
+
+        Returns:
+            Field value as returned by `record[field_name]`
+        """
+        def get_value():
+            value = self.record[field_name]
+            if isinstance(value, ReferenceCursor):
+                # Resolve all referenced records in a single batch
+                value[:]
+            return value
+
+        return await self._swimlane._run(get_value)
+
+    async def set(self, field_name, value):
+        """Set value of a field, as `record[field_name] = value`, on the client thread pool"""
+        return await self._swimlane._run(self.record.__setitem__, field_name, value)
+
+
+def _unwrap_records(elements):
+    """Replace AsyncRecords with their wrapped Records"""
+    return [element.record if isinstance(element, AsyncRecord) else element for element in elements]
+
+
+class AsyncRevisionAdapter(_AsyncAdapter):
+    """Async :class:`~swimlane.core.adapters.app_revision.AppRevisionAdapter` or
+    :class:`~swimlane.core.adapters.record_revision.RecordRevisionAdapter`
+
+    .. versionadded:: 10.20.0
+    """
+
+    async def get_all(self):
+        """Get all revisions
+
+        Returns:
+            list: All revisions of the App or Record
+        """
+        return await self._run('get_all')
+
+    async def get(self, revision_number):
+        """Get a single revision by revision number"""
+        return await self._run('get', revision_number)
+
+
+class AsyncAppAdapter(_AsyncAdapter):
+    """Async :class:`~swimlane.core.adapters.app.AppAdapter`"""
+
+    async def get(self, **kwargs):
+        """Get single app by one of id, name, or acronym
+
+        Returns:
+            AsyncApp: Corresponding App resource wrapped with async adapters
+        """
+        return AsyncApp(self._swimlane, await self._run('get', **kwargs))
+
+    async def list(self):
+        """Retrieve list of all apps
+
+        Apps are built from the lazy app list on the client thread pool, not on the event loop thread
+
+        Returns:
+            :class:`list` of :class:`AsyncApp`: List of all retrieved apps
+        """
+        return await self._swimlane._run(lambda: [AsyncApp(self._swimlane, app) for app in self._adapter.list()])
+
+
+class AsyncRecordAdapter(_AsyncAdapter):
+    """Async :class:`~swimlane.core.adapters.record.RecordAdapter`"""
+
+    async def get(self, **kwargs):
+        """Get a single record by id or tracking_id
+
+        Returns:
+            AsyncRecord: Matching Record instance returned from API
+        """
+        return AsyncRecord(self._swimlane, await self._run('get', **kwargs))
+
+    async def search(self, *filters, **kwargs):
+        """Search records, accepts the same arguments as :meth:`RecordAdapter.search`
+
+        Returns:
+            :class:`list` of :class:`AsyncRecord`: List of Records returned from the search results, or
+                :class:`~swimlane.core.resources.record.RecordValues` when `as_dicts` is set
+        """
+        elements = await self._run('search', *filters, **kwargs)
+        return [_wrap_record(self._swimlane, element) for element in elements]
+
+    def iter_search(self, *filters, **kwargs):
+        """Async iterator variant of :meth:`search`, retrieving results a page at a time
+
+        Returns:
+            AsyncReport: Streaming report to iterate over with `async for`
+        """
+        kwargs['stream'] = True
+        filter_type = kwargs.pop('filter_type', 'And')
+        report = self._adapter._build_search_report(filters, filter_type, kwargs)
+
+        return AsyncReport(self._swimlane, report)
+
+    async def aggregate(self, *filters, **kwargs):
+        """Compute aggregates of matching records on the server, accepts the same arguments as
+        :meth:`RecordAdapter.aggregate`
+
+        .. versionadded:: 10.20.0
+
+        Returns:
+            :class:`list` of :class:`dict`: One dict per group of group by values and aggregate values
+        """
+        return await self._run('aggregate', *filters, **kwargs)
+
+    async def create(self, **fields):
+        """Create and return a new record in associated app
+
+        Returns:
+            AsyncRecord: Created record instance
+        """
+        return AsyncRecord(self._swimlane, await self._run('create', **fields))
+
+    async def bulk_create(self, *records):
+        """Create and validate multiple records in associated app"""
+        return await self._run('bulk_create', *_unwrap_records(records))
+
+    async def bulk_modify(self, *filters_or_records_or_ids, **kwargs):
+        """Shortcut to bulk modify records, accepts the same arguments as :meth:`RecordAdapter.bulk_modify`"""
+        return await self._run('bulk_modify', *_unwrap_records(filters_or_records_or_ids), **kwargs)
+
+    async def bulk_delete(self, *filters_or_records_or_ids):
+        """Shortcut to bulk delete records, accepts the same arguments as :meth:`RecordAdapter.bulk_delete`"""
+        return await self._run('bulk_delete', *_unwrap_records(filters_or_records_or_ids))
+
+
+class AsyncReportAdapter(_AsyncAdapter):
+    """Async :class:`~swimlane.core.adapters.report.ReportAdapter`"""
+
+    async def list(self):
+        """Retrieve all reports for parent app
+
+        Returns:
+            :class:`list` of :class:`AsyncReport`: List of all returned reports
+        """
+        return [AsyncReport(self._swimlane, report) for report in await self._run('list')]
+
+    async def get(self, report_id):
+        """Retrieve report by ID
+
+        Returns:
+            AsyncReport: Corresponding Report wrapped for async iteration
+        """
+        return AsyncReport(self._swimlane, await self._run('get', report_id))
+
+    def build(self, name, **kwargs):
+        """Build a new local report, accepts the same arguments as :meth:`ReportAdapter.build`
+
+        Returns:
+            AsyncReport: Newly created local Report wrapped for async iteration
+        """
+        return AsyncReport(self._swimlane, self._adapter.build(name, **kwargs))
+
+
+class AsyncReport(object):
+    """Report wrapper supporting `async for` iteration over results
+
+    All other attributes such as filter() and sort() are proxied to the wrapped Report
+
+    Attributes:
+        report (Report): Wrapped Report instance
+    """
+
+    def __init__(self, swimlane, report):
+        self._swimlane = swimlane
+        self.report = report
+
+    def __getattr__(self, item):
+        return getattr(self.report, item)
+
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.report)
+
+    async def __aiter__(self):
+        """Yield records wrapped in AsyncRecord as each page of results is retrieved and parsed on the client thread
+        pool
+
+        Report iteration, including any page prefetching, is stopped when the consumer stops iterating early
+        """
+        iterator = iter(self.report)
+        chunk_size = self.report.page_size or 1000
+
+        try:
+            while True:
+                elements = await self._swimlane._run(lambda: list(itertools.islice(iterator, chunk_size)))
+                for element in elements:
+                    yield _wrap_record(self._swimlane, element)
+
+                if len(elements) < chunk_size:
+                    break
+        finally:
+            await self._swimlane._run(iterator.close)
+
+
+class AsyncGroupAdapter(_AsyncAdapter):
+    """Async :class:`~swimlane.core.adapters.usergroup.GroupAdapter`"""
+
+    async def list(self, limit=None):
+        """Retrieve list of all groups
+
+        Returns:
+            :class:`list` of :class:`~swimlane.core.resources.usergroup.Group`: List of all retrieved groups
+        """
+        return await self._swimlane._run(lambda: list(self._adapter.list(limit=limit)))
+
+    async def get(self, **kwargs):
+        """Retrieve single group by id or name
+
+        Returns:
+            Group: Corresponding Group instance
+        """
+        return await self._run('get', **kwargs)
+
+
+class AsyncUserAdapter(_AsyncAdapter):
+    """Async :class:`~swimlane.core.adapters.usergroup.UserAdapter`"""
+
+    async def list(self, limit=None):
+        """Retrieve list of all users
+
+        Returns:
+            :class:`list` of :class:`~swimlane.core.resources.usergroup.User`: List of all retrieved users
+        """
+        return await self._swimlane._run(lambda: list(self._adapter.list(limit=limit)))
+
+    async def get(self, **kwargs):
+        """Retrieve single user by id or display_name
+
+        Returns:
+            User: Corresponding User instance
+        """
+        return await self._run('get', **kwargs)
+
+
+class AsyncHelperAdapter(_AsyncAdapter):
+    """Async :class:`~swimlane.core.adapters.helper.HelperAdapter`"""
+
+    async def add_record_references(self, app_id, record_id, field_id, target_record_ids):
+        """Bulk operation to directly add record references without making any additional requests"""
+        return await self._run('add_record_references', app_id, record_id, field_id, target_record_ids)
+
+    async def add_comment(self, app_id, record_id, field_id, message, rich_text=False):
+        """Directly add a comment to a record without retrieving the app or record first"""
+        return await self._run('add_comment', app_id, record_id, field_id, message, rich_text=rich_text)
+
+    async def check_bulk_job_status(self, job_id):
+        """Check status of bulk_delete or bulk_modify jobs"""
+        return await self._run('check_bulk_job_status', job_id)
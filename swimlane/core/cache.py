@@ -4,71 +4,273 @@ A ResourcesCache instance is provided on all Swimlane client instances automatic
 
 .. versionadded:: 2.16.2
 """
-import copy
+import collections
 import functools
 import logging
-try:
-    from collections.abc import defaultdict
-except ImportError:
-    from collections import defaultdict
+import threading
 
-from cachetools import LFUCache
+from cachetools import Cache, LFUCache, LRUCache, TTLCache
 
 from swimlane.core.resources.base import APIResource
 
 
 logger = logging.getLogger(__name__)
 
+LFU = 'lfu'
+LRU = 'lru'
+TTL = 'ttl'
+
+
+class _EvictionNotifyingCache(object):
+    """Mixin for cachetools caches calling on_evict(key, value) for each item evicted by size or expiry
+
+    Items removed explicitly with del or pop are not reported
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.on_evict = kwargs.pop('on_evict', None)
+        super(_EvictionNotifyingCache, self).__init__(*args, **kwargs)
+
+    def popitem(self):
+        key, value = super(_EvictionNotifyingCache, self).popitem()
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+        return key, value
+
+
+class _LFUCache(_EvictionNotifyingCache, LFUCache):
+    pass
+
+
+class _LRUCache(_EvictionNotifyingCache, LRUCache):
+    pass
+
+
+def _ttl_expire_returns_items():
+    """Return True if TTLCache.expire returns the expired items, added in cachetools 5.3"""
+    cache = TTLCache(1, 1, timer=lambda: 0)
+    cache['key'] = None
+    return cache.expire(2) is not None
+
+
+_TTL_EXPIRE_RETURNS_ITEMS = _ttl_expire_returns_items()
+
+
+class _TTLCache(_EvictionNotifyingCache, TTLCache):
+
+    def expire(self, time=None):
+        if self.on_evict is None:
+            return super(_TTLCache, self).expire(time)
+
+        if _TTL_EXPIRE_RETURNS_ITEMS:
+            expired = super(_TTLCache, self).expire(time)
+        else:
+            # Find expired items by comparing stored items before and after expiring them
+            stored = {key: Cache.__getitem__(self, key) for key in Cache.__iter__(self)}
+            super(_TTLCache, self).expire(time)
+            expired = [(key, value) for key, value in stored.items() if not Cache.__contains__(self, key)]
+
+        for key, value in expired:
+            self.on_evict(key, value)
+        return expired
+
+
+class CachePolicy(object):
+    """Eviction policy and size of the cache of a single APIResource type
+
+    .. versionadded:: 10.20.0
+
+    Args:
+        policy (str): One of `lfu` evicting least frequently used, `lru` evicting least recently used, or `ttl` evicting
+            least recently used and expiring resources `ttl` seconds after being cached. Available as LFU, LRU, and TTL
+            constants in this module
+        maxsize (int): Maximum number of resources kept in cache. Set 0 to disable caching
+        ttl (float): Seconds resources are kept in cache, required for `ttl` policy
+
+    Raises:
+        ValueError: If policy is unknown, maxsize is negative, or ttl is missing or not positive for `ttl` policy
+
+    Examples:
+
+        ::
+
+            from swimlane import Swimlane
+            from swimlane.core.cache import CachePolicy, LRU, TTL
+
+            swimlane = Swimlane(
+                '192.168.1.1',
+                'username',
+                'password',
+                resource_cache_policies={
+                    'App': CachePolicy(TTL, 50, ttl=600),
+                    'UserGroup': CachePolicy(TTL, 500, ttl=300),
+                    'Record': CachePolicy(LRU, 1000)
+                }
+            )
+    """
+
+    _cache_classes = {
+        LFU: _LFUCache,
+        LRU: _LRUCache,
+        TTL: _TTLCache
+    }
+
+    def __init__(self, policy=LFU, maxsize=0, ttl=None):
+        if policy not in self._cache_classes:
+            raise ValueError('Unknown cache policy "{}", expected one of {}'.format(
+                policy,
+                ', '.join(self._cache_classes)
+            ))
+        if not isinstance(maxsize, int) or maxsize < 0:
+            raise ValueError('maxsize should be a whole number of zero or above')
+        if policy == TTL and (ttl is None or ttl <= 0):
+            raise ValueError('ttl should be a positive number of seconds for ttl policy')
+
+        self.policy = policy
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    def __repr__(self):
+        return '<{}: {} maxsize={}, ttl={}>'.format(self.__class__.__name__, self.policy, self.maxsize, self.ttl)
+
+    def create_cache(self, on_evict=None):
+        """Return a new empty cachetools cache implementing the policy
+
+        Args:
+            on_evict (callable): Called with (key, value) for each item evicted by size or expiry
+        """
+        if self.policy == TTL:
+            return _TTLCache(self.maxsize, self.ttl, on_evict=on_evict)
+        return self._cache_classes[self.policy](self.maxsize, on_evict=on_evict)
+
 
 class ResourcesCache(object):
     """Universal APIResource instance cache
 
     Uses separate caches per APIResource type, and provides mapping between available cache keys and real cache
     primary key automatically
+
+    Cached resources are private snapshots taken when cached, with raw data deep copied once. Each cache hit returns a
+    new lightweight view sharing the snapshot raw data until modified, so changes to provided or returned resources
+    never affect the cache
+
+    Args:
+        per_cache_max_size (int): Maximum size of LFU caches of resource types without a policy. Set 0 to disable
+            caching of resource types without a policy
+        policies (dict): Mapping of APIResource class or class name, such as `App`, `Record`, `User`, `Group`,
+            `UserGroup`, or `AppRevision`, to a :class:`CachePolicy` for resources of that class and its subclasses
+
+    .. versionchanged:: 10.20.0
+        All cache operations are thread-safe, cache policies can be configured per resource type, and cache hits return
+        copy-on-write views of immutable snapshots instead of shallow copies
     """
 
-    def __init__(self, per_cache_max_size):
-        self.__cache_max_size = per_cache_max_size
-        self.__caches = defaultdict(self.__cache_factory)
+    def __init__(self, per_cache_max_size, policies=None):
+        self.__default_policy = CachePolicy(LFU, per_cache_max_size)
+        self.__policies = {}
+        for resource_type, policy in (policies or {}).items():
+            if not isinstance(policy, CachePolicy):
+                raise TypeError('Cache policy for "{}" must be a CachePolicy, got "{!r}" instead'.format(
+                    resource_type,
+                    policy
+                ))
+            name = resource_type if isinstance(resource_type, str) else resource_type.__name__
+            self.__policies[name] = policy
+
+        self.__caches = {}
         self.__cache_index_key_map = {}
+        # Index keys of each cached resource by (resource type, internal key), removed along with the resource
+        self.__resource_index_keys = {}
+        self.__stats = collections.defaultdict(collections.Counter)
+        self.__lock = threading.RLock()
 
-        if self.__cache_max_size == 0:
+        if per_cache_max_size == 0 and not any(policy.maxsize for policy in self.__policies.values()):
             logger.debug('Cache size set to 0, resource caching disabled')
 
     def __len__(self):
         """Return sum of all cache sizes"""
-        return sum(c.currsize for c in self.__caches.values())
+        with self.__lock:
+            return sum(c.currsize for c in self.__caches.values())
 
     def __contains__(self, item):
         """Check if resource is in cache, expects same 3-length tuple key as __getitem__"""
         index_key = get_cache_index_key(item)
-        cache_key = self.__cache_index_key_map.get(index_key)
-        target_cache = self.__caches[index_key[0]]
-        return cache_key in target_cache
+        with self.__lock:
+            cache_key = self.__cache_index_key_map.get(index_key)
+            target_cache = self.__get_cache(index_key[0])
+            return cache_key in target_cache
 
     def __getitem__(self, item):
         """Get cached resource, expects item to be 3-length tuple of (resource class, target key, target value)"""
         key = get_cache_index_key(item)
         cls = key[0]
 
-        # Check if in any fields index
-        cache_internal_key = self.__cache_index_key_map[key]
+        with self.__lock:
+            stats = self.__stats[cls]
 
-        try:
-            # Return copy of cached object
-            return copy.copy(self.__caches[cls][cache_internal_key])
-        except KeyError:
-            # Internal cache miss for target resource, quietly remove from cache key map and let error bubble
-            self.__cache_index_key_map.pop(key, None)
-            raise
+            # Check if in any fields index
+            try:
+                cache_internal_key = self.__cache_index_key_map[key]
+            except KeyError:
+                stats['misses'] += 1
+                raise
+
+            try:
+                # Return copy-on-write view of cached snapshot
+                resource = self.__get_cache(cls)[cache_internal_key]._get_cache_view()
+            except KeyError:
+                # Internal cache miss for target resource, quietly remove from cache key map and let error bubble
+                self.__cache_index_key_map.pop(key, None)
+                stats['misses'] += 1
+                stats['orphans'] += 1
+                raise
+
+            stats['hits'] += 1
+            return resource
 
     def __delitem__(self, resource):
         """Remove resource instance from internal cache"""
-        self.__caches[type(resource)].pop(resource.get_cache_internal_key(), None)
+        with self.__lock:
+            resource_type = type(resource)
+            cache_internal_key = resource.get_cache_internal_key()
+            self.__get_cache(resource_type).pop(cache_internal_key, None)
+            self.__remove_index_keys(resource_type, cache_internal_key)
+
+    def get_policy(self, resource_type):
+        """Return CachePolicy of the closest configured class in the MRO of resource_type, or the default LFU policy
+
+        .. versionadded:: 10.20.0
+        """
+        for cls in resource_type.__mro__:
+            policy = self.__policies.get(cls.__name__)
+            if policy is not None:
+                return policy
+        return self.__default_policy
+
+    def __get_cache(self, resource_type):
+        """Return cache of resource_type, building a new cache from its policy on first use"""
+        try:
+            return self.__caches[resource_type]
+        except KeyError:
+            cache = self.__caches[resource_type] = self.get_policy(resource_type).create_cache(
+                on_evict=functools.partial(self.__on_evict, resource_type)
+            )
+            return cache
 
-    def __cache_factory(self):
-        """Build and return a new cache instance"""
-        return LFUCache(self.__cache_max_size)
+    def __on_evict(self, resource_type, cache_internal_key, resource):
+        """Record eviction of a resource by its cache policy and remove its index keys. Called holding lock"""
+        self.__stats[resource_type]['evictions'] += 1
+        self.__remove_index_keys(resource_type, cache_internal_key)
+
+    def __remove_index_keys(self, resource_type, cache_internal_key, keep=()):
+        """Remove index keys of a resource no longer cached, except keys in keep. Called holding lock
+
+        Index keys since remapped to another resource are left in place
+        """
+        index_keys = self.__resource_index_keys.pop((resource_type, cache_internal_key), ())
+        for index_key in index_keys:
+            if index_key not in keep and self.__cache_index_key_map.get(index_key) == cache_internal_key:
+                del self.__cache_index_key_map[index_key]
 
     def cache(self, resource):
         """Insert a resource instance into appropriate resource cache"""
@@ -76,7 +278,7 @@ class ResourcesCache(object):
             raise TypeError('Cannot cache "{!r}", can only cache APIResource instances'.format(resource))
 
         # Disable inserts to cache when disabled
-        if self.__cache_max_size == 0:
+        if self.get_policy(type(resource)).maxsize == 0:
             return
 
         try:
@@ -89,21 +291,78 @@ class ResourcesCache(object):
         else:
             resource_type = type(resource)
 
-            for key, value in cache_index_keys:
-                self.__cache_index_key_map[(resource_type, key, value)] = cache_internal_key
+            index_keys = frozenset((resource_type, key, value) for key, value in cache_index_keys)
+            # Store a private snapshot unaffected by later changes to the provided resource
+            snapshot = resource._get_cache_snapshot()
+
+            with self.__lock:
+                # Drop index keys of a previous version of the resource no longer matching, such as a renamed App
+                self.__remove_index_keys(resource_type, cache_internal_key, keep=index_keys)
+
+                for index_key in index_keys:
+                    self.__cache_index_key_map[index_key] = cache_internal_key
+                self.__resource_index_keys[(resource_type, cache_internal_key)] = index_keys
 
-            self.__caches[resource_type][cache_internal_key] = resource
+                # May evict other resources, removing their index keys
+                self.__get_cache(resource_type)[cache_internal_key] = snapshot
+                self.__stats[resource_type]['inserts'] += 1
 
             logger.debug('Cached "{!r}"'.format(resource))
 
+    def stats(self, reset=False):
+        """Return snapshot of cache statistics per resource type
+
+        .. versionadded:: 10.20.0
+
+        Args:
+            reset (bool): Reset all counters to 0 after taking the snapshot. Sizes are not affected
+
+        Returns:
+            dict: Mapping of resource class name to a dict of `hits`, `misses`, `inserts`, `evictions` by cache policy,
+                `orphans` found when an index key pointed to a resource no longer cached, current `size`, and number of
+                `index_keys` mapped to cached resources
+
+        Examples:
+
+            ::
+
+                for resource_type, counters in swimlane.resources_cache.stats(reset=True).items():
+                    hit_ratio = counters['hits'] / float(max(counters['hits'] + counters['misses'], 1))
+        """
+        with self.__lock:
+            index_key_counts = collections.Counter(index_key[0] for index_key in self.__cache_index_key_map)
+
+            snapshot = {}
+            for resource_type in set(self.__stats) | set(self.__caches):
+                counters = dict.fromkeys(('hits', 'misses', 'inserts', 'evictions', 'orphans'), 0)
+                counters.update(self.__stats.get(resource_type, {}))
+                cache = self.__caches.get(resource_type)
+                counters['size'] = cache.currsize if cache is not None else 0
+                counters['index_keys'] = index_key_counts[resource_type]
+                snapshot[resource_type.__name__] = counters
+
+            if reset:
+                self.__stats.clear()
+
+            return snapshot
+
     def clear(self, *resource_types):
         """Clear cache for each provided APIResource class, or all resources if no classes are provided"""
-        resource_types = resource_types or tuple(self.__caches.keys())
-
-        for cls in resource_types:
-            # Clear and delete cache instances to guarantee no lingering references
-            self.__caches[cls].clear()
-            del self.__caches[cls]
+        with self.__lock:
+            resource_types = resource_types or tuple(self.__caches.keys())
+
+            for cls in resource_types:
+                # Clear and delete cache instances to guarantee no lingering references
+                cache = self.__caches.pop(cls, None)
+                if cache is not None:
+                    # Clearing is not an eviction
+                    cache.on_evict = None
+                    cache.clear()
+
+                # Include index keys of expired resources not yet purged from TTL caches
+                for resource_type, cache_internal_key in list(self.__resource_index_keys):
+                    if resource_type is cls:
+                        self.__remove_index_keys(cls, cache_internal_key)
 
 
 def get_cache_index_key(resource):
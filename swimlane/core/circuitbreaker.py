@@ -0,0 +1,220 @@
+"""Circuit breaker failing requests fast while a Swimlane server is repeatedly failing
+
+.. versionadded:: 10.20.0
+"""
+import collections
+import threading
+import time
+
+from swimlane.exceptions import SwimlaneCircuitOpenError
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker(object):
+    """Thread-safe circuit breaker tracking failure rate over a sliding window of recent requests
+
+    While `closed`, all requests are sent and their outcomes recorded. Once at least `minimum_calls` outcomes are in
+    the window and the ratio of failures reaches `failure_threshold`, the breaker opens and all requests immediately
+    raise :class:`~swimlane.exceptions.SwimlaneCircuitOpenError` without contacting the server. After
+    `recovery_timeout` seconds the breaker becomes `half_open`, letting up to `half_open_max_calls` concurrent probe
+    requests through. Any failed probe reopens the breaker, while `half_open_max_calls` successful probes close it
+
+    Connection errors, timeouts, and responses with a status code in `failure_statuses` count as failures. All other
+    responses, including client errors, count as successes
+
+    Args:
+        failure_threshold (float): Ratio of failed requests in the window, between 0 and 1, opening the breaker
+        window_size (int): Number of most recent request outcomes considered
+        minimum_calls (int): Minimum number of outcomes in the window before the failure ratio is evaluated
+        recovery_timeout (float): Seconds to stay open before allowing probe requests
+        half_open_max_calls (int): Number of probe requests allowed while half-open, and successes required to close
+        failure_statuses (iterable(int)): Response status codes counted as failures. Defaults to all 5xx codes
+        on_state_change (callable): Called with (breaker, old_state, new_state) after each state change
+
+    Attributes:
+        state (str): Current state, one of `closed`, `open`, or `half_open`, available as CLOSED, OPEN, and HALF_OPEN
+            constants in this module
+
+    Raises:
+        ValueError: If any argument is out of range
+
+    Examples:
+
+        ::
+
+            from swimlane import Swimlane
+            from swimlane.core.circuitbreaker import CircuitBreaker
+
+            def log_state(breaker, old_state, new_state):
+                print('Circuit breaker {} -> {}'.format(old_state, new_state))
+
+            swimlane = Swimlane(
+                '192.168.1.1',
+                'username',
+                'password',
+                circuit_breaker=CircuitBreaker(failure_threshold=0.5, recovery_timeout=60, on_state_change=log_state)
+            )
+    """
+
+    default_failure_statuses = frozenset(range(500, 600))
+
+    def __init__(
+            self,
+            failure_threshold=0.5,
+            window_size=20,
+            minimum_calls=10,
+            recovery_timeout=30.0,
+            half_open_max_calls=3,
+            failure_statuses=default_failure_statuses,
+            on_state_change=None
+    ):
+        if not 0 < failure_threshold <= 1:
+            raise ValueError('failure_threshold should be greater than 0 and at most 1')
+        for name, value in (
+                ('window_size', window_size),
+                ('minimum_calls', minimum_calls),
+                ('half_open_max_calls', half_open_max_calls)
+        ):
+            if not isinstance(value, int) or value <= 0:
+                raise ValueError('{} should be a positive integer'.format(name))
+        if minimum_calls > window_size:
+            raise ValueError('minimum_calls should not be greater than window_size')
+        if recovery_timeout < 0:
+            raise ValueError('recovery_timeout should not be negative')
+
+        self.failure_threshold = failure_threshold
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_statuses = frozenset(failure_statuses)
+        self.on_state_change = on_state_change
+
+        self.__lock = threading.Lock()
+        self.__state = CLOSED
+        # Incremented on every state change to ignore outcomes of requests admitted in a previous state
+        self.__generation = 0
+        self.__outcomes = collections.deque(maxlen=window_size)
+        self.__opened_at = None
+        self.__probes_in_flight = 0
+        self.__probe_successes = 0
+
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.state)
+
+    @property
+    def state(self):
+        """Current breaker state, moving from open to half-open once the recovery timeout has elapsed"""
+        with self.__lock:
+            transition = self.__check_recovery()
+            state = self.__state
+        self.__notify(transition)
+        return state
+
+    @property
+    def failure_rate(self):
+        """Ratio of failures among outcomes currently in the window, or 0.0 when the window is empty"""
+        with self.__lock:
+            if not self.__outcomes:
+                return 0.0
+            return sum(self.__outcomes) / float(len(self.__outcomes))
+
+    def before_request(self):
+        """Admit a request, returning a token to pass to record_result after the request completes
+
+        Returns:
+            int: Admission token
+
+        Raises:
+            swimlane.exceptions.SwimlaneCircuitOpenError: If breaker is open, or half-open with all probes in flight
+        """
+        with self.__lock:
+            transition = self.__check_recovery()
+
+            if self.__state == OPEN:
+                retry_after = max(self.__opened_at + self.recovery_timeout - time.monotonic(), 0)
+            elif self.__state == HALF_OPEN and self.__probes_in_flight >= self.half_open_max_calls:
+                retry_after = 0
+            else:
+                retry_after = None
+                if self.__state == HALF_OPEN:
+                    self.__probes_in_flight += 1
+                token = self.__generation
+
+        self.__notify(transition)
+
+        if retry_after is not None:
+            raise SwimlaneCircuitOpenError(self, retry_after)
+
+        return token
+
+    def record_result(self, token, failed):
+        """Record outcome of a request admitted by before_request
+
+        Args:
+            token (int): Token returned by before_request
+            failed (bool): True on server failure, False on success, or None to release the request without recording
+                an outcome
+        """
+        transition = None
+
+        with self.__lock:
+            if token != self.__generation:
+                return
+
+            if self.__state == HALF_OPEN:
+                self.__probes_in_flight -= 1
+                if failed:
+                    transition = self.__transition(OPEN)
+                elif failed is not None:
+                    self.__probe_successes += 1
+                    if self.__probe_successes >= self.half_open_max_calls:
+                        transition = self.__transition(CLOSED)
+
+            elif self.__state == CLOSED and failed is not None:
+                self.__outcomes.append(bool(failed))
+                if (
+                        len(self.__outcomes) >= self.minimum_calls
+                        and sum(self.__outcomes) >= self.failure_threshold * len(self.__outcomes)
+                ):
+                    transition = self.__transition(OPEN)
+
+        self.__notify(transition)
+
+    def is_failure(self, response):
+        """Return True if response status code counts as a failure"""
+        return response.status_code in self.failure_statuses
+
+    def reset(self):
+        """Close breaker and clear recorded outcomes"""
+        with self.__lock:
+            transition = self.__transition(CLOSED) if self.__state != CLOSED else None
+            self.__outcomes.clear()
+        self.__notify(transition)
+
+    def __check_recovery(self):
+        """Move from open to half-open once recovery timeout has elapsed. Must be called holding lock"""
+        if self.__state == OPEN and time.monotonic() - self.__opened_at >= self.recovery_timeout:
+            return self.__transition(HALF_OPEN)
+        return None
+
+    def __transition(self, state):
+        """Change state, returning (old_state, new_state) to pass to __notify. Must be called holding lock"""
+        old_state = self.__state
+
+        self.__state = state
+        self.__generation += 1
+        self.__outcomes.clear()
+        self.__probes_in_flight = 0
+        self.__probe_successes = 0
+        self.__opened_at = time.monotonic() if state == OPEN else None
+
+        return old_state, state
+
+    def __notify(self, transition):
+        """Call on_state_change outside of lock for a transition returned by __transition"""
+        if transition is not None and self.on_state_change is not None:
+            self.on_state_change(self, *transition)
@@ -1,25 +1,35 @@
 """Core Swimlane client class"""
 
+import collections
+import contextlib
+import gzip
 import logging
+import threading
+import weakref
+import zlib
 
 import jwt
 import pendulum
 import requests
 import time
 from pyuri import URI
-from requests.compat import json
 from requests.packages import urllib3
 from requests.structures import CaseInsensitiveDict
 from requests.exceptions import ConnectionError
 from six.moves.urllib.parse import urljoin
 
 from swimlane.core.adapters import GroupAdapter, UserAdapter, AppAdapter, HelperAdapter
+from swimlane.core.appstore import AppStore
 from swimlane.core.cache import ResourcesCache
+from swimlane.core.circuitbreaker import CircuitBreaker
+from swimlane.core.jsonbackend import get_json_backend
 from swimlane.core.resolver import SwimlaneResolver
+from swimlane.core.ratelimit import ENDPOINT_CLASSES, RateLimit, get_endpoint_class
 from swimlane.core.resources.usergroup import User
-from swimlane.exceptions import SwimlaneHTTP400Error, InvalidSwimlaneProductVersion
+from swimlane.core.retry import RetryPolicy
+from swimlane.exceptions import SwimlaneCircuitOpenError, SwimlaneHTTP400Error, InvalidSwimlaneProductVersion
 from swimlane.utils.version import get_package_version, compare_versions
-from swimlane.core.wrappedsession import WrappedSession
+from swimlane.core.wrappedsession import JsonHTTPAdapter, WrappedSession
 
 # Disable insecure request warnings
 urllib3.disable_warnings()
@@ -30,6 +40,36 @@ logger = logging.getLogger(__name__)
 _lib_full_version = get_package_version()
 _lib_major_version, _lib_minor_version = _lib_full_version.split('.')[0:2]
 
+# Request body compression functions by Content-Encoding
+_compressors = {
+    'gzip': lambda data: gzip.compress(data, compresslevel=6),
+    'deflate': lambda data: zlib.compress(data, 6)
+}
+
+
+def _release_when_consumed(response, release):
+    """Call release once the body of a streamed response has been consumed, or the response closed or garbage collected
+    """
+    iter_content = response.iter_content
+    close = response.close
+
+    def iter_content_releasing(*args, **kwargs):
+        try:
+            for chunk in iter_content(*args, **kwargs):
+                yield chunk
+        finally:
+            release()
+
+    def close_releasing():
+        try:
+            close()
+        finally:
+            release()
+
+    response.iter_content = iter_content_releasing
+    response.close = close_releasing
+    weakref.finalize(response, release)
+
 
 class Swimlane(object):
     """Swimlane API client
@@ -45,12 +85,50 @@ class Swimlane(object):
         verify_server_version (bool): Verify server version has same major version as client package. May require
             additional requests, set False to disable check
         resource_cache_size (int): Maximum number of each resource type to keep in memory cache. Set 0 to disable
-            caching. Disabled by default
+            caching. Disabled by default. Used as the LFU cache size of resource types without a cache policy
+        resource_cache_policies (dict): Mapping of resource class name (`App`, `Record`, `User`, `Group`,
+            `UserGroup`, `AppRevision`, ...) to a :class:`~swimlane.core.cache.CachePolicy` selecting LRU, LFU, or TTL
+            eviction, cache size, and expiry for that resource type
+        app_store (str|AppStore): :class:`~swimlane.core.appstore.AppStore`, or path of its database file, persisting
+            app definitions and app revisions between processes. Stored apps are only downloaded again when modified
+            on the server. Disabled by default
+        app_index_refresh_interval (float): Seconds after which the directory of app ids, names, and acronyms used to
+            find apps is refreshed in the background. Set None to only refresh it when an app is not found. Defaults to
+            300
+        reference_batch_size (int): Maximum number of concurrent requests retrieving records referenced by a reference
+            field as it is iterated. Set 1 to retrieve referenced records one at a time without threads. Defaults to 10
         access_token (str): Authentication token, used in lieu of a username and password
         write_to_read_only (bool): Enable the ability to write to Read-only fields
-        retry (bool): Retry request when error code is >= 500
-        max_retries (int): Maximum number of retry attempts
-        retry_interval (int): Time interval (in seconds) between two retry attempts
+        retry (bool): Retry failed requests according to the retry policy
+        max_retries (int): Maximum number of retry attempts, used when no retry_policy is provided
+        retry_interval (int): Maximum delay (in seconds) before the first retry attempt, doubling for each following
+            attempt. Used when no retry_policy is provided
+        retry_policy (RetryPolicy): :class:`~swimlane.core.retry.RetryPolicy` controlling backoff, jitter, deadline,
+            Retry-After handling, and retryable methods and status codes. Defaults to a policy retrying 429 and 5xx
+            responses for all methods and connection errors for idempotent methods
+        pool_connections (int): Number of per-host connection pools to keep. Defaults to 10
+        pool_maxsize (int): Maximum number of connections to keep open per host. Set to at least the number of threads
+            sharing the client to avoid reopening connections. Defaults to 10
+        pool_block (bool): Wait for a pooled connection to be released instead of opening a new connection when all
+            pooled connections are in use. Defaults to False
+        keep_alive (bool): Reuse connections between requests. Disable to close each connection after its request.
+            Defaults to True
+        rate_limit (RateLimit): :class:`~swimlane.core.ratelimit.RateLimit` applied to all requests sent by the client
+        endpoint_rate_limits (dict): Mapping of endpoint class (`search`, `record_write`, or `attachment`, available as
+            constants in :mod:`swimlane.core.ratelimit`) to a RateLimit applied to requests of that class in addition to
+            `rate_limit`. Limits of streamed requests, such as attachment downloads, are held until the response body is
+            consumed or the response is closed
+        circuit_breaker (CircuitBreaker): :class:`~swimlane.core.circuitbreaker.CircuitBreaker` failing requests fast
+            with :class:`~swimlane.exceptions.SwimlaneCircuitOpenError` while the server is repeatedly failing. Can be
+            shared between clients connected to the same server. Disabled by default
+        json_backend (str|JsonBackend): JSON library used to encode request payloads and decode responses, one of
+            `orjson`, `ujson`, or `json`. Defaults to the fastest installed library
+        json_sort_keys (bool): Sort keys of encoded request payloads. Not required by the server. Defaults to False
+        compression (str): Compress request bodies of at least `compression_min_size` bytes with `gzip` or `deflate`.
+            Defaults to None, sending uncompressed bodies
+        compression_min_size (int): Minimum request body size in bytes to compress. Defaults to 1024
+        compressed_responses (bool): Request compressed response bodies with an Accept-Encoding header, decompressed
+            transparently. Disable to request uncompressed responses. Defaults to True
 
     Attributes:
         host (pyuri.URI): Full RFC-1738 URL pointing to Swimlane host
@@ -60,6 +138,8 @@ class Swimlane(object):
         groups (GroupAdapter): :class:`~swimlane.core.adapters.usergroup.GroupAdapter` configured for current
             Swimlane instance
         resources_cache (ResourcesCache): Cache checked by all supported adapters for current Swimlane instance
+        app_store (AppStore): Persistent store of app definitions and app revisions, or None when disabled
+        reference_batch_size (int): Maximum number of concurrent requests retrieving referenced records
 
     Examples:
 
@@ -105,8 +185,25 @@ class Swimlane(object):
             retry: bool=True,
             max_retries: int=5,
             retry_interval: int=5,
+            retry_policy: RetryPolicy=None,
             headers=None,
-            proxies=None
+            proxies=None,
+            pool_connections: int=10,
+            pool_maxsize: int=10,
+            pool_block: bool=False,
+            keep_alive: bool=True,
+            rate_limit: RateLimit=None,
+            endpoint_rate_limits: dict=None,
+            circuit_breaker: CircuitBreaker=None,
+            json_backend: str=None,
+            json_sort_keys: bool=False,
+            compression: str=None,
+            compression_min_size: int=1024,
+            compressed_responses: bool=True,
+            resource_cache_policies: dict=None,
+            app_store: AppStore=None,
+            app_index_refresh_interval: float=300,
+            reference_batch_size: int=10
     ):
         self.__verify_auth_params(username, password, access_token)
 
@@ -114,19 +211,55 @@ class Swimlane(object):
         self.host.scheme = (self.host.scheme or 'https').lower()
         self.host.path = None
 
-        self.resources_cache = ResourcesCache(resource_cache_size)
+        self.resources_cache = ResourcesCache(resource_cache_size, resource_cache_policies)
+        self.app_store = AppStore(app_store) if isinstance(app_store, str) else app_store
 
         self.__settings = None
         self.__user = None
 
         self._write_to_read_only = write_to_read_only
 
+        if not isinstance(reference_batch_size, int) or reference_batch_size <= 0:
+            raise ValueError('reference_batch_size should be a positive integer')
+        self.reference_batch_size = reference_batch_size
+
         self._default_timeout = default_timeout
 
+        self._json_backend = get_json_backend(json_backend)
+        self._json_sort_keys = json_sort_keys
+
+        if compression is not None and compression not in _compressors:
+            raise ValueError('compression should be one of {}, or None'.format(', '.join(_compressors)))
+        if not isinstance(compression_min_size, int) or compression_min_size < 0:
+            raise ValueError('compression_min_size should be a whole number of zero or above')
+        self._compression = compression
+        self._compression_min_size = compression_min_size
+        self.__transfer_stats = collections.Counter()
+        self.__transfer_stats_lock = threading.Lock()
+
         self._session = WrappedSession()
         self._session.verify = verify_ssl
         self._session.headers.update(headers or {})
         self._session.proxies.update(proxies or {})
+
+        if not isinstance(pool_connections, int) or pool_connections <= 0:
+            raise ValueError('pool_connections should be a positive integer')
+        if not isinstance(pool_maxsize, int) or pool_maxsize <= 0:
+            raise ValueError('pool_maxsize should be a positive integer')
+
+        self._http_adapter = JsonHTTPAdapter(
+            json_backend=self._json_backend,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self._session.mount('https://', self._http_adapter)
+        self._session.mount('http://', self._http_adapter)
+        if not keep_alive:
+            self._session.headers['Connection'] = 'close'
+        if not compressed_responses:
+            # Sessions otherwise accept gzip and deflate encoded responses
+            self._session.headers['Accept-Encoding'] = 'identity'
         if self.host.scheme == 'http':
             # Disable SSL verification for HTTP connections
             self._session.verify = False
@@ -137,6 +270,21 @@ class Swimlane(object):
         self.retry = retry
         self.max_retries = max_retries
         self.retry_interval = retry_interval
+        self.retry_policy = retry_policy
+
+        endpoint_rate_limits = dict(endpoint_rate_limits or {})
+        for endpoint_class in endpoint_rate_limits:
+            if endpoint_class not in ENDPOINT_CLASSES:
+                raise ValueError('Unknown endpoint class "{}", expected one of {}'.format(
+                    endpoint_class,
+                    ', '.join(ENDPOINT_CLASSES)
+                ))
+        self.rate_limit = rate_limit
+        self.endpoint_rate_limits = endpoint_rate_limits
+        self.__admitted = threading.local()
+
+        self.circuit_breaker = circuit_breaker
+        self.__breaker_admitted = threading.local()
 
         if username is not None and password is not None:
             self._session.auth = SwimlaneJwtAuth(
@@ -150,7 +298,7 @@ class Swimlane(object):
                 access_token
             )
 
-        self.apps = AppAdapter(self)
+        self.apps = AppAdapter(self, app_index_refresh_interval)
         self.users = UserAdapter(self)
         self.groups = GroupAdapter(self)
         self.helpers = HelperAdapter(self)
@@ -210,11 +358,20 @@ class Swimlane(object):
             api_endpoint (str): Portion of URL matching API endpoint route as listed in platform /docs help page
             **kwargs (dict): Remaining arguments passed through to actual request call
 
+        Keyword Args:
+            retry (bool): Override client retry setting for this request
+            max_retries (int): Override retry policy max retries for this request
+            retry_interval (int): Override retry policy initial backoff for this request
+            retry_policy (RetryPolicy): Override client retry policy for this request
+            compression (str): Override client request body compression for this request, `gzip`, `deflate`, or False
+
         Notes:
             All other provided kwargs are passed to underlying ``requests.Session.request()`` call
 
         Raises:
             swimlane.exceptions.SwimlaneHTTP400Error: On 400 responses with additional context about the exception
+            swimlane.exceptions.SwimlaneCircuitOpenError: When the client circuit breaker is open
+            requests.ConnectionError: Retryable failures when all retries or the retry deadline are exhausted
             requests.HTTPError: Any other 4xx/5xx HTTP responses
 
         Returns:
@@ -240,45 +397,253 @@ class Swimlane(object):
             headers.setdefault('Content-Type', 'application/json')
             kwargs['headers'] = headers
 
-            kwargs['data'] = json.dumps(json_data, sort_keys=True, separators=(',', ':'))
-        
-        # Retry logic
-        req_retry = kwargs.pop('retry', self.retry)
-        
-        req_max_retries = kwargs.pop('max_retries', self.max_retries)
-        if not isinstance(req_max_retries, int):
-            raise TypeError('max_retries should be an integer')
-        if req_max_retries <= 0:
-            raise ValueError('max_retries should be a positive integer')
-        
-        req_retry_interval = kwargs.pop('retry_interval', self.retry_interval)
-        if not isinstance(req_retry_interval, int):
-            raise TypeError('retry_interval should be an integer')
-        if req_retry_interval <= 0:
-            raise ValueError('retry_interval should be a positive integer')
-        
-        while not req_max_retries<0:
-            response = self._session.request(method, urljoin(str(self.host) + self._api_root, api_endpoint), **kwargs)
-
-            # Roll 400 errors up into SwimlaneHTTP400Errors with specific Swimlane error code support
+            kwargs['data'] = self._json_backend.dumps(json_data, sort_keys=self._json_sort_keys)
+
+        request_bytes, request_bytes_sent = self.__compress_body(kwargs)
+
+        retry_policy = self.__get_retry_policy(kwargs)
+        url = urljoin(str(self.host) + self._api_root, api_endpoint)
+
+        start = time.monotonic()
+        attempt = 0
+
+        while True:
             try:
-                response.raise_for_status()
-                # Exit loop on successful request
-                req_max_retries = -1 
-            except requests.HTTPError as error:
-                if error.response.status_code == 400:
-                    raise SwimlaneHTTP400Error(error)
-                else:
-                    if req_retry and req_max_retries>0 and error.response.status_code>=500:
-                        req_max_retries -= 1
-                        time.sleep(req_retry_interval)
-                        continue
-                    elif req_max_retries == 0:
+                response = self.__send(method, api_endpoint, url, kwargs)
+            except SwimlaneCircuitOpenError:
+                # Fail fast instead of retrying while the circuit breaker is open
+                raise
+            except (requests.ConnectionError, requests.Timeout) as error:
+                if retry_policy is None or not retry_policy.is_retryable(method, error=error):
+                    raise
+                delay = retry_policy.get_delay(attempt, time.monotonic() - start)
+                if delay is None:
+                    raise
+            else:
+                # Roll 400 errors up into SwimlaneHTTP400Errors with specific Swimlane error code support
+                try:
+                    response.raise_for_status()
+                    # Exit loop on successful request
+                    break
+                except requests.HTTPError as error:
+                    if error.response.status_code == 400:
+                        raise SwimlaneHTTP400Error(error)
+                    if retry_policy is None or not retry_policy.is_retryable(method, response=error.response):
+                        raise error
+                    delay = retry_policy.get_delay(attempt, time.monotonic() - start, response=error.response)
+                    if delay is None:
+                        if attempt == 0:
+                            raise error
                         raise ConnectionError(f'Max retries exceeded. Caused by ({error})')
-                    raise error
+
+            logger.debug('Retrying {} {} in {:.2f} seconds (retry {})'.format(method, url, delay, attempt + 1))
+            time.sleep(delay)
+            attempt += 1
+
+        self.__record_transfer(response, request_bytes, request_bytes_sent, kwargs.get('stream', False))
 
         return response
 
+    def __compress_body(self, kwargs):
+        """Pop per-request compression argument from kwargs and compress request body in place when large enough
+
+        Only bytes or str bodies are compressed, form data and file uploads are sent as is
+
+        Returns:
+            tuple(int, int): Request body size before and after compression
+        """
+        compression = kwargs.pop('compression', self._compression)
+        data = kwargs.get('data')
+
+        if not isinstance(data, (bytes, str)):
+            return 0, 0
+
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        request_bytes = len(data)
+
+        if not compression or request_bytes < self._compression_min_size:
+            return request_bytes, request_bytes
+
+        try:
+            compress = _compressors[compression]
+        except KeyError:
+            raise ValueError('compression should be one of {}, or False'.format(', '.join(_compressors)))
+
+        headers = CaseInsensitiveDict(kwargs.get('headers', {}))
+        headers['Content-Encoding'] = compression
+        kwargs['headers'] = headers
+        kwargs['data'] = compress(data)
+
+        return request_bytes, len(kwargs['data'])
+
+    def __record_transfer(self, response, request_bytes, request_bytes_sent, stream):
+        """Attach byte counters to a successful response and add them to client transfer_stats"""
+        response_bytes = response_bytes_received = 0
+        if isinstance(response, requests.Response) and not stream:
+            response_bytes = len(response.content or b'')
+            response_bytes_received = response.raw.tell() if response.raw is not None else response_bytes
+
+        transfer_stats = {
+            'requests': 1,
+            'request_bytes': request_bytes,
+            'request_bytes_sent': request_bytes_sent,
+            'response_bytes': response_bytes,
+            'response_bytes_received': response_bytes_received
+        }
+        response.transfer_stats = transfer_stats
+
+        with self.__transfer_stats_lock:
+            self.__transfer_stats.update(transfer_stats)
+
+    def __send(self, method, api_endpoint, url, kwargs):
+        """Send a single request attempt through the circuit breaker and rate limits
+
+        Requests sent while the current thread is already sending a request, such as authentication, bypass the circuit
+        breaker to avoid taking additional half-open probes. Their failures are reflected in the outer request outcome
+        """
+        breaker = self.circuit_breaker
+        if breaker is None or getattr(self.__breaker_admitted, 'value', False):
+            return self.__send_admitted(method, api_endpoint, url, kwargs)
+
+        token = breaker.before_request()
+        failed = None
+        self.__breaker_admitted.value = True
+        try:
+            response = self.__send_admitted(method, api_endpoint, url, kwargs)
+            failed = breaker.is_failure(response)
+            return response
+        except (requests.ConnectionError, requests.Timeout):
+            failed = True
+            raise
+        finally:
+            self.__breaker_admitted.value = False
+            breaker.record_result(token, failed)
+
+    def __send_admitted(self, method, api_endpoint, url, kwargs):
+        """Send a single request attempt holding rate limits
+
+        Limits of successful streamed responses are held until the response body is consumed or the response is
+        closed, so `max_in_flight` also bounds concurrent body downloads
+        """
+        with self.__admit(method, api_endpoint) as limits:
+            response = self._session.request(method, url, **kwargs)
+            if kwargs.get('stream', False) and isinstance(response, requests.Response) and response.ok:
+                _release_when_consumed(response, limits.pop_all().close)
+
+        return response
+
+    @contextlib.contextmanager
+    def __admit(self, method, api_endpoint):
+        """Hold endpoint class and client rate limits while sending a request
+
+        Requests sent while the current thread already holds limits, such as authentication during another request, are
+        admitted immediately to avoid deadlocks
+
+        Yields:
+            contextlib.ExitStack: Stack releasing held limits on exit. Use pop_all() to keep holding them afterwards
+        """
+        limits = []
+        if not getattr(self.__admitted, 'value', False):
+            endpoint_limit = self.endpoint_rate_limits.get(get_endpoint_class(method, api_endpoint))
+            limits = [limit for limit in (endpoint_limit, self.rate_limit) if limit is not None]
+
+        with contextlib.ExitStack() as stack:
+            for limit in limits:
+                stack.enter_context(limit)
+
+            if not limits:
+                yield stack
+                return
+
+            self.__admitted.value = True
+            try:
+                yield stack
+            finally:
+                self.__admitted.value = False
+
+    def __get_retry_policy(self, kwargs):
+        """Pop per-request retry arguments from kwargs and return the RetryPolicy to use, or None to disable retries"""
+        req_retry = kwargs.pop('retry', self.retry)
+        retry_policy = kwargs.pop('retry_policy', self.retry_policy)
+
+        overrides = {}
+
+        if 'max_retries' in kwargs or retry_policy is None:
+            req_max_retries = kwargs.pop('max_retries', self.max_retries)
+            if not isinstance(req_max_retries, int):
+                raise TypeError('max_retries should be an integer')
+            if req_max_retries <= 0:
+                raise ValueError('max_retries should be a positive integer')
+            overrides['max_retries'] = req_max_retries
+
+        if 'retry_interval' in kwargs or retry_policy is None:
+            req_retry_interval = kwargs.pop('retry_interval', self.retry_interval)
+            if not isinstance(req_retry_interval, int):
+                raise TypeError('retry_interval should be an integer')
+            if req_retry_interval <= 0:
+                raise ValueError('retry_interval should be a positive integer')
+            overrides['backoff_base'] = req_retry_interval
+
+        if not req_retry:
+            return None
+
+        if retry_policy is None:
+            return RetryPolicy(**overrides)
+
+        return retry_policy.replace(**overrides) if overrides else retry_policy
+
+    @property
+    def pool_stats(self):
+        """Connection pool statistics summed across all per-host pools
+
+        .. versionadded:: 10.20.0
+
+        Returns:
+            dict: Number of `pools`, `requests` sent, `new_connections` opened, and `reused_connections`. Many new
+                connections relative to requests indicates pool_maxsize is too small for the number of threads
+        """
+        pools = self._http_adapter.poolmanager.pools
+        stats = {
+            'pools': 0,
+            'requests': 0,
+            'new_connections': 0,
+            'reused_connections': 0
+        }
+
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats['pools'] += 1
+            stats['requests'] += pool.num_requests
+            stats['new_connections'] += pool.num_connections
+
+        stats['reused_connections'] = max(stats['requests'] - stats['new_connections'], 0)
+
+        return stats
+
+    @property
+    def transfer_stats(self):
+        """Request and response body byte counts summed across all successful requests
+
+        Counts of each individual request are available on its response as `response.transfer_stats`
+
+        .. versionadded:: 10.20.0
+
+        Returns:
+            dict: Number of `requests`, `request_bytes` before compression, `request_bytes_sent` after compression,
+                `response_bytes` after decompression, and `response_bytes_received` before decompression. Response
+                bytes of streamed responses are not counted
+        """
+        stats = dict.fromkeys(
+            ('requests', 'request_bytes', 'request_bytes_sent', 'response_bytes', 'response_bytes_received'),
+            0
+        )
+        with self.__transfer_stats_lock:
+            stats.update(self.__transfer_stats)
+        return stats
+
     @property
     def settings(self):
         """Retrieve and cache settings from server"""
@@ -343,6 +708,7 @@ class SwimlaneTokenAuth(SwimlaneResolver):
 
         self._access_token = access_token
         self.user = None
+        self._lock = threading.Lock()
     
     def __call__(self, request):
         """Attach necessary headers to all requests"""
@@ -358,18 +724,20 @@ class SwimlaneTokenAuth(SwimlaneResolver):
         if self.user is not None:
             return request
 
-        # Temporarily remove auth from Swimlane session for auth request to avoid recursive loop during the request
-        self._swimlane._session.auth = None
-        resp = self._swimlane.request(
-            'get',
-            'user/authorize',
-            headers=headers
-        )
-        self._swimlane._session.auth = self
-        
-        json_content = resp.json()
-        self.user = User(self._swimlane, _user_raw_from_login_content(json_content))
-        
+        with self._lock:
+            # Another thread may have retrieved the user while waiting on lock
+            if self.user is None:
+                # Bypass session auth for auth request to avoid recursive loop during the request
+                resp = self._swimlane.request(
+                    'get',
+                    'user/authorize',
+                    headers=headers,
+                    auth=_no_auth
+                )
+
+                json_content = resp.json()
+                self.user = User(self._swimlane, _user_raw_from_login_content(json_content))
+
         return request
 
 
@@ -387,6 +755,7 @@ class SwimlaneJwtAuth(SwimlaneResolver):
         self.user = None
         self._login_headers = {}
         self._token_expiration = pendulum.now()
+        self._lock = threading.Lock()
 
     def __call__(self, request):
         """Attach necessary headers to all requests
@@ -395,18 +764,24 @@ class SwimlaneJwtAuth(SwimlaneResolver):
         """
 
         # Refresh token if it expires soon
-        if pendulum.now() + self._token_expiration_buffer >= self._token_expiration:
-            self.authenticate()
+        if self._expires_soon():
+            with self._lock:
+                # Only the first thread to acquire the lock logs in, others use its new token
+                if self._expires_soon():
+                    self.authenticate()
 
         request.headers.update(self._login_headers)
 
         return request
 
+    def _expires_soon(self):
+        """Check if current token is expired or within the expiration buffer"""
+        return pendulum.now() + self._token_expiration_buffer >= self._token_expiration
+
     def authenticate(self):
         """Send login request and update User instance, login headers, and token expiration"""
 
-        # Temporarily remove auth from Swimlane session for auth request to avoid recursive loop during login request
-        self._swimlane._session.auth = None
+        # Bypass session auth for login request to avoid recursive loop during login request
         resp = self._swimlane.request(
             'post',
             'user/login',
@@ -414,8 +789,8 @@ class SwimlaneJwtAuth(SwimlaneResolver):
                 'userName': self._username,
                 'password': self._password
             },
+            auth=_no_auth
         )
-        self._swimlane._session.auth = self
 
         # Get JWT from response content
         json_content = resp.json()
@@ -434,9 +809,15 @@ class SwimlaneJwtAuth(SwimlaneResolver):
 
         self._login_headers = headers
         self.user = user
+        # Set last, threads checking expiration without the lock must see the new headers
         self._token_expiration = token_expiration
 
 
+def _no_auth(request):
+    """Request auth callable overriding session auth for auth requests without modifying shared session state"""
+    return request
+
+
 def _user_raw_from_login_content(login_content):
     """Returns a User instance with appropriate raw data parsed from login response content"""
     matching_keys = [
@@ -1,4 +1,7 @@
 import itertools
+import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 
 class Cursor(object):
@@ -25,21 +28,33 @@ class Cursor(object):
 
 
 class PaginatedCursor(Cursor):
-    """Handle paginated lists, exposes hooks to simplify retrieval and parsing of paginated data"""
+    """Handle paginated lists, exposes hooks to simplify retrieval and parsing of paginated data
+
+    .. versionchanged:: 10.20.0
+        Added `prefetch` option to keep multiple page requests in flight while iterating
+
+    .. versionchanged:: 10.20.0
+        Added `stream` option to yield elements without retaining them on the cursor
+    """
 
     default_limit = 0
     default_page_size = 10
     default_page_start = None
     default_page_end = None
+    default_prefetch = 0
+    default_stream = False
 
     def __init__(self, limit=default_limit, page_size=default_page_size,
-                 page_start=default_page_start, page_end=default_page_end):
+                 page_start=default_page_start, page_end=default_page_end, prefetch=default_prefetch,
+                 stream=default_stream):
         super(PaginatedCursor, self).__init__()
 
         self.__limit = limit
         self.page_size = page_size
         self.page_start = page_start
         self.page_end = page_end
+        self.prefetch = prefetch
+        self.stream = stream
 
         if self.__limit:
             self.page_size = min(self.page_size, self.__limit)
@@ -56,41 +71,99 @@ class PaginatedCursor(Cursor):
         if (self.page_start or self.page_end) and self.__limit != 0:
             raise ValueError(' page_start or page_end param is applicable only when limit is 0')
 
+        if not isinstance(self.prefetch, int) or self.prefetch < 0:
+            raise ValueError('prefetch should be a whole number of zero or above')
+
+    def __len__(self):
+        """Streaming cursors do not retain results, so length cannot be determined without retrieving them again"""
+        if self.stream:
+            raise TypeError('len() is not supported by streaming cursors')
+
+        return super(PaginatedCursor, self).__len__()
+
     def _evaluate(self):
-        """Lazily retrieve and paginate report results and build Record instances from returned data"""
+        """Lazily retrieve and paginate report results and build Record instances from returned data
+
+        Parsed elements are cached on the cursor unless streaming, in which case each iteration retrieves results again
+        and only a single page of data is held in memory at a time
+        """
         if self._elements:
             for element in self._elements:
                 yield element
         else:
-            # Determine pagination range based on parameters
-            if self.page_start and self.page_end:
-                page_range = range(self.page_start-1, self.page_end)
-            elif self.page_start:
-                page_range = itertools.count(self.page_start-1)
-            elif self.page_end:
-                page_range = range(0, self.page_end)
-            else:
-                page_range = itertools.count()
+            count = 0
 
-            for page in page_range:
-                raw_elements = self._retrieve_raw_elements(page)
+            for raw_elements in self._iter_raw_pages(self._get_page_range()):
 
                 for raw_element in raw_elements:
                     element = self._parse_raw_element(raw_element)
-                    self._elements.append(element)
+                    if not self.stream:
+                        self._elements.append(element)
+                    count += 1
                     yield element
 
-                    if self.__limit and len(self._elements) >= self.__limit:
+                    if self.__limit and count >= self.__limit:
                         break
 
                 # Break conditions for ending pagination
                 if any([
                     len(raw_elements) < self.page_size,
-                    self.__limit and len(self._elements) >= self.__limit,
+                    self.__limit and count >= self.__limit,
                     self.page_size == 0
                 ]):
                     break
 
+    def _get_page_range(self):
+        """Determine pagination range based on parameters"""
+        if self.page_start and self.page_end:
+            page_range = range(self.page_start-1, self.page_end)
+        elif self.page_start:
+            page_range = itertools.count(self.page_start-1)
+        elif self.page_end:
+            page_range = range(0, self.page_end)
+        else:
+            page_range = itertools.count()
+
+        # Never request pages beyond the one that can satisfy the limit
+        if self.__limit and self.page_size:
+            page_range = itertools.islice(page_range, int(math.ceil(float(self.__limit) / self.page_size)))
+
+        return page_range
+
+    def _iter_raw_pages(self, page_range):
+        """Yield raw elements for each page in order
+
+        When prefetch is enabled, up to `prefetch` page requests are kept in flight on a thread pool. New requests are
+        only submitted while full pages are being returned, and any outstanding requests are cancelled as soon as the
+        consumer stops iterating
+        """
+        if not self.prefetch or self.page_size == 0:
+            for page in page_range:
+                yield self._retrieve_raw_elements(page)
+            return
+
+        pages = iter(page_range)
+        pending = deque()
+        executor = ThreadPoolExecutor(max_workers=self.prefetch)
+
+        try:
+            for page in itertools.islice(pages, self.prefetch):
+                pending.append(executor.submit(self._retrieve_raw_elements, page))
+
+            while pending:
+                raw_elements = pending.popleft().result()
+
+                # A short page marks the end of results, stop requesting further pages
+                if len(raw_elements) >= self.page_size:
+                    for page in itertools.islice(pages, 1):
+                        pending.append(executor.submit(self._retrieve_raw_elements, page))
+
+                yield raw_elements
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     def _retrieve_raw_elements(self, page):
         """Send request and return response for single page of data"""
         raise NotImplementedError
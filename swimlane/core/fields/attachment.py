@@ -1,6 +1,8 @@
 import io
 import mimetypes
 
+import six
+
 from swimlane.core.fields.base import MultiSelectField, FieldCursor
 from swimlane.core.resources.attachment import Attachment
 from swimlane.utils.str_validator import validate_str
@@ -48,6 +50,8 @@ class AttachmentCursor(FieldCursor):
 
 class AttachmentsField(MultiSelectField):
 
+    __slots__ = ()
+
     field_type = (
         'Core.Models.Fields.AttachmentField, Core',
         'Core.Models.Fields.Attachment.AttachmentField, Core'
@@ -56,10 +60,11 @@ class AttachmentsField(MultiSelectField):
     supported_types = [Attachment]
     bulk_modify_support = False
 
-    def __init__(self, *args, **kwargs):
+    @classmethod
+    def compile_schema(cls, schema):
         """Override to force-set multiselect to always True"""
-        super(AttachmentsField, self).__init__(*args, **kwargs)
-        self.multiselect = True
+        super(AttachmentsField, cls).compile_schema(schema)
+        schema.multiselect = True
 
     def get_initial_elements(self):
         raw_value = self.get_swimlane() or []
@@ -75,6 +80,10 @@ class AttachmentsField(MultiSelectField):
         super(AttachmentsField, self)._set(value)
         self._cursor = None
 
+    def parse_swimlane(self, value):
+        """Return attachment metadata dicts, Attachment instances require the parent record to download"""
+        return [{k: v for k, v in six.iteritems(raw) if k != '$type'} for raw in value or []]
+
     def cast_to_python(self, value):
         return Attachment(self._swimlane, value, self.record.id, self.id)
 
@@ -1,15 +1,17 @@
 """Base classes used to build field abstractions"""
 from .cursor import CursorField, FieldCursor
-from .field import Field
+from .field import Field, FieldSchema
 from .multiselect import MultiSelectField, MultiSelectCursor
 
 
 class ReadOnly(Field):
     """Mixin explicitly disabling setting value via python"""
 
-    def __init__(self, *args, **kwargs):
-        super(ReadOnly, self).__init__(*args, **kwargs)
+    __slots__ = ()
 
-        self.readonly = True
+    @classmethod
+    def compile_schema(cls, schema):
+        super(ReadOnly, cls).compile_schema(schema)
+        schema.readonly = True
 
 
@@ -53,6 +53,8 @@ class FieldCursor(Cursor, SwimlaneResolver):
 class CursorField(Field):
     """Returns a proxy-like FieldCursor instance to support additional functionality"""
 
+    __slots__ = ('_cursor',)
+
     cursor_class = None
 
     def __init__(self, *args, **kwargs):
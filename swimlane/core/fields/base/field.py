@@ -4,9 +4,52 @@ from swimlane.core.resolver import SwimlaneResolver
 from swimlane.exceptions import ValidationError
 
 
+class FieldSchema(object):
+    """Field metadata compiled once per App field definition and shared between all Record Field instances
+
+    Built and cached per App by :meth:`App._get_field_schema`. Field classes add any class-specific metadata derived
+    from the definition by extending :meth:`Field.compile_schema`
+
+    Attributes:
+        field_class (type): Field subclass resolved from the definition $type
+        definition (dict): Raw field definition from App
+        name (str): Field name
+        key (str): Field key
+        id (str): Field ID
+        input_type (str): Field inputType subtype
+        required (bool): Field required by definition
+        readonly (bool): Field is readonly or a formula field
+        multiselect (bool): Field selectionType is multi
+    """
+
+    def __init__(self, field_class, definition):
+        self.field_class = field_class
+        self.definition = definition
+
+        self.name = definition['name']
+        self.key = definition.get('key')
+        self.id = definition['id']
+        self.input_type = definition.get('inputType')
+        self.required = definition.get('required', False)
+        self.readonly = bool(definition.get('formula', definition.get('readOnly', False)))
+        self.multiselect = definition.get('selectionType', 'single') == 'multi'
+
+        field_class.compile_schema(self)
+
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.name)
+
+
 class Field(SwimlaneResolver):
     """Base class for abstracting Swimlane complex types"""
 
+    # Field instances are built for every field accessed on every record, metadata is kept on the shared FieldSchema.
+    # __dict__ keeps other attributes assignable for compatibility, only allocated when used
+    __slots__ = (
+        'name', 'key', 'id', 'input_type', '_schema', '_value', 'required', 'readonly', 'multiselect', '__record_ref',
+        '__weakref__', '__dict__'
+    )
+
     field_type = None
 
     # Sentinel representing a field that has no current value
@@ -18,6 +61,9 @@ class Field(SwimlaneResolver):
     # Checks if bulk modify is supported for field
     bulk_modify_support = True
 
+    # Checks if field value is stored in record values
+    stored_in_values = True
+
     def __init__(self, name, record):
         """Value not included during instantiation to prevent ambiguity between python and swimlane representations"""
         super(Field, self).__init__(record._swimlane)
@@ -26,17 +72,34 @@ class Field(SwimlaneResolver):
         self.__record_ref = weakref.ref(record)
         self._value = self._unset
 
-        self.field_definition = self.record.app.get_field_definition_by_name(self.name)
-        self.key = self.field_definition.get('key')
-        self.id = self.field_definition['id']
-        self.input_type = self.field_definition.get('inputType')
-        self.required = self.field_definition.get('required', False)
-        self.readonly = bool(self.field_definition.get('formula', self.field_definition.get('readOnly', False)))
-        self.multiselect = self.field_definition.get('selectionType', 'single') == 'multi'
+        self._schema = record.app._get_field_schema(name)
+
+        # Per instance copies, can be overridden without affecting other records
+        self.key = self._schema.key
+        self.id = self._schema.id
+        self.input_type = self._schema.input_type
+        self.required = self._schema.required
+        self.readonly = self._schema.readonly
+        self.multiselect = self._schema.multiselect
 
     def __repr__(self):
         return '<{class_name}: {py!r}>'.format(class_name=self.__class__.__name__, py=self.get_python())
 
+    @classmethod
+    def compile_schema(cls, schema):
+        """Add any field class specific metadata to a new FieldSchema, called once per App field definition
+
+        .. versionadded:: 10.20.0
+
+        Args:
+            schema (FieldSchema): Schema being compiled, with common metadata already set
+        """
+
+    @property
+    def field_definition(self):
+        """Raw field definition from parent App"""
+        return self._schema.definition
+
     @property
     def record(self):
         """Resolve weak reference to parent record"""
@@ -62,6 +125,13 @@ class Field(SwimlaneResolver):
         """Return best swimlane representation of field value"""
         return self.cast_to_swimlane(self._get())
 
+    def parse_swimlane(self, value):
+        """Return best python representation of a raw swimlane value without modifying field state
+
+        Used to parse search results without building Record instances
+        """
+        return self.cast_to_python(value)
+
     def get_report(self, value):
         """Return provided field Python value formatted for use in report filter"""
         if self.multiselect:
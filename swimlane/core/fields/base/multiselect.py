@@ -38,6 +38,8 @@ class MultiSelectCursor(FieldCursor):
 class MultiSelectField(CursorField):
     """Base class for fields that can be multi-selection or single-selection field"""
 
+    __slots__ = ()
+
     cursor_class = MultiSelectCursor
 
     def get_python(self):
@@ -59,6 +61,14 @@ class MultiSelectField(CursorField):
             return None
         return super(MultiSelectField, self).get_swimlane()
 
+    def parse_swimlane(self, value):
+        """Return list of python values if configured for multiselect"""
+        if self.multiselect:
+            children = [self.cast_to_python(child) for child in value or []]
+            return [child for child in children if child is not None]
+
+        return super(MultiSelectField, self).parse_swimlane(value)
+
     def _set(self, value):
         """Override to treat empty lists as None"""
         return super(MultiSelectField, self)._set(value or None)
@@ -35,12 +35,15 @@ class CommentCursor(FieldCursor):
 
 class CommentsField(ReadOnly, CursorField):
 
+    __slots__ = ()
+
     field_type = (
         'Core.Models.Fields.CommentsField, Core',
         'Core.Models.Fields.Comments.CommentsField, Core'
     )
     cursor_class = CommentCursor
     bulk_modify_support = False
+    stored_in_values = False
 
     def get_initial_elements(self):
         raw_comments = self.record._raw['comments'].get(self.id, [])
@@ -13,6 +13,8 @@ UTC = pendulum.timezone('UTC')
 
 class DatetimeField(Field):
 
+    __slots__ = ()
+
     field_type = 'Core.Models.Fields.Date.DateField, Core'
 
     datetime_format = '%Y-%m-%dT%H:%M:%S.%fZ'
@@ -28,11 +30,15 @@ class DatetimeField(Field):
         _type_time: [datetime, time]
     }
 
-    def __init__(self, *args, **kwargs):
-        super(DatetimeField, self).__init__(*args, **kwargs)
-
+    @classmethod
+    def compile_schema(cls, schema):
+        super(DatetimeField, cls).compile_schema(schema)
         # Determine supported_types after inspecting input subtype
-        self.supported_types = self._input_type_map.get(self.input_type, [datetime])
+        schema.supported_types = cls._input_type_map.get(schema.input_type, [datetime])
+
+    @property
+    def supported_types(self):
+        return self._schema.supported_types
 
     def _set(self, value):
         # Force to appropriate Pendulum instance for consistency
@@ -63,6 +69,19 @@ class DatetimeField(Field):
 
         return value
 
+    def parse_swimlane(self, value):
+        """Parse to UTC Pendulum instance coerced to the field subtype, matching get_python()"""
+        value = self.cast_to_python(value)
+
+        if value is not None and self.input_type != self._type_interval:
+            value = UTC.convert(value)
+            if self.input_type == self._type_time:
+                value = value.time()
+            if self.input_type == self._type_date:
+                value = value.date()
+
+        return value
+
     def get_python(self):
         """Coerce to best date type representation for the field subtype"""
         value = super(DatetimeField, self).get_python()
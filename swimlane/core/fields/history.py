@@ -23,6 +23,9 @@ class RevisionCursor(FieldCursor):
 
 class HistoryField(ReadOnly, CursorField):
 
+    __slots__ = ()
+
     field_type = 'Core.Models.Fields.History.HistoryField, Core'
     cursor_class = RevisionCursor
     bulk_modify_support = False
+    stored_in_values = False
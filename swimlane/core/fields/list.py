@@ -183,6 +183,8 @@ class NumericListFieldCursor(_ListFieldCursor):
 class ListField(CursorField):
     """Text and Numeric List field"""
 
+    __slots__ = ('_initial_value_to_ids_map',)
+
     field_type = (
         'Core.Models.Fields.List.ListField, Core',
         'Core.Models.Fields.ListField, Core',
@@ -201,12 +203,20 @@ class ListField(CursorField):
 
     def __init__(self, *args, **kwargs):
         super(ListField, self).__init__(*args, **kwargs)
-        self.cursor_class = self._type_map[self.input_type]['cursor_class']
 
         # dict of value -> list(ids) for each value from record raw data
         # Set by set_swimlane during record init from app.records.get() or after record.save()
         self._initial_value_to_ids_map = defaultdict(list)
 
+    @classmethod
+    def compile_schema(cls, schema):
+        super(ListField, cls).compile_schema(schema)
+        schema.cursor_class = cls._type_map[schema.input_type]['cursor_class']
+
+    @property
+    def cursor_class(self):
+        return self._schema.cursor_class
+
     def set_swimlane(self, value):
         """Convert from list of dicts with values to list of values
 
@@ -221,6 +231,10 @@ class ListField(CursorField):
 
         return super(ListField, self).set_swimlane([d['value'] for d in value])
 
+    def parse_swimlane(self, value):
+        """Return list of item values"""
+        return [d['value'] for d in value or []]
+
     def set_python(self, value):
         """Validate using cursor for consistency between direct set of values vs modification of cursor values"""
         if not isinstance(value, (list, type(None))):
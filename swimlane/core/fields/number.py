@@ -11,13 +11,23 @@ class NumberField(Field):
         'Core.Models.Fields.Numeric.NumericField, Core'
     )
 
+    __slots__ = ()
+
     supported_types = [numbers.Number]
 
-    def __init__(self, *args, **kwargs):
-        super(NumberField, self).__init__(*args, **kwargs)
+    @classmethod
+    def compile_schema(cls, schema):
+        super(NumberField, cls).compile_schema(schema)
+        schema.min = schema.definition.get('min')
+        schema.max = schema.definition.get('max')
+
+    @property
+    def min(self):
+        return self._schema.min
 
-        self.min = self.field_definition.get('min')
-        self.max = self.field_definition.get('max')
+    @property
+    def max(self):
+        return self._schema.max
 
     def validate_value(self, value):
         super(NumberField, self).validate_value(value)
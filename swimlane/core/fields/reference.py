@@ -1,5 +1,6 @@
 import logging
-import six
+from concurrent.futures import ThreadPoolExecutor
+
 from sortedcontainers import SortedDict
 from swimlane.core.fields.base import CursorField, FieldCursor
 from swimlane.core.resources.record import Record
@@ -8,41 +9,98 @@ from swimlane.exceptions import ValidationError, SwimlaneHTTP400Error
 logger = logging.getLogger(__name__)
 
 
+def _fetch_records(app, record_ids, max_workers):
+    """Retrieve records from app by ID using up to max_workers concurrent requests
+
+    Returns dict of record ID to Record, ignoring assumed orphaned records returning a 400 response
+    """
+    def fetch(record_id):
+        try:
+            return app.records.get(id=record_id)
+        except SwimlaneHTTP400Error:
+            logger.debug('Received 400 response retrieving record "{}", ignoring assumed orphaned record'.format(
+                record_id
+            ))
+
+    if max_workers > 1 and len(record_ids) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(record_ids))) as executor:
+            records = list(executor.map(fetch, record_ids))
+    else:
+        records = [fetch(record_id) for record_id in record_ids]
+
+    return {record_id: record for record_id, record in zip(record_ids, records) if record is not None}
+
+
 class ReferenceCursor(FieldCursor):
-    """Handles lazy retrieval of target records"""
+    """Handles lazy retrieval of target records
+
+    Unresolved target records are retrieved in batches of concurrent requests as the cursor is iterated, and cached on
+    the cursor for later access. Batch size defaults to the client's `reference_batch_size`
+
+    Attributes:
+        batch_size (int): Max number of concurrent requests retrieving target records of this cursor, overriding the
+            client's `reference_batch_size` when set. Set 1 to retrieve target records one at a time without threads
+    """
 
     def __init__(self, *args, **kwargs):
         super(ReferenceCursor, self).__init__(*args, **kwargs)
         self._elements = self._elements or SortedDict()
+        self.batch_size = None
+
+    @property
+    def _batch_size(self):
+        return self.batch_size or self._swimlane.reference_batch_size
 
     @property
     def target_app(self):
         """Make field's target_app available on cursor"""
         return self._field.target_app
 
+    def _resolve(self, record_ids):
+        """Retrieve any still unresolved target records for provided record IDs in a single batch"""
+        unset = self._field._unset
+        unresolved = [record_id for record_id in record_ids if self._elements.get(record_id) is unset]
+        if unresolved:
+            self._elements.update(_fetch_records(self.target_app, unresolved, self._batch_size))
+
     def __getitem__(self, item):
-        record_id, record = [kv for kv in self._elements.items()][item]
-        if record is self._field._unset:
-            try:
-                records_get = self.target_app.records.get(id=record_id)
-                self._elements[record_id] = records_get
-                return records_get
-            except SwimlaneHTTP400Error:
-                logger.debug('Received 400 response retrieving record "{}", ignoring assumed orphaned record')
-        else:
-            return record
+        """Return referenced record at index, or list of referenced records for a slice
+
+        Uses SortedDict positional lookups, slices resolve all of their unresolved records in a single batch
+        """
+        unset = self._field._unset
+
+        if isinstance(item, slice):
+            record_ids = self._elements.keys()[item]
+            self._resolve(record_ids)
+            records = [self._elements[record_id] for record_id in record_ids]
+            return [record for record in records if record is not unset]
+
+        record_id, record = self._elements.peekitem(item)
+        if record is unset:
+            self._resolve([record_id])
+            record = self._elements[record_id]
+            if record is unset:
+                return None
+
+        return record
+
+    def __len__(self):
+        return len(self._elements)
 
     def __iter__(self):
-        for record_id, record in six.iteritems(self._elements):
-            if record is self._field._unset:
-                try:
-                    records_get = self.target_app.records.get(id=record_id)
-                    self._elements[record_id] = records_get
-                    yield records_get
-                except SwimlaneHTTP400Error:
-                    logger.debug('Received 400 response retrieving record "{}", ignoring assumed orphaned record')
-            else:
-                yield record
+        unset = self._field._unset
+        record_ids = list(self._elements.keys())
+        batch_size = self._batch_size
+
+        for start in range(0, len(record_ids), batch_size):
+            batch = record_ids[start:start + batch_size]
+            self._resolve(batch)
+
+            for record_id in batch:
+                record = self._elements.get(record_id, unset)
+                if record is not unset:
+                    yield record
 
     def add(self, record):
         """Add a reference to the provided record"""
@@ -58,6 +116,13 @@ class ReferenceCursor(FieldCursor):
 
 
 class ReferenceField(CursorField):
+    """Manages getting/setting Records referenced by a Reference field
+
+    Target records are retrieved in concurrent batches of the client's `reference_batch_size` as the field's
+    ReferenceCursor is iterated. Use :func:`prefetch_references` to retrieve them across many records at once
+    """
+
+    __slots__ = ('__target_app',)
 
     field_type = 'Core.Models.Fields.Reference.ReferenceField, Core'
     supported_types = (Record,)
@@ -65,14 +130,18 @@ class ReferenceField(CursorField):
 
     def __init__(self, *args, **kwargs):
         super(ReferenceField, self).__init__(*args, **kwargs)
-        self.__target_app_id = self.field_definition['targetId']
         self.__target_app = None
 
+    @classmethod
+    def compile_schema(cls, schema):
+        super(ReferenceField, cls).compile_schema(schema)
+        schema.target_app_id = schema.definition['targetId']
+
     @property
     def target_app(self):
         """Defer target app retrieval until requested"""
         if self.__target_app is None:
-            self.__target_app = self._swimlane.apps.get(id=self.__target_app_id)
+            self.__target_app = self._swimlane.apps.get(id=self._schema.target_app_id)
 
         return self.__target_app
 
@@ -114,6 +183,19 @@ class ReferenceField(CursorField):
 
         return super(ReferenceField, self).set_swimlane(records)
 
+    def parse_swimlane(self, value):
+        """Return list of referenced record ids if multi-select, single record id or None if single-select"""
+        value = value or []
+        if isinstance(value, dict):
+            value = value["_v"] if "_v" in value else []
+
+        record_ids = [record[0] if isinstance(record, (list, tuple)) else record for record in value]
+
+        if self.multiselect:
+            return record_ids
+
+        return record_ids[0] if record_ids else None
+
     def set_python(self, value):
         """With changes to Lazy instrumentation _evaluation returns SortedDictionary, unfortunately this
         is still public method that can be accessed in the old way, therefore it was split in two.
@@ -171,3 +253,67 @@ class ReferenceField(CursorField):
     def set_python_raw(self, value):
         self._set(value)
         self.record._raw['values'][self.id] = self.get_swimlane()
+
+
+def prefetch_references(records, field_name, batch_size=None):
+    """Resolve referenced target records of a reference field across many records at once
+
+    Unresolved referenced record IDs are collected from all provided records, de-duplicated, and retrieved with up to
+    `batch_size` concurrent requests. Results are stored on each record's ReferenceCursor so later iteration or access
+    sends no further requests
+
+    .. versionadded:: 10.20.0
+
+    Args:
+        records (list(Record)): Records containing the reference field
+        field_name (str): Reference field name or key
+        batch_size (int): Max number of concurrent requests retrieving referenced records. Defaults to the client's
+            `reference_batch_size`
+
+    Raises:
+        ValueError: If field_name is not a reference field
+
+    Returns:
+        dict: Mapping of referenced record IDs to retrieved Record instances
+
+    Examples:
+
+        ::
+
+            records = app.records.search(limit=0)
+            prefetch_references(records, 'Reference')
+
+            for record in records:
+                for referenced_record in record['Reference']:
+                    do_thing(referenced_record)
+    """
+    cursors = []
+    unresolved = {}
+
+    for record in records:
+        field = record.get_field(field_name)
+        if not isinstance(field, ReferenceField):
+            raise ValueError('Field "{}" is not a reference field'.format(field_name))
+
+        cursor = field.cursor
+        cursors.append(cursor)
+
+        target_app, record_ids = unresolved.setdefault(field.target_app.id, (field.target_app, {}))
+        for record_id, referenced_record in cursor._elements.items():
+            if referenced_record is field._unset:
+                record_ids[record_id] = None
+
+    resolved = {}
+    for target_app, record_ids in unresolved.values():
+        resolved.update(_fetch_records(
+            target_app,
+            list(record_ids),
+            batch_size or target_app._swimlane.reference_batch_size
+        ))
+
+    for cursor in cursors:
+        for record_id in cursor._elements:
+            if record_id in resolved:
+                cursor._elements[record_id] = resolved[record_id]
+
+    return resolved
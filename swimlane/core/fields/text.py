@@ -6,6 +6,8 @@ from .base import Field
 
 class TextField(Field):
 
+    __slots__ = ()
+
     field_type = (
         'Core.Models.Fields.TextField, Core',
         'Core.Models.Fields.Text.TextField, Core'
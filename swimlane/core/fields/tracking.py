@@ -3,6 +3,8 @@ from .base import Field, ReadOnly
 
 class TrackingField(ReadOnly, Field):
 
+    __slots__ = ()
+
     field_type = (
         'Core.Models.Fields.TrackingField, Core',
         'Core.Models.Fields.Tracking.TrackingField, Core'
@@ -6,6 +6,8 @@ from .base import MultiSelectField
 class UserGroupField(MultiSelectField):
     """Manages getting/setting users from record User/Group fields"""
 
+    __slots__ = ()
+
     field_type = (
         'Core.Models.Fields.UserGroupField, Core',
         'Core.Models.Fields.UserGroup.UserGroupField, Core'
@@ -13,19 +15,44 @@ class UserGroupField(MultiSelectField):
 
     supported_types = [UserGroup]
 
-    def __init__(self, *args, **kwargs):
-        super(UserGroupField, self).__init__(*args, **kwargs)
+    @classmethod
+    def compile_schema(cls, schema):
+        super(UserGroupField, cls).compile_schema(schema)
+
+        members = schema.definition.get('members', [])
+
+        schema.allowed_user_ids = frozenset([r['id'] for r in members if r['selectionType'] == 'users'])
+        schema.allowed_member_ids = frozenset([r['id'] for r in members if r['selectionType'] == 'members'])
+
+        schema.allowed_group_ids = frozenset([r['id'] for r in members if r['selectionType'] == 'groups'])
+        schema.allowed_subgroup_ids = frozenset([r['id'] for r in members if r['selectionType'] == 'subGroups'])
+
+        schema.show_all_users = schema.definition['showAllUsers']
+        schema.show_all_groups = schema.definition['showAllGroups']
+
+    @property
+    def _allowed_user_ids(self):
+        return self._schema.allowed_user_ids
 
-        members = self.field_definition.get('members', [])
+    @property
+    def _allowed_member_ids(self):
+        return self._schema.allowed_member_ids
 
-        self._allowed_user_ids = set([r['id'] for r in members if r['selectionType'] == 'users'])
-        self._allowed_member_ids = set([r['id'] for r in members if r['selectionType'] == 'members'])
+    @property
+    def _allowed_group_ids(self):
+        return self._schema.allowed_group_ids
 
-        self._allowed_group_ids = set([r['id'] for r in members if r['selectionType'] == 'groups'])
-        self._allowed_subgroup_ids = set([r['id'] for r in members if r['selectionType'] == 'subGroups'])
+    @property
+    def _allowed_subgroup_ids(self):
+        return self._schema.allowed_subgroup_ids
 
-        self._show_all_users = self.field_definition['showAllUsers']
-        self._show_all_groups = self.field_definition['showAllGroups']
+    @property
+    def _show_all_users(self):
+        return self._schema.show_all_users
+
+    @property
+    def _show_all_groups(self):
+        return self._schema.show_all_groups
 
     def validate_value(self, value):
         """Validate new user/group value against any User/Group restrictions
@@ -117,6 +144,13 @@ class UserGroupField(MultiSelectField):
 
         return super(UserGroupField, self).set_swimlane(value)
 
+    def parse_swimlane(self, value):
+        """Apply same empty usergroup workaround as set_swimlane"""
+        if value == [{"$type": "Core.Models.Utilities.UserGroupSelection, Core"}]:
+            value = []
+
+        return super(UserGroupField, self).parse_swimlane(value)
+
     def cast_to_python(self, value):
         """Convert JSON definition to UserGroup object"""
         # v2.x does not provide a distinction between users and groups at the field selection level, can only return
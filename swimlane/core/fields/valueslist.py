@@ -6,16 +6,23 @@ from .base import MultiSelectField
 
 class ValuesListField(MultiSelectField):
 
+    __slots__ = ()
+
     field_type = (
         'Core.Models.Fields.ValuesListField, Core',
         'Core.Models.Fields.ValuesList.ValuesListField, Core'
     )
     supported_types = six.string_types
 
-    def __init__(self, *args, **kwargs):
+    @classmethod
+    def compile_schema(cls, schema):
         """Map names to IDs for use in field rehydration"""
-        super(ValuesListField, self).__init__(*args, **kwargs)
-        self.selection_to_id_map = {f['name']: f['id'] for f in self.field_definition['values']}
+        super(ValuesListField, cls).compile_schema(schema)
+        schema.selection_to_id_map = {f['name']: f['id'] for f in schema.definition['values']}
+
+    @property
+    def selection_to_id_map(self):
+        return self._schema.selection_to_id_map
 
     def validate_value(self, value):
         """Validate provided value is one of the valid options"""
@@ -0,0 +1,129 @@
+"""Pluggable JSON encoders and decoders used for request payloads and response bodies
+
+The fastest available backend is used by default, preferring orjson, then ujson, then the standard library json module.
+Optional backends are not required dependencies and are only used when installed
+
+.. versionadded:: 10.20.0
+"""
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+ORJSON = 'orjson'
+UJSON = 'ujson'
+STDLIB = 'json'
+
+
+class JsonBackend(object):
+    """JSON encoder and decoder working directly with UTF-8 bytes
+
+    Base implementation uses the standard library json module. Subclasses override `dumps` and `loads` to use faster
+    libraries
+
+    Attributes:
+        name (str): Backend name passed to get_json_backend
+    """
+
+    name = STDLIB
+
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.name)
+
+    def dumps(self, obj, sort_keys=False):
+        """Serialize obj to compact UTF-8 encoded JSON bytes
+
+        Args:
+            obj: JSON serializable object
+            sort_keys (bool): Output dictionaries sorted by key
+
+        Returns:
+            bytes: Encoded JSON document
+        """
+        return json.dumps(obj, sort_keys=sort_keys, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    def loads(self, data):
+        """Deserialize JSON document from UTF-8 encoded bytes or str
+
+        Raises:
+            ValueError: If data is not a valid JSON document
+        """
+        return json.loads(data)
+
+
+class OrjsonBackend(JsonBackend):
+    """JSON backend using orjson, falling back to the standard library for objects orjson cannot serialize"""
+
+    name = ORJSON
+
+    def dumps(self, obj, sort_keys=False):
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # Integers wider than 64 bits and other values only supported by the standard library
+            return super(OrjsonBackend, self).dumps(obj, sort_keys=sort_keys)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class UjsonBackend(JsonBackend):
+    """JSON backend using ujson"""
+
+    name = UJSON
+
+    def dumps(self, obj, sort_keys=False):
+        return ujson.dumps(obj, sort_keys=sort_keys, ensure_ascii=False, escape_forward_slashes=False).encode('utf-8')
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+
+_backends = {
+    ORJSON: (OrjsonBackend, orjson),
+    UJSON: (UjsonBackend, ujson),
+    STDLIB: (JsonBackend, json)
+}
+
+
+def get_json_backend(backend=None):
+    """Return a JSON backend by name, or the fastest installed backend
+
+    Args:
+        backend (str|JsonBackend): One of `orjson`, `ujson`, or `json`, available as ORJSON, UJSON, and STDLIB
+            constants in this module, or a JsonBackend instance returned as is. Defaults to the fastest installed backend
+
+    Returns:
+        JsonBackend: JSON backend instance
+
+    Raises:
+        ValueError: If backend name is unknown or the backend library is not installed
+    """
+    if isinstance(backend, JsonBackend):
+        return backend
+
+    if backend is None:
+        for name in (ORJSON, UJSON, STDLIB):
+            backend_class, module = _backends[name]
+            if module is not None:
+                return backend_class()
+
+    try:
+        backend_class, module = _backends[backend]
+    except KeyError:
+        raise ValueError('Unknown JSON backend "{}", expected one of {}'.format(backend, ', '.join(_backends)))
+
+    if module is None:
+        raise ValueError('JSON backend "{}" is not installed'.format(backend))
+
+    return backend_class()
@@ -0,0 +1,137 @@
+"""Client-side admission control limiting request rate and concurrency
+
+.. versionadded:: 10.20.0
+"""
+import re
+import threading
+import time
+
+SEARCH = 'search'
+RECORD_WRITE = 'record_write'
+ATTACHMENT = 'attachment'
+
+ENDPOINT_CLASSES = (SEARCH, RECORD_WRITE, ATTACHMENT)
+
+_RECORD_ENDPOINT_PATTERN = re.compile(r'^app/[^/]+/record')
+_READ_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+
+def get_endpoint_class(method, api_endpoint):
+    """Return endpoint class of a request used to select endpoint specific limits, or None for unclassified requests
+
+    Args:
+        method (str): Request method
+        api_endpoint (str): API endpoint as provided to Swimlane.request, without leading slash
+
+    Returns:
+        str: One of SEARCH, RECORD_WRITE, ATTACHMENT, or None
+    """
+    if api_endpoint.startswith('search'):
+        return SEARCH
+    if api_endpoint.startswith('attachment'):
+        return ATTACHMENT
+    if method.upper() not in _READ_METHODS and _RECORD_ENDPOINT_PATTERN.match(api_endpoint):
+        return RECORD_WRITE
+
+    return None
+
+
+class TokenBucket(object):
+    """Thread-safe token bucket allowing an average of `rate` acquisitions per second with bursts of up to `burst`
+
+    Args:
+        rate (float): Tokens added per second
+        burst (int): Maximum number of tokens stored. Defaults to max(1, rate)
+    """
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError('rate should be greater than 0')
+
+        self.rate = float(rate)
+        self.burst = burst if burst is not None else max(1, int(rate))
+
+        if self.burst < 1:
+            raise ValueError('burst should be 1 or greater')
+
+        self.__tokens = float(self.burst)
+        self.__last = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def _reserve(self):
+        """Take a token, returning seconds to wait until the token becomes available"""
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(self.burst, self.__tokens + (now - self.__last) * self.rate)
+            self.__last = now
+
+            # Tokens may go negative, queueing concurrent callers behind each other
+            self.__tokens -= 1
+            if self.__tokens >= 0:
+                return 0
+
+            return -self.__tokens / self.rate
+
+    def acquire(self):
+        """Block until a token is available"""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+
+class RateLimit(object):
+    """Limits request rate with a token bucket and number of concurrent requests with a semaphore
+
+    Used as a context manager around each request attempt. Either limit can be omitted
+
+    Args:
+        rate (float): Average maximum requests per second
+        burst (int): Maximum number of requests allowed at once above the average rate. Defaults to max(1, rate)
+        max_in_flight (int): Maximum number of concurrent requests
+
+    Examples:
+
+        ::
+
+            from swimlane import Swimlane
+            from swimlane.core.ratelimit import RateLimit, SEARCH, RECORD_WRITE
+
+            swimlane = Swimlane(
+                '192.168.1.1',
+                'username',
+                'password',
+                rate_limit=RateLimit(rate=50, max_in_flight=16),
+                endpoint_rate_limits={
+                    SEARCH: RateLimit(max_in_flight=4),
+                    RECORD_WRITE: RateLimit(rate=10)
+                }
+            )
+    """
+
+    def __init__(self, rate=None, burst=None, max_in_flight=None):
+        if max_in_flight is not None and (not isinstance(max_in_flight, int) or max_in_flight <= 0):
+            raise ValueError('max_in_flight should be a positive integer')
+
+        self.rate = rate
+        self.max_in_flight = max_in_flight
+
+        self._bucket = TokenBucket(rate, burst) if rate is not None else None
+        self._semaphore = threading.BoundedSemaphore(max_in_flight) if max_in_flight is not None else None
+
+    def __repr__(self):
+        return '<{}: rate={}, max_in_flight={}>'.format(self.__class__.__name__, self.rate, self.max_in_flight)
+
+    def __enter__(self):
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+        if self._bucket is not None:
+            try:
+                self._bucket.acquire()
+            except BaseException:
+                self.__exit__(None, None, None)
+                raise
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._semaphore is not None:
+            self._semaphore.release()
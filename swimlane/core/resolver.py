@@ -5,6 +5,8 @@ class SwimlaneResolver(object):
     """Provides automatic weakref resolution for Swimlane client to avoid circular references and 
     memory leaks """
 
+    __slots__ = ('__ref_swimlane',)
+
     def __init__(self, swimlane):
         self.__ref_swimlane = weakref.ref(swimlane) if swimlane else swimlane
 
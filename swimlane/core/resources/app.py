@@ -21,6 +21,11 @@ class App(APIResource):
         tracking_id (str): App tracking ID
         records (RecordAdapter): :class:`~swimlane.core.adapters.record.RecordAdapter` configured for current App
         reports (ReportAdapter): :class:`~swimlane.core.adapters.report.ReportAdapter` configured for current App
+        revisions (AppRevisionAdapter): :class:`~swimlane.core.adapters.app_revision.AppRevisionAdapter` configured for
+            current App
+
+    .. versionchanged:: 10.20.0
+        Field definitions are parsed, and adapters created, on first use instead of when the App is created
     """
 
     _type = 'Core.Models.Application.Application, Core'
@@ -34,64 +39,130 @@ class App(APIResource):
         self.id = self._raw['id']
         self.tracking_id = self._raw.get('trackingFieldId')
 
-        self._fields_by_id = dict()
-        self._fields_by_name = dict()
-        self._defaults = dict()
+        # Field maps, defaults, and adapters are built on first use
+        self.__field_maps = None
+
+        self.__field_schemas = {}
+        self.__stub_record = None
+        self.__value_fields = None
+
+    def __str__(self):
+        return '{self.name} ({self.acronym})'.format(self=self)
+
+    def __hash__(self):
+        return hash((self.id, self.name))
+
+    def __lt__(self, other):
+        if not isinstance(other, self.__class__):
+            raise TypeError('Comparisons not supported between instances of "{}" and "{}"'.format(
+                other.__class__.__name__,
+                self.__class__.__name__
+            ))
+
+        return self.name < other.name
+
+    def _get_cache_view(self, raw=None):
+        """Return copy of cached app with adapters and stub record bound to the copy
+
+        Field definitions and schemas are shared with the cached app
+        """
+        if raw is None:
+            # Parse field definitions once on the cached app instead of on every copy
+            self.__get_field_maps()
+
+        view = super(App, self)._get_cache_view(raw)
+        for adapter_name in ('records', 'reports', 'revisions'):
+            view.__dict__.pop(adapter_name, None)
+
+        # Stub record only weakly references the app it was built for
+        view.__stub_record = None
+        view.__value_fields = None
+
+        return view
+
+    def __getattr__(self, item):
+        """Create records, reports, and revisions adapters on first use"""
+        if item not in ('records', 'reports', 'revisions'):
+            raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, item))
+
+        # Avoid circular import
+        from swimlane.core.adapters import RecordAdapter, ReportAdapter, AppRevisionAdapter
+
+        adapter_class = {
+            'records': RecordAdapter,
+            'reports': ReportAdapter,
+            'revisions': AppRevisionAdapter
+        }[item]
+        adapter = adapter_class(self)
+        setattr(self, item, adapter)
+        return adapter
+
+    @property
+    def _fields_by_id(self):
+        return self.__get_field_maps()[0]
+
+    @property
+    def _fields_by_name(self):
+        return self.__get_field_maps()[1]
+
+    @property
+    def _defaults(self):
+        return self.__get_field_maps()[2]
+
+    @property
+    def _keys_to_field_names(self):
+        return self.__get_field_maps()[3]
+
+    def __get_field_maps(self):
+        """Return field definitions by id and name, default values, and field names by key and name, parsed from raw
+        field definitions on first use
+
+        .. versionadded:: 10.20.0
+        """
+        if self.__field_maps is not None:
+            return self.__field_maps
+
+        fields_by_id = dict()
+        fields_by_name = dict()
+        defaults = dict()
 
         for field in self._raw['fields']:
-            self._fields_by_id[field['id']] = field
-            self._fields_by_name[field['name']] = field
+            fields_by_id[field['id']] = field
+            fields_by_name[field['name']] = field
             if 'fieldType' in field and field['fieldType'] == "valuesList":
                 selection_type = field['selectionType']
                 for value in field['values']:
                     if 'selected' in value and value['selected']:
                         if selection_type == 'single':
-                            self._defaults[field['name']] = value['name']
+                            defaults[field['name']] = value['name']
                             break
                         else:
-                            default = self._defaults.get(field['name'], list())
+                            default = defaults.get(field['name'], list())
                             default.extend([value['name']])
-                            self._defaults[field['name']] = default
+                            defaults[field['name']] = default
             if 'fieldType' in field and field['fieldType'] == "date":
                 default_value_type = field['defaultValueType']
                 if default_value_type == 'specific':
-                    self._defaults[field['name']] = pendulum.parse(field['defaultValue'])
+                    defaults[field['name']] = pendulum.parse(field['defaultValue'])
 
-        self._keys_to_field_names = {}
-        for name, field_def in six.iteritems(self._fields_by_name):
+        keys_to_field_names = {}
+        for name, field_def in six.iteritems(fields_by_name):
             # Include original name to simplify name resolution
-            self._keys_to_field_names[name] = name
+            keys_to_field_names[name] = name
             key = field_def.get('key')
             if key:
-                self._keys_to_field_names[key] = name
+                keys_to_field_names[key] = name
 
-        # Avoid circular import
-        from swimlane.core.adapters import RecordAdapter, ReportAdapter, AppRevisionAdapter
-        self.records = RecordAdapter(self)
-        self.reports = ReportAdapter(self)
-        self.revisions = AppRevisionAdapter(self)
-
-    def __str__(self):
-        return '{self.name} ({self.acronym})'.format(self=self)
-
-    def __hash__(self):
-        return hash((self.id, self.name))
-
-    def __lt__(self, other):
-        if not isinstance(other, self.__class__):
-            raise TypeError('Comparisons not supported between instances of "{}" and "{}"'.format(
-                other.__class__.__name__,
-                self.__class__.__name__
-            ))
-
-        return self.name < other.name
+        # Maps are assigned together so concurrent first uses never see partially built maps
+        self.__field_maps = (fields_by_id, fields_by_name, defaults, keys_to_field_names)
+        return self.__field_maps
 
     def get_cache_index_keys(self):
         """Return all fields available when retrieving apps"""
         return {
             'id': self.id,
             'name': self.name,
-            'acroynm': self.acronym
+            'acronym': self.acronym
         }
 
     def resolve_field_name(self, field_key):
@@ -118,6 +189,63 @@ class App(APIResource):
         except KeyError:
             raise UnknownField(self, field_name, self._fields_by_name.keys())
 
+    def _get_field_schema(self, field_name):
+        """Return FieldSchema compiled once for the named field and shared by all of this App's Record fields
+
+        .. versionadded:: 10.20.0
+
+        Raises:
+            swimlane.exceptions.UnknownField: Raised when given a field name not found in App
+        """
+        try:
+            return self.__field_schemas[field_name]
+        except KeyError:
+            # Avoid circular import
+            from swimlane.core.fields import resolve_field_class
+            from swimlane.core.fields.base import FieldSchema
+
+            field_definition = self.get_field_definition_by_name(field_name)
+            schema = FieldSchema(resolve_field_class(field_definition), field_definition)
+            self.__field_schemas[field_name] = schema
+
+            return schema
+
+    def _get_stub_record(self):
+        """Return cached transient Record whose fields are used to parse and format values for this App without
+        building a new Record each time
+
+        The stub record only holds a weak reference back to the App, so cached Apps are freed as soon as they are no
+        longer used
+        """
+        if self.__stub_record is None:
+            # Avoid circular import
+            from swimlane.core.resources.record import record_factory
+            stub_record = record_factory(self)
+            stub_record._release_app()
+            self.__stub_record = stub_record
+
+        return self.__stub_record
+
+    def _get_stub_field(self, field_name):
+        """Return field of the cached stub record matching field name or key, used to validate and format values for
+        reports, filters, and bulk operations
+
+        .. versionadded:: 10.20.0
+
+        Raises:
+            swimlane.exceptions.UnknownField: Raised when given a field name not found in App
+        """
+        return self._get_stub_record().get_field(field_name)
+
+    def _get_value_fields(self):
+        """Return list of stub field instances for all fields stored in record values"""
+        if self.__value_fields is None:
+            self.__value_fields = [
+                field for field in six.itervalues(self._get_stub_record()._fields) if field.stored_in_values
+            ]
+
+        return self.__value_fields
+
     def get_field_definition_by_id(self, field_id):
         """Get JSON field definition for field matching provided id
 
@@ -1,6 +1,7 @@
 import six
 
 from swimlane.core.resolver import SwimlaneResolver
+from swimlane.utils.copy_on_write import CopyOnWriteDict, deepcopy_raw
 
 
 class APIResourceMetaclass(type):
@@ -53,3 +54,24 @@ class APIResource(six.with_metaclass(APIResourceMetaclass, SwimlaneResolver)):
     def get_cache_index_keys(self):
         """Return dict of key/value pairs used by ResourceCache to map resource values to internal cache instance"""
         raise NotImplementedError
+
+    def _get_cache_snapshot(self):
+        """Return private copy of resource stored by ResourcesCache, not sharing any raw data with this instance
+
+        .. versionadded:: 10.20.0
+        """
+        return self._get_cache_view(deepcopy_raw(self._raw))
+
+    def _get_cache_view(self, raw=None):
+        """Return shallow copy of a cached resource snapshot returned on cache hits
+
+        Copy uses a copy-on-write view of the snapshot raw data unless raw is provided. Subclasses reset any other
+        mutable instance state that must not be shared between copies
+
+        .. versionadded:: 10.20.0
+        """
+        view = object.__new__(self.__class__)
+        view.__dict__.update(self.__dict__)
+        super(APIResource, view).__init__(self._swimlane)
+        view._raw = raw if raw is not None else CopyOnWriteDict(self._raw)
+        return view
@@ -1,14 +1,22 @@
 import copy
+from concurrent.futures import ThreadPoolExecutor
 from functools import total_ordering
+import logging
 import time
+import weakref
 import pendulum
 import six
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
 from swimlane.core.resources.base import APIResource
 from swimlane.core.resources.usergroup import UserGroup, User
 from swimlane.exceptions import SwimlaneException, UnknownField, ValidationError
 import swimlane.core.adapters.task  # avoid circular reference
 import swimlane.core.adapters.helper  # avoid circular reference
 
+logger = logging.getLogger(__name__)
 
 
 @total_ordering
@@ -22,11 +30,21 @@ class Record(APIResource):
         modified (pendulum.DateTime): Pendulum datetime for Record last modified date
         is_new (bool): True if Record does not yet exist on server. Other values may be temporarily None if True
         app (App): App instance that Record belongs to
+
+    Args:
+        app (App): App instance that Record belongs to
+        raw (dict): Raw record data
+        projection (frozenset): Ids of the only fields whose values are included in raw, as returned by a search
+            limited to a subset of columns. Values of other fields are retrieved from the server when first accessed.
+            Defaults to None, raw including values of all fields
+
+    .. versionchanged:: 10.20.0
+        Added `projection` for partial records
     """
 
     _type = 'Core.Models.Record.Record, Core'
 
-    def __init__(self, app, raw):
+    def __init__(self, app, raw, projection=None):
         super(Record, self).__init__(app._swimlane, raw)
 
         self.__app = app
@@ -56,16 +74,19 @@ class Record(APIResource):
             self.created = pendulum.parse(self._raw['createdDate'])
             self.modified = pendulum.parse(self._raw['modifiedDate'])
 
+        # New records have no unloaded values to retrieve
+        self.__projection = None if self.is_new else projection
+
         self.__allowed = []
 
-        self._fields = {}
-        self.__premap_fields()
+        # Field instances and their existing values are built on first access of each field
+        self._fields = _RecordFields(self)
+        self.__existing_values = {}
 
         # Get trackingFull if available
         if app.tracking_id in self._raw['values']:
             self._raw['trackingFull'] = self._raw['values'].get(app.tracking_id)
 
-        self.__existing_values = {k: self.get_field(k).get_batch_representation() for (k, v) in self}
         self._comments_modified = False
 
         self.locked = False
@@ -78,7 +99,29 @@ class Record(APIResource):
 
     @property
     def app(self):
-        return self.__app
+        app = self.__app
+        if isinstance(app, weakref.ref):
+            app = app()
+            if app is None:
+                raise ReferenceError('The App of this Record has been garbage collected')
+        return app
+
+    def _release_app(self):
+        """Only hold a weak reference to the Record's App, used by the App's cached stub record to avoid a reference
+        cycle keeping the App alive after it is evicted from cache
+
+        .. versionadded:: 10.20.0
+        """
+        if not isinstance(self.__app, weakref.ref):
+            self.__app = weakref.ref(self.__app)
+
+    @property
+    def is_partial(self):
+        """True if values of some fields were not retrieved and will be retrieved from the server on first access
+
+        .. versionadded:: 10.20.0
+        """
+        return self.__projection is not None
 
     def __str__(self):
         if self.is_new:
@@ -117,22 +160,68 @@ class Record(APIResource):
 
         return (self.app.name, tracking_number_self) < (other.app.name, tracking_number_other)
 
-    def __premap_fields(self):
-        """Build field instances using field definitions in app manifest
+    def _get_cache_view(self, raw=None):
+        """Return copy of cached record with its own field instances, values, and revisions adapter"""
+        view = super(Record, self)._get_cache_view(raw)
+
+        view.__allowed = list(self.__allowed)
+        view._fields = _RecordFields(view)
+        view.__existing_values = {}
+        view.revisions = type(self.revisions)(view.app, view)
+
+        return view
+
+    def _load_field(self, field_name):
+        """Build field instance using field definition in app manifest
+
+        Map raw record field data into appropriate field instance with its correct respective type, and record the
+        field's existing value to compare against when patching
+
+        Raises:
+            KeyError: If field_name is not a field name in parent App
+        """
+        if field_name not in self.app._fields_by_name:
+            raise KeyError(field_name)
+
+        schema = self.app._get_field_schema(field_name)
+
+        if self.__projection is not None and schema.id not in self.__projection:
+            self.__load_unprojected_values()
 
-        Map raw record field data into appropriate field instances with their correct respective types
+        field_instance = schema.field_class(field_name, self)
+        value = self._raw['values'].get(schema.id)
+        field_instance.set_swimlane(value)
+
+        self.__existing_values[field_name] = field_instance.get_batch_representation()
+
+        return field_instance
+
+    def __load_unprojected_values(self):
+        """Retrieve full record on first access to a value not included in the projection, warning of the request"""
+        logger.warning(
+            'Sending an additional request to retrieve all values of partial record "{}". Use load_partial_records() '
+            'to retrieve many partial records at once'.format(self)
+        )
+        self._load_unprojected_values()
+
+    def _load_unprojected_values(self):
+        """Retrieve full record from server, adding values of fields not included in the projection
+
+        Values already loaded are kept, so pending changes to projected fields are not lost
         """
-        # Circular imports
-        from swimlane.core.fields import resolve_field_class
+        response = self._swimlane.request('get', 'app/{}/record/{}'.format(self.app.id, self.id))
+        full_raw = response.json()
 
-        for field_definition in self.app._raw['fields']:
-            field_class = resolve_field_class(field_definition)
+        for field_id, value in six.iteritems(full_raw['values']):
+            if field_id not in self.__projection:
+                self._raw['values'][field_id] = value
+        for key, value in six.iteritems(full_raw):
+            self._raw.setdefault(key, value)
 
-            field_instance = field_class(field_definition['name'], self)
-            value = self._raw['values'].get(field_instance.id)
-            field_instance.set_swimlane(value)
+        self.__projection = None
 
-            self._fields[field_instance.name] = field_instance
+        # Replace partial record in cache
+        self._swimlane.resources_cache.cache(self)
 
     def get_cache_index_keys(self):
         """Return values available for retrieving records, but only for already existing records"""
@@ -170,8 +259,13 @@ class Record(APIResource):
         Raises:
              ValidationError: If any fields fail validation
         """
-        for field in (_field for _field in six.itervalues(self._fields) if _field.required):
-            if field.get_swimlane() is None:
+        for field_name in self.app._fields_by_name:
+            # Only fields that are required by definition or already loaded can have been made required
+            if not (self.app._get_field_schema(field_name).required or self._fields.is_loaded(field_name)):
+                continue
+
+            field = self._fields[field_name]
+            if field.required and field.get_swimlane() is None:
                 raise ValidationError(
                     self, 'Required field "{}" is not set'.format(field.name))
 
@@ -203,6 +297,9 @@ class Record(APIResource):
         else:
             method = 'put'
 
+        # Load all fields to normalize raw values to their swimlane representations before sending
+        self._fields.load_all()
+
         # Pop off fields with None value to allow for saving empty fields
         copy_raw = copy.copy(self._raw)
         values_dict = {}
@@ -232,7 +329,8 @@ class Record(APIResource):
 
         copy_raw = copy.copy(self._raw)
 
-        pending_values = {k: self.get_field(k).get_batch_representation() for (k, v) in self}
+        # Fields that were never loaded cannot have been modified
+        pending_values = {k: v.get_batch_representation() for (k, v) in six.iteritems(self._fields.loaded)}
         patch_values = {
             self.get_field(k).id: pending_values[k] for k in set(pending_values) & set(self.__existing_values)
             if pending_values[k] != self.__existing_values[k]
@@ -271,6 +369,10 @@ class Record(APIResource):
         if self.is_new:
             raise ValueError('Cannot delete a new Record')
 
+        # Retain all field data on the new record
+        if self.__projection is not None:
+            self.__load_unprojected_values()
+
         self._swimlane.request(
             'delete',
             'app/{}/record/{}'.format(self.app.id, self.id)
@@ -435,6 +537,7 @@ class Record(APIResource):
           self.locked_date = None
     
     def execute_task(self, task_name, timeout=int(20)):
+        self._fields.load_all()
         job_info = swimlane.core.adapters.task.TaskAdapter(self.app._swimlane).execute(task_name, self._raw)
         timeout_start = pendulum.now()
         while pendulum.now() < timeout_start.add(seconds=timeout):
@@ -450,6 +553,119 @@ class Record(APIResource):
             time.sleep(1)
         
 
+class _RecordFields(Mapping):
+    """Mapping of all field names in a Record's App to the Record's Field instances
+
+    Each Field instance is only built the first time it is accessed
+    """
+
+    def __init__(self, record):
+        self.__record_ref = weakref.ref(record)
+        self.loaded = {}
+
+    @property
+    def _record(self):
+        return self.__record_ref()
+
+    def __getitem__(self, field_name):
+        try:
+            return self.loaded[field_name]
+        except KeyError:
+            field = self._record._load_field(field_name)
+            self.loaded[field_name] = field
+            return field
+
+    def __iter__(self):
+        return iter(self._record.app._fields_by_name)
+
+    def __len__(self):
+        return len(self._record.app._fields_by_name)
+
+    def __contains__(self, field_name):
+        return field_name in self._record.app._fields_by_name
+
+    def is_loaded(self, field_name):
+        """Return True if field instance has already been built"""
+        return field_name in self.loaded
+
+    def load_all(self):
+        """Build any remaining field instances"""
+        for field_name in self:
+            self[field_name]
+
+
+class RecordValues(dict):
+    """Lightweight mapping of field names to python values for a single record returned from a search
+
+    .. versionadded:: 10.20.0
+
+    Built directly from raw record data using the App's shared field instances, without creating a Record or any
+    per-record Field instances. Reference fields are represented by record ids, and attachments by their metadata
+
+    Args:
+        app (App): App instance that record belongs to
+        raw (dict): Raw record data from search results
+        projection (frozenset): Ids of the only fields retrieved by a search limited to a subset of columns, other
+            fields are omitted. Defaults to None, including all fields
+
+    Attributes:
+        id (str): Full Record ID
+        tracking_id (str): Record tracking ID
+    """
+
+    __slots__ = ('id', 'tracking_id')
+
+    def __init__(self, app, raw, projection=None):
+        raw_values = raw['values']
+
+        super(RecordValues, self).__init__(
+            (field.name, field.parse_swimlane(raw_values.get(field.id))) for field in app._get_value_fields()
+            if projection is None or field.id in projection
+        )
+
+        self.id = raw['id']
+        self.tracking_id = '-'.join([app.acronym, str(int(raw['trackingId']))])
+
+    def __repr__(self):
+        return '<{}: {}>'.format(self.__class__.__name__, self.tracking_id)
+
+
+def load_partial_records(records, batch_size=10):
+    """Retrieve all field values of many partial records at once
+
+    Partial records returned by searches limited to a subset of columns otherwise each send one request retrieving the
+    full record the first time a value of any other field is accessed. Full records are instead retrieved with up to
+    `batch_size` concurrent requests, and records are no longer partial afterwards. Records that are not partial are
+    skipped
+
+    .. versionadded:: 10.20.0
+
+    Args:
+        records (list(Record)): Records to retrieve all field values of
+        batch_size (int): Max number of concurrent requests retrieving full records. Set 1 to retrieve records one at a
+            time without threads
+
+    Examples:
+
+        ::
+
+            records = app.records.search(limit=0, columns=['Status'])
+            load_partial_records(records)
+
+            for record in records:
+                # No additional requests
+                do_thing(record['Description'])
+    """
+    partial_records = [record for record in records if record.is_partial]
+
+    if batch_size > 1 and len(partial_records) > 1:
+        with ThreadPoolExecutor(max_workers=min(batch_size, len(partial_records))) as executor:
+            list(executor.map(Record._load_unprojected_values, partial_records))
+    else:
+        for record in partial_records:
+            record._load_unprojected_values()
+
+
 def record_factory(app, fields=None):
     """Return a temporary Record instance to be used for field validation and value parsing
 
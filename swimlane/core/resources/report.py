@@ -5,8 +5,12 @@ import json
 from swimlane.core.cursor import PaginatedCursor
 from swimlane.core.fields.list import ListField
 from swimlane.core.resources.base import APIResource
-from swimlane.core.resources.record import Record, record_factory
-from swimlane.core.search import CONTAINS, EQ, EXCLUDES, NOT_EQ, LT, GT, LTE, GTE, ASC, DESC
+from swimlane.core.resources.record import Record, RecordValues
+from swimlane.core.search import (
+    CONTAINS, EQ, EXCLUDES, NOT_EQ, LT, GT, LTE, GTE, ASC, DESC,
+    AVG, COUNT, SUM, MIN, MAX,
+    GB, HOUR, DAY, WEEK, MONTH, QUARTER, YEAR
+)
 from swimlane.utils import validate_type
 
 ALLOWED_OPERATORS = ['Or', 'And']
@@ -21,6 +25,9 @@ class Report(APIResource, PaginatedCursor):
         Record retrieval is lazily evaluated and cached internally, adding a filter and attempting to iterate again will
         not respect the additional filter and will return the same set of records each time
 
+        Streaming reports do not cache records, each iteration sends new search requests and keeps only the current page
+        of results in memory. len() is not supported on streaming reports
+
     Examples:
 
         Lazy retrieval of records with direct iteration over report
@@ -50,6 +57,14 @@ class Report(APIResource, PaginatedCursor):
         limit (int): Max number of records to return from report/search
         page_size (int): Max number of records per page
         keywords (list(str)): List of keywords to use in report/search
+        prefetch (int): Number of page requests to keep in flight concurrently while iterating. Defaults to 0,
+            retrieving one page at a time
+        stream (bool): Yield records without retaining them on the report for single-pass iteration over large results
+        as_dicts (bool): Return lightweight :class:`~swimlane.core.resources.record.RecordValues` mappings of field
+            names to python values instead of full Record instances
+        columns (list(str)): Names or keys of the only fields to retrieve. See :meth:`set_columns`
+        exclude_columns (list(str)): Names or keys of fields not to retrieve, such as large text or JSON fields. Cannot
+            be combined with `columns`. See :meth:`set_columns`
     """
 
     _type = "Core.Models.Search.StatsReport, Core"
@@ -70,6 +85,24 @@ class Report(APIResource, PaginatedCursor):
         DESC
     )
 
+    _AGGREGATE_TYPES = (
+        AVG,
+        COUNT,
+        SUM,
+        MIN,
+        MAX
+    )
+
+    _GROUP_BY_TYPES = (
+        GB,
+        HOUR,
+        DAY,
+        WEEK,
+        MONTH,
+        QUARTER,
+        YEAR
+    )
+
     default_limit = 50
     default_page_start = None
     default_page_end = None
@@ -80,17 +113,36 @@ class Report(APIResource, PaginatedCursor):
                                  limit=kwargs.pop('limit', self.default_limit),
                                  page_size=kwargs.pop('page_size', self.default_page_size),
                                  page_start=kwargs.pop('page_start', self.default_page_start),
-                                 page_end=kwargs.pop('page_end', self.default_page_end)
+                                 page_end=kwargs.pop('page_end', self.default_page_end),
+                                 prefetch=kwargs.pop('prefetch', self.default_prefetch),
+                                 stream=kwargs.pop('stream', self.default_stream)
                                  )
 
         self.name = self._raw['name']
         self.keywords = kwargs.pop('keywords', [])
+        self.as_dicts = kwargs.pop('as_dicts', False)
 
         self._app = app
 
+        # Ids of the only fields retrieved, None when retrieving all fields
+        self._projection = None
+        # Result row keys of aggregates added with aggregate(), by position in raw aggregates
+        self._aggregate_labels = {}
+
         for field_id in self._app._fields_by_id.keys():
             self._raw['columns'].append(field_id)
 
+        columns = kwargs.pop('columns', None)
+        exclude_columns = kwargs.pop('exclude_columns', None)
+        if columns and exclude_columns:
+            raise ValueError('Only one of columns or exclude_columns can be provided')
+        if columns:
+            self.set_columns(*columns)
+        elif exclude_columns:
+            # Resolve field definitions only, without building fields for every remaining column
+            excluded = set(self._app.get_field_definition_by_name(field_name)['id'] for field_name in exclude_columns)
+            self.__set_column_ids([field_id for field_id in self._app._fields_by_id if field_id not in excluded])
+
     def filter_type(self, filter_type):
         filter_type = filter_type.capitalize()
         self.validateOperator(filter_type)
@@ -103,20 +155,30 @@ class Report(APIResource, PaginatedCursor):
     def __str__(self):
         return self.name
 
-    def _retrieve_raw_elements(self, page):
+    def _get_request_body(self):
+        """Return copy of raw report including filter type and keywords for search requests"""
         body = self._raw.copy()
 
-        body['pageSize'] = self.page_size
-        body['offset'] = page
         if(type(self.filter_type) is str):
             body['filterType'] = self.filter_type
         body['keywords'] = ', '.join(self.keywords)
 
+        return body
+
+    def _retrieve_raw_elements(self, page):
+        body = self._get_request_body()
+
+        body['pageSize'] = self.page_size
+        body['offset'] = page
+
         response = self._swimlane.request('post', 'search', json=body)
         return response.json()['results'].get(self._app.id, [])
 
     def _parse_raw_element(self, raw_element):
-        return Record(self._app, raw_element)
+        if self.as_dicts:
+            return RecordValues(self._app, raw_element, self._projection)
+
+        return Record(self._app, raw_element, projection=self._projection)
 
     def filter(self, field_name, operand, value):
         """Adds a filter to report
@@ -162,28 +224,135 @@ class Report(APIResource, PaginatedCursor):
     def set_columns(self, *field_names):
         """Set specified columns for report
 
+        Only values of the specified fields are retrieved. Records returned are partial, each sending one additional
+        request retrieving all other field values the first time any of them is accessed, including when saving, and
+        logging a warning. Use :func:`~swimlane.core.resources.record.load_partial_records` to retrieve many partial
+        records at once. Records returned as dicts only include the specified fields
+
+        .. versionchanged:: 10.20.0
+            Records returned are partial records instead of treating values of other fields as empty, costing one
+            request per record when values of other fields are accessed
+
         Notes:
             The Tracking Id column is always included
 
         Args:
             *field_names (str): Zero or more column names
         """
-        self._raw['columns'] = []
-        for field_name in field_names:
-            field = self._get_stub_field(field_name)
+        self.__set_column_ids([self._get_stub_field(field_name).id for field_name in field_names])
 
-            self._raw['columns'].append(field.id)
+    def __set_column_ids(self, field_ids):
+        """Set columns to field ids, always including Tracking Id"""
+        self._raw['columns'] = list(field_ids)
 
         if self._app.tracking_id not in self._raw['columns']:
             self._raw['columns'].append(self._app.tracking_id)
 
+        self._projection = frozenset(self._raw['columns'])
+
+    def group_by(self, field_name, group_by_type=GB):
+        """Adds a grouping of aggregate results to report
+
+        .. versionadded:: 10.20.0
+
+        Args:
+            field_name (str): Target field name to group by
+            group_by_type (str): One of `groupBy` grouping by each distinct value, or `groupByHour`, `groupByDay`,
+                `groupByWeek`, `groupByMonth`, `groupByQuarter`, or `groupByYear` grouping date fields by period. See
+                `swimlane.core.search` for constants
+        """
+        if group_by_type not in self._GROUP_BY_TYPES:
+            raise ValueError('Group by type must be one of {}'.format(', '.join(self._GROUP_BY_TYPES)))
+
+        field = self._get_stub_field(field_name)
+
+        self._raw['groupBys'].append({
+            "fieldId": field.id,
+            "groupByType": group_by_type
+        })
+
+    def aggregate(self, field_name, aggregate_type, label=None):
+        """Adds an aggregate computed by the server for each group of records to report
+
+        .. versionadded:: 10.20.0
+
+        Args:
+            field_name (str): Target field name to aggregate. May be None for `count` aggregates, counting records
+            aggregate_type (str): One of `average`, `count`, `sum`, `min`, or `max`. See `swimlane.core.search` for
+                constants
+            label (str): Key of aggregate value in rows returned by :meth:`stats`. Defaults to `<type>(<field name>)`,
+                or `count` when counting records
+        """
+        if aggregate_type not in self._AGGREGATE_TYPES:
+            raise ValueError('Aggregate type must be one of {}'.format(', '.join(self._AGGREGATE_TYPES)))
+
+        if field_name is None:
+            if aggregate_type != COUNT:
+                raise ValueError('field_name is required for "{}" aggregates'.format(aggregate_type))
+            field_id = self._app.tracking_id
+        else:
+            field_id = self._get_stub_field(field_name).id
+
+        if label is not None:
+            self._aggregate_labels[len(self._raw['aggregates'])] = label
+
+        self._raw['aggregates'].append({
+            "fieldId": field_id,
+            "aggregateType": aggregate_type
+        })
+
+    def stats(self):
+        """Send report group bys and aggregates to the server, returning one compact row per group instead of records
+
+        .. versionadded:: 10.20.0
+
+        Notes:
+            Filters, filter type, and keywords are applied to select the aggregated records. Columns, sorts, limit, and
+            pagination are ignored
+
+        Returns:
+            :class:`list` of :class:`dict`: One dict per group mapping names of group by fields to the group's values,
+            and aggregate labels to the aggregate values
+
+        Raises:
+            ValueError: If report has no aggregates
+        """
+        if not self._raw['aggregates']:
+            raise ValueError('Report has no aggregates, add at least one with aggregate()')
+
+        group_names = [
+            self._app.get_field_definition_by_id(group['fieldId'])['name'] for group in self._raw['groupBys']
+        ]
+        aggregate_labels = [
+            self._aggregate_labels.get(index) or self.__get_default_aggregate_label(aggregate)
+            for index, aggregate in enumerate(self._raw['aggregates'])
+        ]
+
+        response = self._swimlane.request('post', 'search/stats', json=self._get_request_body())
+
+        rows = []
+        for raw_row in response.json():
+            row = dict(zip(group_names, (group.get('value') for group in raw_row.get('groupBys', []))))
+            row.update(zip(aggregate_labels, (aggregate.get('value') for aggregate in raw_row.get('aggregates', []))))
+            rows.append(row)
+
+        return rows
+
+    def __get_default_aggregate_label(self, aggregate):
+        if aggregate['fieldId'] == self._app.tracking_id and aggregate['aggregateType'] == COUNT:
+            return COUNT
+
+        return '{}({})'.format(
+            aggregate['aggregateType'],
+            self._app.get_field_definition_by_id(aggregate['fieldId'])['name']
+        )
+
     def _get_stub_field(self, field_name):
         if not field_name or not isinstance(field_name, str):
             raise ValueError('field_name is of an invalid format, expected non-empty string')
 
-        # Use temp Record instance for target app to translate values into expected API format
-        record_stub = record_factory(self._app)
-        return record_stub.get_field(field_name)
+        # Use App's stub Record fields to translate values into expected API format
+        return self._app._get_stub_field(field_name)
 
     def parse_field_value(self, field, value):
         if isinstance(field, ListField):
@@ -29,6 +29,13 @@ class RevisionBase(APIResource):
         self._raw_version = self._raw['version']
         self._version = None
 
+    def _get_cache_view(self, raw=None):
+        """Return copy of cached revision building its own version from its own raw data"""
+        view = super(RevisionBase, self)._get_cache_view(raw)
+        view._raw_version = view._raw['version']
+        view._version = None
+        return view
+
     def __str__(self):
         return '{} ({})'.format(self.version, self.revision_number)
 
@@ -100,6 +100,12 @@ class Group(UserGroup):
         self.description = self._raw.get('description')
         self.__users = None
 
+    def _get_cache_view(self, raw=None):
+        """Return copy of cached group with its own users cursor"""
+        view = super(Group, self)._get_cache_view(raw)
+        view.__users = None
+        return view
+
     @property
     def users(self):
         """Returns a GroupUsersCursor with list of User instances for this Group
@@ -0,0 +1,187 @@
+"""Retry policies used by the Swimlane client to decide whether and when to retry failed requests
+
+.. versionadded:: 10.20.0
+"""
+import email.utils
+import math
+import random
+import time
+
+
+class RetryPolicy(object):
+    """Exponential backoff retry policy with full jitter, optional deadline, and Retry-After support
+
+    Delay before retry attempt `n` (starting at 0) is a random value between 0 and
+    ``min(backoff_max, backoff_base * 2 ** n)``, or exactly that cap when jitter is disabled. A `Retry-After` header on
+    a retryable response overrides the computed delay when respected
+
+    Args:
+        max_retries (int): Maximum number of retries after the initial attempt
+        backoff_base (float): Maximum delay in seconds before the first retry, doubled on each following retry
+        backoff_max (float): Upper bound in seconds of any computed delay
+        jitter (bool): Randomize delays between 0 and the computed delay to avoid synchronized retries across clients
+        deadline (float): Maximum total seconds spent on a request including retries and delays. No more retries are
+            attempted once a delay would exceed the deadline. Defaults to no deadline
+        respect_retry_after (bool): Wait the number of seconds or until the date given by a response Retry-After header
+        max_retry_after (float): Upper bound in seconds of any delay requested by a Retry-After header, so a bad header
+            cannot block a request for hours. Defaults to backoff_max
+        retry_statuses (iterable(int)): Response status codes that are retried. Defaults to 429 and all 5xx codes
+        retry_methods (iterable(str)): Request methods retried on retryable status codes. Defaults to all methods
+        idempotent_methods (iterable(str)): Request methods retried on connection errors and timeouts, where the server
+            may have already processed the request. Defaults to GET, HEAD, OPTIONS, PUT, DELETE, and TRACE
+
+    Raises:
+        ValueError: If max_retries or any durations are negative
+
+    Examples:
+
+        ::
+
+            from swimlane import Swimlane
+            from swimlane.core.retry import RetryPolicy
+
+            swimlane = Swimlane(
+                '192.168.1.1',
+                'username',
+                'password',
+                retry_policy=RetryPolicy(max_retries=8, backoff_base=0.5, backoff_max=20, deadline=120)
+            )
+    """
+
+    default_retry_statuses = frozenset([429] + list(range(500, 600)))
+    default_idempotent_methods = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE'])
+
+    def __init__(
+            self,
+            max_retries=5,
+            backoff_base=1.0,
+            backoff_max=30.0,
+            jitter=True,
+            deadline=None,
+            respect_retry_after=True,
+            max_retry_after=None,
+            retry_statuses=default_retry_statuses,
+            retry_methods=None,
+            idempotent_methods=default_idempotent_methods
+    ):
+        if not isinstance(max_retries, int) or max_retries < 0:
+            raise ValueError('max_retries should be a whole number of zero or above')
+        for name, value in (
+                ('backoff_base', backoff_base),
+                ('backoff_max', backoff_max),
+                ('deadline', deadline),
+                ('max_retry_after', max_retry_after)
+        ):
+            if value is not None and value < 0:
+                raise ValueError('{} should not be negative'.format(name))
+
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.deadline = deadline
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(m.upper() for m in retry_methods) if retry_methods is not None else None
+        self.idempotent_methods = frozenset(m.upper() for m in idempotent_methods)
+
+    def __repr__(self):
+        return '<{}: max_retries={}, backoff_base={}, backoff_max={}, deadline={}>'.format(
+            self.__class__.__name__,
+            self.max_retries,
+            self.backoff_base,
+            self.backoff_max,
+            self.deadline
+        )
+
+    def replace(self, **kwargs):
+        """Return a copy of the policy with provided arguments replaced"""
+        options = {
+            'max_retries': self.max_retries,
+            'backoff_base': self.backoff_base,
+            'backoff_max': self.backoff_max,
+            'jitter': self.jitter,
+            'deadline': self.deadline,
+            'respect_retry_after': self.respect_retry_after,
+            'max_retry_after': self.max_retry_after,
+            'retry_statuses': self.retry_statuses,
+            'retry_methods': self.retry_methods,
+            'idempotent_methods': self.idempotent_methods
+        }
+        options.update(kwargs)
+
+        return self.__class__(**options)
+
+    def is_retryable(self, method, response=None, error=None):
+        """Check if a failed request can be retried, ignoring remaining retries and deadline
+
+        Args:
+            method (str): Request method
+            response (requests.Response): Response with an error status code
+            error (Exception): Connection error or timeout raised before a response was received
+
+        Returns:
+            bool: True if request should be retried
+        """
+        method = method.upper()
+
+        if error is not None:
+            return method in self.idempotent_methods
+
+        if response is not None and response.status_code in self.retry_statuses:
+            return self.retry_methods is None or method in self.retry_methods
+
+        return False
+
+    def get_delay(self, attempt, elapsed, response=None):
+        """Return seconds to wait before the next retry, or None if no retries remain
+
+        Args:
+            attempt (int): Number of retries already attempted
+            elapsed (float): Seconds elapsed since the initial attempt was sent
+            response (requests.Response): Retryable error response, checked for a Retry-After header
+
+        Returns:
+            float: Seconds to sleep before retrying, or None if retries or deadline are exhausted
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        delay = self.get_retry_after(response)
+        if delay is None:
+            delay = min(self.backoff_max, self.backoff_base * 2 ** attempt)
+            if self.jitter:
+                delay = random.uniform(0, delay)
+
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+
+        return delay
+
+    def get_retry_after(self, response):
+        """Return seconds to wait requested by response Retry-After header, or None if unavailable or not respected
+
+        Requested delays are limited to max_retry_after seconds. Values that are not a finite number of seconds or a
+        valid date are ignored
+        """
+        if not self.respect_retry_after or response is None:
+            return None
+
+        retry_after = response.headers.get('Retry-After')
+        if not retry_after:
+            return None
+
+        try:
+            delay = float(retry_after)
+            if not math.isfinite(delay):
+                return None
+        except ValueError:
+            try:
+                retry_date = email.utils.parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                return None
+            delay = retry_date.timestamp() - time.time()
+
+        max_retry_after = self.max_retry_after if self.max_retry_after is not None else self.backoff_max
+        return min(max(delay, 0), max_retry_after)
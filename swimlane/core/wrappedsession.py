@@ -1,4 +1,6 @@
 import requests
+from requests.adapters import HTTPAdapter
+
 
 class WrappedSession(requests.Session):
     """A wrapper for requests.Session to override 'verify' property, ignoring REQUESTS_CA_BUNDLE environment variable.
@@ -9,4 +11,46 @@ class WrappedSession(requests.Session):
         if self.verify is False:
             verify = False
 
-        return super(WrappedSession, self).merge_environment_settings(url, proxies, stream, verify, *args, **kwargs)
\ No newline at end of file
+        return super(WrappedSession, self).merge_environment_settings(url, proxies, stream, verify, *args, **kwargs)
+
+
+class JsonResponse(requests.Response):
+    """Response decoding JSON bodies with a JsonBackend directly from response bytes
+
+    Falls back to default requests decoding when called with extra arguments or when the backend cannot decode the
+    content, such as non UTF-8 encoded bodies, raising the usual requests exceptions on invalid documents
+
+    .. versionadded:: 10.20.0
+    """
+
+    __attrs__ = requests.Response.__attrs__ + ['json_backend']
+
+    json_backend = None
+
+    def json(self, **kwargs):
+        if not kwargs and self.json_backend is not None:
+            try:
+                return self.json_backend.loads(self.content)
+            except ValueError:
+                pass
+
+        return super(JsonResponse, self).json(**kwargs)
+
+
+class JsonHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter building JsonResponse instances decoded with the provided JsonBackend
+
+    .. versionadded:: 10.20.0
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ['json_backend']
+
+    def __init__(self, json_backend=None, **kwargs):
+        self.json_backend = json_backend
+        super(JsonHTTPAdapter, self).__init__(**kwargs)
+
+    def build_response(self, req, resp):
+        response = super(JsonHTTPAdapter, self).build_response(req, resp)
+        response.__class__ = JsonResponse
+        response.json_backend = self.json_backend
+        return response
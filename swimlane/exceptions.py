@@ -2,7 +2,7 @@
 
 from difflib import get_close_matches
 
-from requests import HTTPError
+from requests import ConnectionError, HTTPError
 
 
 class SwimlaneException(Exception):
@@ -189,3 +189,22 @@ class SwimlaneHTTP400Error(SwimlaneException, HTTPError):
         super(SwimlaneHTTP400Error, self).__init__(
             '{message}: Bad Request for url: {url}'.format(message=message, url=self.http_error.response.url)
         )
+
+
+class SwimlaneCircuitOpenError(SwimlaneException, ConnectionError):
+    """Raised instead of sending a request while the client circuit breaker is open after repeated server failures
+
+    .. versionadded:: 10.20.0
+
+    Attributes:
+        circuit_breaker (CircuitBreaker): Open circuit breaker rejecting the request
+        retry_after (float): Seconds until probe requests will be allowed
+    """
+
+    def __init__(self, circuit_breaker, retry_after):
+        self.circuit_breaker = circuit_breaker
+        self.retry_after = retry_after
+
+        super(SwimlaneCircuitOpenError, self).__init__(
+            'Circuit breaker is {}, failing fast. Retry in {:.1f} seconds'.format(circuit_breaker.state, retry_after)
+        )
@@ -0,0 +1,105 @@
+"""Copy-on-write views of raw API payloads
+
+.. versionadded:: 10.20.0
+"""
+
+
+def deepcopy_raw(value):
+    """Return a deep copy of a raw JSON-compatible payload
+
+    Much faster than copy.deepcopy for nested dicts and lists. Other values are assumed immutable and are not copied
+    """
+    if isinstance(value, dict):
+        return {key: deepcopy_raw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [deepcopy_raw(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(deepcopy_raw(item) for item in value)
+    return value
+
+
+class CopyOnWriteDict(dict):
+    """dict view of a raw payload snapshot sharing nested containers with the snapshot until they are accessed
+
+    Building a view only copies top-level keys. Nested dicts are wrapped in their own CopyOnWriteDict, and nested lists
+    deep copied, the first time they are accessed by key, so any mutation through the view leaves the snapshot intact.
+    Serializers reading the dict directly see the shared nested values without copying them
+
+    Values reached without key access, through `values()`, `items()`, or iteration over `dict(view)`, are shared with
+    the snapshot and must not be modified
+
+    Args:
+        snapshot (dict): Raw payload never modified through the view
+    """
+
+    __slots__ = ('_owned',)
+
+    def __init__(self, snapshot=()):
+        super(CopyOnWriteDict, self).__init__(snapshot)
+        # Keys whose values are no longer shared with the snapshot
+        self._owned = set()
+
+    def __getitem__(self, key):
+        value = super(CopyOnWriteDict, self).__getitem__(key)
+        if key not in self._owned:
+            self._owned.add(key)
+            if isinstance(value, dict):
+                value = CopyOnWriteDict(value)
+                super(CopyOnWriteDict, self).__setitem__(key, value)
+            elif isinstance(value, (list, tuple)):
+                value = deepcopy_raw(value)
+                super(CopyOnWriteDict, self).__setitem__(key, value)
+        return value
+
+    def __setitem__(self, key, value):
+        self._owned.add(key)
+        super(CopyOnWriteDict, self).__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._owned.discard(key)
+        super(CopyOnWriteDict, self).__delitem__(key)
+
+    def __copy__(self):
+        # Values owned by this view are shared with the copy, so neither owns them
+        return CopyOnWriteDict(self)
+
+    def __deepcopy__(self, memo):
+        return deepcopy_raw(self)
+
+    def __reduce__(self):
+        return dict, (deepcopy_raw(self),)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def pop(self, key, *args):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return super(CopyOnWriteDict, self).pop(key, *args)
+
+    def popitem(self):
+        key, value = super(CopyOnWriteDict, self).popitem()
+        if key not in self._owned:
+            value = deepcopy_raw(value)
+        self._owned.discard(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        self._owned.clear()
+        super(CopyOnWriteDict, self).clear()
+
+    def copy(self):
+        return self.__copy__()
@@ -1,31 +1,176 @@
 import mock
 import pytest
+from requests import HTTPError
 
 
-def test_get(mock_swimlane, mock_app):
-    mock_response = mock.MagicMock()
+def mock_responses(responses):
+    """Return request side effect responding with JSON data by path
 
-    with mock.patch.object(mock_swimlane, 'request', return_value=mock_response):
+    Raises HTTPError with a 404 response for unknown paths, or with the status code of HTTPError responses
+    """
+    def request(method, path, **kwargs):
+        response = responses.get(path, HTTPError(response=mock.MagicMock(status_code=404)))
+        if isinstance(response, HTTPError):
+            raise response
 
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_app._raw
+        mock_response = mock.MagicMock()
+        mock_response.status_code = 200 if responses[path] is not None else 204
+        mock_response.json.return_value = responses[path]
+        return mock_response
 
-        assert mock_swimlane.apps.get(id=mock_app.id).id == mock_app.id
+    return request
+
+
+def light(raw_app):
+    return {key: raw_app[key] for key in ('id', 'name', 'acronym', 'modifiedDate')}
 
-        mock_response.json.return_value = [mock_app._raw]
 
+def test_get(mock_swimlane, mock_app):
+    responses = {
+        'app/{}'.format(mock_app.id): mock_app._raw,
+        'app/light': [light(mock_app._raw)]
+    }
+
+    with mock.patch.object(mock_swimlane, 'request', side_effect=mock_responses(responses)):
+        assert mock_swimlane.apps.get(id=mock_app.id).id == mock_app.id
         assert mock_swimlane.apps.get(name=mock_app.name).id == mock_app.id
-        mock_response.json.return_value = []
+        assert mock_swimlane.apps.get(acronym=mock_app.acronym).id == mock_app.id
 
         with pytest.raises(ValueError):
-            mock_swimlane.apps.get(name=mock_app.name)
+            mock_swimlane.apps.get(name='Missing')
+
+        # Server returns 204 for deleted apps still listed in the index
+        responses['app/{}'.format(mock_app.id)] = None
 
-        mock_response.status_code = 204
+        with pytest.raises(ValueError):
+            mock_swimlane.apps.get(name=mock_app.name)
 
         with pytest.raises(ValueError):
             mock_swimlane.apps.get(id=mock_app.id)
 
 
+def test_get_downloads_single_app(mock_swimlane, mock_app):
+    """Test lookups by name or acronym only download the matching app definition, reusing the light app list"""
+    other_app = dict(mock_app._raw, id='other', name='Other', acronym='OT')
+    responses = {
+        'app/{}'.format(mock_app.id): mock_app._raw,
+        'app/other': other_app,
+        'app/light': [light(mock_app._raw), light(other_app)]
+    }
+
+    with mock.patch.object(mock_swimlane, 'request', side_effect=mock_responses(responses)) as mock_request:
+        assert mock_swimlane.apps.get(name='Other').id == 'other'
+        assert mock_swimlane.apps.get(acronym=mock_app.acronym).id == mock_app.id
+
+        assert [call[0][1] for call in mock_request.call_args_list] == [
+            'app/light',
+            'app/other',
+            'app/{}'.format(mock_app.id)
+        ]
+
+
+def test_get_refreshes_index_on_miss(mock_swimlane, mock_app):
+    """Test apps created since the index was fetched are found"""
+    responses = {
+        'app/{}'.format(mock_app.id): mock_app._raw,
+        'app/light': []
+    }
+
+    with mock.patch.object(mock_swimlane, 'request', side_effect=mock_responses(responses)) as mock_request:
+        with pytest.raises(ValueError):
+            mock_swimlane.apps.get(name=mock_app.name)
+
+        responses['app/light'] = [light(mock_app._raw)]
+
+        assert mock_swimlane.apps.get(name=mock_app.name).id == mock_app.id
+        assert mock_request.call_count == 3
+
+
+def test_get_light_list_unsupported(mock_swimlane, mock_app):
+    """Test lookups fall back to scanning all app definitions"""
+    responses = {'app': [mock_app._raw]}
+
+    with mock.patch.object(mock_swimlane, 'request', side_effect=mock_responses(responses)):
+        assert mock_swimlane.apps.get(name=mock_app.name).id == mock_app.id
+        assert mock_swimlane.apps.get(acronym=mock_app.acronym).id == mock_app.id
+        assert mock_swimlane.apps.index.supported is False
+
+        with pytest.raises(ValueError):
+            mock_swimlane.apps.get(acronym='Missing')
+
+
+@pytest.mark.parametrize('status_code', [405, 404])
+def test_get_light_list_unsupported_status(mock_swimlane, mock_app, status_code):
+    responses = {
+        'app': [mock_app._raw],
+        'app/light': HTTPError(response=mock.MagicMock(status_code=status_code))
+    }
+
+    with mock.patch.object(mock_swimlane, 'request', side_effect=mock_responses(responses)):
+        assert mock_swimlane.apps.get(name=mock_app.name).id == mock_app.id
+        assert mock_swimlane.apps.index.supported is False
+
+
+@pytest.mark.parametrize('status_code', [401, 429, 503])
+def test_get_light_list_transient_error(mock_swimlane, mock_app, status_code):
+    """Test transient light app list errors are raised without disabling the index, keeping the current directory"""
+    responses = {
+        'app/{}'.format(mock_app.id): mock_app._raw,
+        'app/light': HTTPError(response=mock.MagicMock(status_code=status_code))
+    }
+    index = mock_swimlane.apps.index
+
+    with mock.patch.object(mock_swimlane, 'request', side_effect=mock_responses(responses)):
+        with pytest.raises(HTTPError):
+            mock_swimlane.apps.get(name=mock_app.name)
+        assert index.supported is None
+
+        responses['app/light'] = [light(mock_app._raw)]
+        assert mock_swimlane.apps.get(name=mock_app.name).id == mock_app.id
+
+        responses['app/light'] = HTTPError(response=mock.MagicMock(status_code=status_code))
+        with pytest.raises(HTTPError):
+            index.refresh()
+
+        assert index.supported is True
+        assert index.find('acronym', mock_app.acronym)['id'] == mock_app.id
+
+
+def test_list_light_list_transient_error(mock_swimlane, mock_app):
+    """Test app list falls back to downloading all apps when the index cannot be refreshed"""
+    mock_swimlane.app_store = mock.MagicMock()
+    responses = {
+        'app': [mock_app._raw],
+        'app/light': HTTPError(response=mock.MagicMock(status_code=503))
+    }
+
+    with mock.patch.object(mock_swimlane, 'request', side_effect=mock_responses(responses)):
+        assert [app.id for app in mock_swimlane.apps.list()] == [mock_app.id]
+        assert mock_swimlane.apps.index.supported is None
+
+
+def test_index_background_refresh(mock_swimlane, mock_app):
+    responses = {
+        'app/{}'.format(mock_app.id): mock_app._raw,
+        'app/light': [light(mock_app._raw)]
+    }
+    index = mock_swimlane.apps.index
+
+    with mock.patch.object(mock_swimlane, 'request', side_effect=mock_responses(responses)) as mock_request:
+        assert index.find('acronym', mock_app.acronym)['id'] == mock_app.id
+        assert mock_request.call_count == 1
+
+        index.refresh_interval = 0
+        responses['app/light'] = [dict(light(mock_app._raw), name='Renamed')]
+
+        # Current directory returned while refreshing
+        assert index.find('id', mock_app.id)['name'] == mock_app.name
+        index._AppIndex__refresh_thread.join()
+
+        assert index.find('name', 'Renamed')['id'] == mock_app.id
+        assert index.find('name', mock_app.name) is None
+
+
 @pytest.mark.parametrize('kwargs', [
     {'unknown_arg': 'arg'},
     {'name': 'name', 'id': 'id'},
@@ -34,3 +179,21 @@ def test_get(mock_swimlane, mock_app):
 def test_invalid_args(mock_swimlane, kwargs):
     with pytest.raises(TypeError):
         mock_swimlane.apps.get(**kwargs)
+
+
+def test_list_lazy(mock_swimlane, mock_app):
+    """Test list returns a cursor only building Apps when accessed"""
+    raw_apps = [dict(mock_app._raw, id='app{}'.format(index), name='App {}'.format(index)) for index in range(3)]
+
+    with mock.patch.object(mock_swimlane, 'request', side_effect=mock_responses({'app': raw_apps})):
+        apps = mock_swimlane.apps.list()
+
+    assert len(apps) == 3
+    assert apps._elements == [None] * 3
+
+    assert apps[-1].id == 'app2'
+    assert apps[-1] is apps[2]
+    assert apps._elements[:2] == [None, None]
+
+    assert [app.name for app in apps] == ['App 0', 'App 1', 'App 2']
+    assert [app.id for app in apps[1:]] == ['app1', 'app2']
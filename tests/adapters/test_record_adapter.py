@@ -1,10 +1,13 @@
+import copy
 import numbers
 
 import mock
 import pytest
 import six
 
+from swimlane.core import search
 from swimlane.core.bulk import Clear, Replace
+from swimlane.core.resources.record import Record, load_partial_records
 from swimlane.exceptions import UnknownField
 from swimlane.core.adapters.record import validate_filters_or_records_or_ids
 
@@ -125,6 +128,29 @@ def test_search(mock_swimlane, mock_app, mock_record):
     assert parameter['pageSize'] == 1234
 
 
+def test_iter_search(mock_swimlane, mock_app, mock_record):
+    """Test iter_search lazily yields records from a streaming report"""
+    mock_response = mock.MagicMock()
+    mock_response.json.return_value = {
+        '$type': 'API.Models.Search.GroupedSearchResults, API',
+        'count': 1,
+        'limit': 50,
+        'offset': 0,
+        'results': {
+            '$type': 'System.Collections.Generic.Dictionary`2[[System.String, mscorlib],[Core.Models.Record.Record[], Core]], mscorlib',
+            '58e4bb4407637a0e4c4f9873': [mock_record._raw]}}
+
+    with mock.patch.object(mock_swimlane, 'request', return_value=mock_response) as mock_func:
+        with mock.patch('swimlane.core.adapters.report.Report._parse_raw_element', return_value=mock_record):
+            records = mock_app.records.iter_search(('Tracking Id', 'equals', 'RA-7'), limit=0)
+
+            assert not isinstance(records, list)
+            assert mock_func.call_count == 0
+
+            assert list(records) == [mock_record]
+            assert mock_func.call_count == 1
+
+
 def test_bulk_delete(mock_swimlane, mock_app, mock_record):
     # test that requests is called with proper object for filters
     with mock.patch.object(mock_swimlane, 'request') as mock_func:
@@ -337,3 +363,180 @@ def test_bulk_modify_operations(mock_swimlane, mock_app, mock_record):
         }],
         'recordIds': ['58ebb22807637a02d4a14bd6']
     })
+
+
+def test_search_columns_partial_records(mock_swimlane, mock_app, mock_record):
+    """Test searches limited to columns return partial records retrieving other values on first access"""
+    numeric_id = mock_app.get_field_definition_by_name('Numeric')['id']
+    partial_raw = copy.deepcopy(mock_record._raw)
+    partial_raw['values'] = {
+        key: value for key, value in partial_raw['values'].items()
+        if key in ('$type', numeric_id, mock_app.tracking_id)
+    }
+
+    search_response = mock.MagicMock()
+    search_response.json.return_value = {'results': {mock_app.id: [partial_raw]}}
+    record_response = mock.MagicMock()
+    record_response.json.return_value = copy.deepcopy(mock_record._raw)
+
+    with mock.patch.object(mock_swimlane, 'request', return_value=search_response) as mock_func:
+        record, = mock_app.records.search(columns=['Numeric'])
+
+        assert mock_func.call_args[1]['json']['columns'] == [numeric_id, mock_app.tracking_id]
+        assert record.is_partial
+        assert record['Numeric'] == 1
+        assert mock_func.call_count == 1
+
+        record['Numeric'] = 2
+        mock_func.return_value = record_response
+
+        # Unloaded value retrieved instead of treated as empty, keeping pending changes
+        assert record['Action'] == 'authentication failure'
+        assert not record.is_partial
+        assert record['Numeric'] == 2
+        mock_func.assert_called_with('get', 'app/{}/record/{}'.format(mock_app.id, record.id))
+
+        mock_func.reset_mock()
+        record['Action']
+        assert mock_func.call_count == 0
+
+
+def test_search_exclude_columns(mock_swimlane, mock_app, mock_record):
+    search_response = mock.MagicMock()
+    search_response.json.return_value = {'results': {mock_app.id: [mock_record._raw]}}
+
+    with mock.patch.object(mock_swimlane, 'request', return_value=search_response) as mock_func:
+        values, = mock_app.records.search(exclude_columns=['Action', 'action-key'], as_dicts=True)
+
+    columns = mock_func.call_args[1]['json']['columns']
+    assert mock_app.get_field_definition_by_name('Action')['id'] not in columns
+    assert len(columns) == len(mock_app._fields_by_id) - 1
+    assert 'Action' not in values
+    assert values['Numeric'] == 1
+
+
+def test_search_exclude_columns_partial_records(mock_swimlane, mock_app, mock_record):
+    """Test excluded columns are dropped from the request without building fields, returning partial records"""
+    action_id = mock_app.get_field_definition_by_name('Action')['id']
+    partial_raw = copy.deepcopy(mock_record._raw)
+    del partial_raw['values'][action_id]
+    search_response = mock.MagicMock()
+    search_response.json.return_value = {'results': {mock_app.id: [partial_raw]}}
+
+    with mock.patch.object(mock_swimlane, 'request', return_value=search_response) as mock_func, \
+            mock.patch.object(mock_app, '_get_stub_field', wraps=mock_app._get_stub_field) as mock_stub_field:
+        record, = mock_app.records.search(exclude_columns=['Action'])
+
+        mock_stub_field.assert_not_called()
+
+    columns = mock_func.call_args[1]['json']['columns']
+    assert action_id not in columns
+    assert set(columns) == set(mock_app._fields_by_id) - {action_id}
+    assert record.is_partial
+    assert record['Numeric'] == 1
+
+
+def test_search_columns_and_exclude_columns(mock_app):
+    with pytest.raises(ValueError):
+        mock_app.records.search(columns=['Numeric'], exclude_columns=['Action'])
+
+
+def test_partial_record_save_retrieves_values(mock_swimlane, mock_app, mock_record):
+    """Test saving a partial record sends all field values"""
+    numeric_id = mock_app.get_field_definition_by_name('Numeric')['id']
+    action_id = mock_app.get_field_definition_by_name('Action')['id']
+    partial_raw = copy.deepcopy(mock_record._raw)
+    del partial_raw['values'][action_id]
+    record = Record(mock_app, partial_raw, projection=frozenset([numeric_id, mock_app.tracking_id]))
+
+    record_response = mock.MagicMock()
+    record_response.json.return_value = copy.deepcopy(mock_record._raw)
+
+    with mock.patch.object(mock_swimlane, 'request', return_value=record_response) as mock_func:
+        record.save()
+
+    saved_values = mock_func.call_args[1]['json']['values']
+    assert saved_values[action_id] == 'authentication failure'
+    assert mock_func.call_args_list[0][0] == ('get', 'app/{}/record/{}'.format(mock_app.id, mock_record.id))
+
+
+def test_partial_record_load_warning(mock_swimlane, mock_app, mock_record, caplog):
+    """Test retrieving the full record on access to an unloaded value logs a warning"""
+    numeric_id = mock_app.get_field_definition_by_name('Numeric')['id']
+    record = Record(mock_app, copy.deepcopy(mock_record._raw), projection=frozenset([numeric_id]))
+
+    record_response = mock.MagicMock()
+    record_response.json.return_value = copy.deepcopy(mock_record._raw)
+
+    with mock.patch.object(mock_swimlane, 'request', return_value=record_response):
+        record['Numeric']
+        assert not caplog.records
+
+        record['Action']
+
+    assert len(caplog.records) == 1
+    assert caplog.records[0].levelname == 'WARNING'
+    assert 'load_partial_records' in caplog.records[0].getMessage()
+
+
+@pytest.mark.parametrize('batch_size', [1, 10])
+def test_load_partial_records(mock_swimlane, mock_app, mock_record, caplog, batch_size):
+    """Test loading many partial records sends one request per partial record, then none on access"""
+    numeric_id = mock_app.get_field_definition_by_name('Numeric')['id']
+    full_raws = {}
+    records = []
+    for index in range(3):
+        raw = copy.deepcopy(mock_record._raw)
+        raw['id'] = 'record_{}'.format(index)
+        full_raws['app/{}/record/{}'.format(mock_app.id, raw['id'])] = raw
+        records.append(Record(mock_app, copy.deepcopy(raw), projection=frozenset([numeric_id])))
+    records.append(mock_record)
+
+    def request(method, endpoint, **kwargs):
+        response = mock.MagicMock()
+        response.json.return_value = copy.deepcopy(full_raws[endpoint])
+        return response
+
+    with mock.patch.object(mock_swimlane, 'request', side_effect=request) as mock_func:
+        load_partial_records(records, batch_size=batch_size)
+
+        assert sorted(call[0][1] for call in mock_func.call_args_list) == sorted(full_raws)
+
+        mock_func.reset_mock()
+        for record in records:
+            assert not record.is_partial
+            assert record['Action'] == 'authentication failure'
+        mock_func.assert_not_called()
+
+    assert not caplog.records
+
+
+def test_aggregate(mock_swimlane, mock_app):
+    """Test aggregate sends group bys and metrics in a single stats request and returns compact rows"""
+    mock_response = mock.MagicMock()
+    mock_response.json.return_value = [
+        {'groupBys': [{'value': 'High'}, {'value': '2017-04-01T00:00:00Z'}], 'aggregates': [{'value': 2}, {'value': 5}]}
+    ]
+
+    with mock.patch.object(mock_swimlane, 'request', return_value=mock_response) as mock_func:
+        rows = mock_app.records.aggregate(
+            ('Numeric', 'greaterThan', 1),
+            group_by=['Severity', ('Incident Created', search.MONTH)],
+            metrics={'records': search.COUNT, 'total': (search.SUM, 'Numeric')},
+            filter_type='or'
+        )
+
+    assert rows == [{'Severity': 'High', 'Incident Created': '2017-04-01T00:00:00Z', 'records': 2, 'total': 5}]
+    mock_func.assert_called_once_with('post', 'search/stats', json=mock.ANY)
+    body = mock_func.call_args[1]['json']
+    assert body['filterType'] == 'Or'
+    assert [group['groupByType'] for group in body['groupBys']] == [search.GB, search.MONTH]
+    assert [aggregate['aggregateType'] for aggregate in body['aggregates']] == [search.COUNT, search.SUM]
+
+
+def test_aggregate_count_all(mock_swimlane, mock_app):
+    mock_response = mock.MagicMock()
+    mock_response.json.return_value = [{'aggregates': [{'value': 42}]}]
+
+    with mock.patch.object(mock_swimlane, 'request', return_value=mock_response):
+        assert mock_app.records.aggregate() == [{'count': 42}]
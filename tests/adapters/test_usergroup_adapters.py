@@ -55,6 +55,17 @@ def test_user_list(mock_user, mock_swimlane):
             assert isinstance(user, User)
 
 
+def test_user_list_stream(mock_user, mock_swimlane):
+    """Test streaming user list does not retain User instances"""
+    mock_response = mock.MagicMock()
+    mock_response.json.return_value = {'items': [mock_user._raw for _ in range(3)]}
+
+    with mock.patch.object(mock_swimlane, 'request', return_value=mock_response):
+        users = mock_swimlane.users.list(stream=True)
+        assert all(isinstance(user, User) for user in users)
+        assert users._elements == []
+
+
 def test_user_get(mock_user, mock_swimlane):
     mock_response = mock.MagicMock()
 
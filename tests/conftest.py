@@ -3840,4 +3840,4 @@ def fixture_mock_task_adapter(mock_swimlane):
     yield TaskAdapter(mock_swimlane)
 
 
-pytest_plugins = ['conftest_revisions']
+pytest_plugins = ['conftest_revisions', 'conftest_server']
@@ -0,0 +1,126 @@
+"""Local fake Swimlane server used to test the client against real HTTP connections"""
+import gzip
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import jwt
+import pendulum
+import pytest
+
+
+class FakeSwimlaneServer(object):
+    """Minimal threaded Swimlane API serving a single app and its records
+
+    Additional routes can be registered with add_route, taking precedence over default routes
+    """
+
+    def __init__(self, raw_app, raw_record):
+        self.raw_app = raw_app
+        self.raw_record = raw_record
+        self.login_count = 0
+        self.request_count = 0
+        self.lock = threading.Lock()
+        self.routes = []
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            # Support keep-alive connections
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.handle(self)
+
+            def do_POST(self):
+                server.handle(self)
+
+            def do_PUT(self):
+                server.handle(self)
+
+            def do_DELETE(self):
+                server.handle(self)
+
+        self.add_route('POST', r'/api/user/login', self.login)
+        self.add_route('GET', r'/api/app/{}'.format(raw_app['id']), lambda handler, match: (200, self.raw_app))
+        self.add_route(
+            'GET',
+            r'/api/app/{}/record/(\w+)'.format(raw_app['id']),
+            lambda handler, match: (200, dict(self.raw_record, id=match.group(1)))
+        )
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = 'http://127.0.0.1:{}'.format(self.httpd.server_address[1])
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def add_route(self, method, pattern, func):
+        """Register func(handler, match) returning (status, data) or (status, data, headers) for method and path
+
+        Request body is available as handler.body. Response data is gzip compressed when headers include a gzip
+        Content-Encoding
+        """
+        self.routes.insert(0, (method, re.compile('^{}$'.format(pattern)), func))
+
+    def login(self, handler, match):
+        with self.lock:
+            self.login_count += 1
+        # Widen window for concurrent logins
+        time.sleep(0.05)
+        token = jwt.encode(
+            {'exp': pendulum.now().add(hours=1).int_timestamp},
+            'fake-server-signing-secret-of-32-bytes',
+            algorithm='HS256'
+        )
+        return 200, {'token': token, 'id': 'aLq_qiBYRrU8h', 'name': 'admin'}
+
+    def handle(self, handler):
+        with self.lock:
+            self.request_count += 1
+
+        handler.body = b''
+        if handler.headers.get('Content-Length'):
+            handler.body = handler.rfile.read(int(handler.headers['Content-Length']))
+
+        for method, pattern, func in self.routes:
+            match = pattern.match(handler.path)
+            if method == handler.command and match:
+                if handler.path != '/api/user/login' and not handler.headers.get('Authorization'):
+                    return self.respond(handler, 401, {'error': 'unauthorized'})
+
+                return self.respond(handler, *func(handler, match))
+
+        self.respond(handler, 404, {})
+
+    def respond(self, handler, status, data, headers=None):
+        body = json.dumps(data).encode('utf-8')
+        if (headers or {}).get('Content-Encoding') == 'gzip':
+            body = gzip.compress(body)
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            handler.send_header(key, value)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def fake_server(mock_app, mock_record):
+    """Running FakeSwimlaneServer serving mock_app and copies of mock_record"""
+    with FakeSwimlaneServer(mock_app._raw, mock_record._raw) as server:
+        yield server
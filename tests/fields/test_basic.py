@@ -7,6 +7,7 @@ import six
 from swimlane.core.fields import resolve_field_class, _FIELD_TYPE_MAP, Field, _build_field_type_map
 from swimlane.core.fields.base import ReadOnly, FieldCursor
 from swimlane.core.fields.list import ListField
+from swimlane.core.resources.record import record_factory
 from swimlane.exceptions import ValidationError
 from swimlane.utils import get_recursive_subclasses
 
@@ -96,3 +97,38 @@ def test_all_fields_empty_value(mock_record, field_class):
 
             else:
                 assert swimlane is python is None
+
+
+def test_field_schema_shared_between_records(mock_record):
+    """Test field metadata is compiled once per App field and shared by all record field instances"""
+    other_record = record_factory(mock_record.app)
+
+    field = mock_record._fields['Numeric']
+    other_field = other_record._fields['Numeric']
+
+    assert field is not other_field
+    assert field._schema is other_field._schema is mock_record.app._get_field_schema('Numeric')
+    assert field.field_definition is mock_record.app.get_field_definition_by_name('Numeric')
+
+    # Overriding per instance values does not affect shared schema or other records
+    field.required = True
+    assert field._schema.required is False
+    assert other_field.required is False
+
+
+def test_field_attributes_writable(mock_record):
+    """Test field metadata and other attributes remain assignable per instance"""
+    field = mock_record._fields['Numeric']
+    other_field = record_factory(mock_record.app)._fields['Numeric']
+
+    field.key = 'other-key'
+    field.id = 'other-id'
+    field.input_type = 'other-input-type'
+    field.custom = 'value'
+
+    assert (field.key, field.id, field.input_type, field.custom) == (
+        'other-key', 'other-id', 'other-input-type', 'value'
+    )
+    assert other_field.key == field._schema.key != 'other-key'
+    assert other_field.id == field._schema.id != 'other-id'
+    assert other_field.input_type == field._schema.input_type
@@ -1,8 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import mock
 import pytest
 
-from swimlane.core.fields.reference import ReferenceCursor
-from swimlane.core.resources.record import Record
+from swimlane.core.fields.reference import ReferenceCursor, _fetch_records, prefetch_references
+from swimlane.core.resources.record import Record, record_factory
 from swimlane.core.resources.app import App
 from swimlane.exceptions import ValidationError, SwimlaneHTTP400Error
 
@@ -134,3 +136,94 @@ class TestReferenceField(object):
         field.set_swimlane(value)
 
         assert set(field._value.keys()) == set(record_ids)
+
+    def test_batch_resolution(self, mock_app, mock_record):
+        """Test iteration resolves referenced records in batches, caching them on the cursor"""
+        field = mock_record.get_field(self.multi_field_name)
+        field._ReferenceField__target_app = mock_app
+        reference_cursor = mock_record[self.multi_field_name]
+        reference_cursor.batch_size = 2
+
+        with mock.patch('swimlane.core.fields.reference._fetch_records', wraps=_fetch_records) as mock_fetch:
+            with mock.patch.object(mock_app.records, 'get', return_value=mock_record) as mock_record_get:
+                assert len(list(reference_cursor)) == 3
+                assert mock_record_get.call_count == 3
+                assert [len(call[0][1]) for call in mock_fetch.call_args_list] == [2, 1]
+
+                # Already resolved records are not requested again
+                assert len(list(reference_cursor)) == 3
+                assert reference_cursor[0] is mock_record
+                assert mock_record_get.call_count == 3
+
+    def test_concurrent_resolution_by_default(self, mock_app, mock_record):
+        """Test iteration and slices retrieve referenced records concurrently, bounded by the client setting"""
+        field = mock_record.get_field(self.multi_field_name)
+        field._ReferenceField__target_app = mock_app
+        mock_app._swimlane.reference_batch_size = 2
+
+        with mock.patch('swimlane.core.fields.reference.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as executor:
+            with mock.patch.object(mock_app.records, 'get', return_value=mock_record) as mock_record_get:
+                assert len(mock_record[self.multi_field_name][0:3]) == 3
+                assert mock_record_get.call_count == 3
+
+        executor.assert_called_once_with(max_workers=2)
+
+    def test_sequential_resolution(self, mock_app, mock_record):
+        """Test cursors with a batch size of 1 retrieve referenced records without a thread pool"""
+        field = mock_record.get_field(self.multi_field_name)
+        field._ReferenceField__target_app = mock_app
+        reference_cursor = mock_record[self.multi_field_name]
+        reference_cursor.batch_size = 1
+
+        with mock.patch('swimlane.core.fields.reference.ThreadPoolExecutor') as executor:
+            with mock.patch.object(mock_app.records, 'get', return_value=mock_record) as mock_record_get:
+                assert len(list(reference_cursor)) == 3
+                assert mock_record_get.call_count == 3
+
+        executor.assert_not_called()
+
+    def test_prefetch_references(self, mock_app, mock_record):
+        """Test resolving references across multiple records retrieves each referenced record once"""
+        records = [mock_record, record_factory(mock_app)]
+        records[1][self.multi_field_name] = None
+        records[1].get_field(self.multi_field_name).set_swimlane(list(mock_record._raw['values'][
+            mock_record.get_field(self.multi_field_name).id
+        ]))
+
+        with mock.patch.object(mock_app._swimlane.apps, 'get', return_value=mock_app):
+            with mock.patch.object(mock_app.records, 'get', return_value=mock_record) as mock_record_get:
+                resolved = prefetch_references(records, self.multi_field_name)
+
+                assert len(resolved) == 3
+                assert mock_record_get.call_count == 3
+
+                for record in records:
+                    assert list(record[self.multi_field_name]) == [mock_record] * 3
+                assert mock_record_get.call_count == 3
+
+    def test_prefetch_references_invalid_field(self, mock_record):
+        """Test prefetch_references requires a reference field"""
+        with pytest.raises(ValueError):
+            prefetch_references([mock_record], 'Numeric')
+
+    def test_indexed_access(self, mock_app, mock_record):
+        """Test index and slice access resolve only the requested referenced records"""
+        field = mock_record.get_field(self.multi_field_name)
+        field._ReferenceField__target_app = mock_app
+        reference_cursor = mock_record[self.multi_field_name]
+        record_ids = list(reference_cursor._elements.keys())
+
+        with mock.patch.object(mock_app.records, 'get', return_value=mock_record) as mock_record_get:
+            assert reference_cursor[-1] is mock_record
+            mock_record_get.assert_called_once_with(id=record_ids[-1])
+
+            assert reference_cursor[:2] == [mock_record, mock_record]
+            assert mock_record_get.call_count == 3
+
+            # All records resolved, slices and indexes no longer send requests
+            assert reference_cursor[::-1] == [mock_record] * 3
+            assert reference_cursor[1] is mock_record
+            assert mock_record_get.call_count == 3
+
+        with pytest.raises(IndexError):
+            reference_cursor[3]
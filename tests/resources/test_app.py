@@ -1,7 +1,11 @@
 import copy
+import gc
+import weakref
+
 import pytest
 
 from swimlane.core.adapters import AppRevisionAdapter
+from swimlane.core.resources.app import App
 from swimlane.exceptions import UnknownField
 
 
@@ -72,3 +76,53 @@ class TestApp(object):
 
     def test_revisions(self, mock_app):
         assert isinstance(mock_app.revisions, AppRevisionAdapter)
+
+    def test_lazy_field_maps(self, mock_swimlane, mock_app):
+        """Test field definitions are only parsed and adapters only created on first use"""
+        app = App(mock_swimlane, mock_app._raw)
+
+        assert app._App__field_maps is None
+        assert 'records' not in app.__dict__
+
+        assert app.get_field_definition_by_name('Numeric')['name'] == 'Numeric'
+        assert app._App__field_maps is not None
+        assert app.records is app.records
+        assert app.reports._app is app
+
+    def test_lazy_adapters_rebound_on_cache_views(self, mock_app):
+        mock_app.records
+        snapshot = mock_app._get_cache_snapshot()
+        view = snapshot._get_cache_view()
+
+        assert view.records is not mock_app.records
+        assert view.records._app is view
+        assert view.revisions._app is view
+        # Field definitions parsed once and shared by all views
+        assert view._fields_by_name is snapshot._get_cache_view()._fields_by_name
+
+    def test_stub_record_does_not_keep_app_alive(self, mock_swimlane, mock_app):
+        """Test cached stub record creates no reference cycle, freeing the App without the cycle collector once
+        evicted from cache"""
+        gc.collect()
+        gc.disable()
+        try:
+            app = App(mock_swimlane, mock_app._raw)
+            assert app._get_stub_field('Numeric').record.app is app
+            assert app._get_value_fields()
+
+            app_ref = weakref.ref(app)
+            mock_swimlane.resources_cache.clear()
+            del app
+
+            assert app_ref() is None
+        finally:
+            gc.enable()
+
+    def test_stub_record_bound_to_cache_views(self, mock_swimlane, mock_app):
+        app = App(mock_swimlane, mock_app._raw)
+        app._get_stub_record()
+        view = app._get_cache_snapshot()._get_cache_view()
+        del app
+
+        assert view._get_stub_record().app is view
+        assert view._get_stub_field('Numeric').name == 'Numeric'
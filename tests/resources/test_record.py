@@ -157,6 +157,29 @@ class TestRecord(object):
         with pytest.raises(ValidationError):
             mock_record.validate()
 
+    def test_lazy_field_loading(self, mock_app, mock_record):
+        """Test fields are only instantiated when accessed, and unloaded fields are left out of patches"""
+        record = Record(mock_app, mock_record._raw)
+
+        assert record._fields.loaded == {}
+        assert len(record._fields) == len(mock_app._fields_by_name)
+
+        assert record['Action'] == mock_record['Action']
+        assert list(record._fields.loaded) == ['Action']
+
+        with mock.patch.object(record._swimlane, 'request') as mock_request:
+            mock_request.return_value.json.return_value = record._raw
+
+            record['Action'] = 'modified'
+            record.patch()
+
+            patch_values = mock_request.call_args[1]['json']['values']
+            assert set(patch_values) == {'$type', record.get_field('Action').id}
+
+        # Iteration loads all fields
+        assert len(list(record)) == len(mock_app._fields_by_name)
+        assert len(record._fields.loaded) == len(mock_app._fields_by_name)
+
     def test_ordering(self, mock_record, mock_app):
         record_copy = Record(mock_record.app, mock_record._raw)
 
@@ -1,6 +1,9 @@
 import mock
 import pytest
 
+from swimlane.core import search
+
+from swimlane.core.resources.record import Record, RecordValues, record_factory
 from swimlane.core.resources.report import report_factory
 from swimlane.exceptions import UnknownField
 
@@ -26,6 +29,77 @@ class TestReport(object):
 
         assert len(mock_report._raw['filters']) == 1
 
+    def test_stub_fields_shared(self, mock_app):
+        """Test filters, sorts, and columns use the App's stub record fields instead of building a Record each call"""
+        report = report_factory(mock_app, 'stub-fields')
+
+        with mock.patch('swimlane.core.resources.record.record_factory', wraps=record_factory) as mock_factory:
+            for _ in range(20):
+                report.filter('Tracking Id', 'equals', 'RA-7')
+            report.sort('Tracking Id', 'ascending')
+            report.set_columns('Tracking Id', 'Action')
+
+            assert len(report._raw['filters']) == 20
+            assert mock_factory.call_count <= 1
+
+        assert report._get_stub_field('Tracking Id') is mock_app._get_stub_record().get_field('Tracking Id')
+
+    def test_group_by_and_aggregate(self, mock_app):
+        report = report_factory(mock_app, 'stats')
+
+        with pytest.raises(ValueError):
+            report.group_by('Severity', 'groupByDecade')
+        with pytest.raises(ValueError):
+            report.aggregate('Numeric', 'median')
+        with pytest.raises(ValueError):
+            report.aggregate(None, search.SUM)
+        with pytest.raises(UnknownField):
+            report.aggregate('Unknown', search.SUM)
+
+        report.group_by('Severity')
+        report.group_by('Incident Created', search.MONTH)
+        report.aggregate(None, search.COUNT)
+        report.aggregate('Numeric', search.SUM, label='total')
+
+        assert report._raw['groupBys'] == [
+            {'fieldId': mock_app.get_field_definition_by_name('Severity')['id'], 'groupByType': search.GB},
+            {'fieldId': mock_app.get_field_definition_by_name('Incident Created')['id'], 'groupByType': search.MONTH}
+        ]
+        assert report._raw['aggregates'] == [
+            {'fieldId': mock_app.tracking_id, 'aggregateType': search.COUNT},
+            {'fieldId': mock_app.get_field_definition_by_name('Numeric')['id'], 'aggregateType': search.SUM}
+        ]
+
+    def test_stats(self, mock_app, mock_swimlane):
+        report = report_factory(mock_app, 'stats')
+        report.filter('Numeric', search.GT, 1)
+
+        with pytest.raises(ValueError):
+            report.stats()
+
+        report.group_by('Severity')
+        report.aggregate(None, search.COUNT)
+        report.aggregate('Numeric', search.MAX)
+
+        mock_response = mock.MagicMock()
+        mock_response.json.return_value = [
+            {'groupBys': [{'value': 'High'}], 'aggregates': [{'value': 3}, {'value': 10}]},
+            {'groupBys': [{'value': 'Low'}], 'aggregates': [{'value': 1}, {'value': 2}]}
+        ]
+
+        with mock.patch.object(mock_swimlane, 'request', return_value=mock_response) as mock_request:
+            rows = report.stats()
+
+        assert rows == [
+            {'Severity': 'High', 'count': 3, 'max(Numeric)': 10},
+            {'Severity': 'Low', 'count': 1, 'max(Numeric)': 2}
+        ]
+        mock_request.assert_called_once_with('post', 'search/stats', json=mock.ANY)
+        body = mock_request.call_args[1]['json']
+        assert len(body['filters']) == 1
+        assert len(body['aggregates']) == 2
+        assert 'pageSize' not in body
+
     def test_parse_raw_element(self, mock_app, mock_record):
         """Test _parse_raw_element does not retrieve full record"""
         with mock.patch.object(mock_app.records, 'get') as mock_request:
@@ -89,3 +163,23 @@ class TestReport(object):
                 assert mock_request.call_count == 1
 
 
+    def test_as_dicts(self, mock_app, mock_record):
+        """Test as_dicts reports parse results into RecordValues without building Record instances"""
+        report = report_factory(mock_app, 'as_dicts', as_dicts=True)
+
+        # Shared stub record is built once per App
+        mock_app._get_value_fields()
+
+        with mock.patch.object(Record, '__init__', side_effect=AssertionError) as mock_record_init:
+            values = report._parse_raw_element(mock_record._raw)
+
+            assert mock_record_init.call_count == 0
+
+        assert isinstance(values, RecordValues)
+        assert values.id == mock_record.id
+        assert values.tracking_id == mock_record.tracking_id
+        assert values['Action'] == mock_record['Action']
+        assert values['Status'] == mock_record['Status']
+        assert values['Incident Created'] == mock_record['Incident Created']
+        assert sorted(values['Values List']) == list(mock_record['Values List'])
+        assert 'Additional Crowdstrike Comments' not in values
@@ -0,0 +1,235 @@
+import copy
+import sqlite3
+
+import mock
+import pytest
+
+from swimlane.core.appstore import AppStore
+from swimlane.core.client import Swimlane
+
+
+@pytest.fixture
+def app_server(fake_server):
+    """fake_server also serving full and light app lists, counting requests by path"""
+    fake_server.paths = []
+    fake_server.light_supported = True
+    raw_apps = {fake_server.raw_app['id']: fake_server.raw_app}
+
+    def record(func):
+        def wrapper(handler, match):
+            fake_server.paths.append(handler.path)
+            return func(handler, match)
+        return wrapper
+
+    def light(handler, match):
+        if not fake_server.light_supported:
+            return 404, {}
+        return 200, [
+            {'id': raw['id'], 'name': raw['name'], 'acronym': raw['acronym'], 'modifiedDate': raw['modifiedDate']}
+            for raw in raw_apps.values()
+        ]
+
+    def get_app(handler, match):
+        if match.group(1) not in raw_apps:
+            return 204, {}
+        return 200, raw_apps[match.group(1)]
+
+    fake_server.add_route('GET', r'/api/app', record(lambda handler, match: (200, list(raw_apps.values()))))
+    fake_server.add_route('GET', r'/api/app/(\w+)', record(get_app))
+    fake_server.add_route('GET', r'/api/app/light', record(light))
+    fake_server.raw_apps = raw_apps
+
+    return fake_server
+
+
+def connect(server, app_store):
+    return Swimlane(server.url, 'admin', 'password', verify_server_version=False, app_store=app_store)
+
+
+def test_warm_start_skips_app_download(app_server, tmp_path):
+    path = str(tmp_path / 'apps.db')
+    app_name = app_server.raw_app['name']
+
+    # Cold start downloads full definition
+    swimlane = connect(app_server, path)
+    assert swimlane.apps.get(name=app_name).id == app_server.raw_app['id']
+    assert app_server.paths == ['/api/app/light', '/api/app/{}'.format(app_server.raw_app['id'])]
+
+    del app_server.paths[:]
+    swimlane = connect(app_server, path)
+    app = swimlane.apps.get(name=app_name)
+
+    assert app.id == app_server.raw_app['id']
+    assert app_server.paths == ['/api/app/light']
+
+
+def test_modified_app_downloaded(app_server, tmp_path):
+    store = AppStore(str(tmp_path / 'apps.db'))
+    app_id = app_server.raw_app['id']
+    swimlane = connect(app_server, store)
+    swimlane.apps.get(name=app_server.raw_app['name'])
+
+    modified = copy.deepcopy(app_server.raw_app)
+    modified['description'] = 'Modified'
+    modified['modifiedDate'] = '2018-01-01T00:00:00.000Z'
+    app_server.raw_apps[app_id] = modified
+    del app_server.paths[:]
+
+    swimlane = connect(app_server, store)
+    app = swimlane.apps.get(name=app_server.raw_app['name'])
+
+    assert app.description == 'Modified'
+    assert app_server.paths == ['/api/app/light', '/api/app/{}'.format(app_id)]
+    assert store.get_app(str(swimlane.host), app_id)[0] == modified['modifiedDate']
+
+
+def test_list_only_downloads_changed_apps(app_server, tmp_path):
+    store = AppStore(str(tmp_path / 'apps.db'))
+    app_id = app_server.raw_app['id']
+    for index in range(3):
+        raw = dict(app_server.raw_app, id='app{}'.format(index), name='App {}'.format(index))
+        app_server.raw_apps[raw['id']] = raw
+
+    swimlane = connect(app_server, store)
+    assert len(swimlane.apps.list()) == 4
+    assert app_server.paths == ['/api/app/light', '/api/app']
+
+    app_server.raw_apps['app0'] = dict(app_server.raw_apps['app0'], modifiedDate='2018-01-01T00:00:00.000Z')
+    del app_server.raw_apps['app1']
+    del app_server.paths[:]
+
+    swimlane = connect(app_server, store)
+    apps = swimlane.apps.list()
+
+    assert [app.id for app in apps] == [app_id, 'app0', 'app2']
+    assert app_server.paths == ['/api/app/light', '/api/app/app0']
+    # Deleted app removed from store
+    assert set(store.get_apps(str(swimlane.host))) == {app_id, 'app0', 'app2'}
+
+
+def test_missing_app_name(app_server, tmp_path):
+    swimlane = connect(app_server, str(tmp_path / 'apps.db'))
+
+    with pytest.raises(ValueError):
+        swimlane.apps.get(name='Missing App')
+    assert app_server.paths == ['/api/app/light']
+
+
+def test_max_age_skips_validation(app_server, tmp_path):
+    store = AppStore(str(tmp_path / 'apps.db'), max_age=60)
+    app_id = app_server.raw_app['id']
+    swimlane = connect(app_server, store)
+    swimlane.apps.get(id=app_id)
+    del app_server.paths[:]
+
+    swimlane = connect(app_server, store)
+    assert swimlane.apps.get(id=app_id).id == app_id
+    assert swimlane.apps.get(name=app_server.raw_app['name']).id == app_id
+    assert app_server.paths == []
+
+
+def test_lookup_without_max_age_skips_stored_apps(app_server, tmp_path):
+    """Test stored apps are not read by name or id when they are always validated against the light app list"""
+    store = AppStore(str(tmp_path / 'apps.db'))
+    swimlane = connect(app_server, store)
+    swimlane.apps.get(name=app_server.raw_app['name'])
+    swimlane = connect(app_server, store)
+
+    with mock.patch.object(store, 'get_apps') as get_apps, \
+            mock.patch.object(store, 'find_app') as find_app, \
+            mock.patch.object(store, 'get_app', wraps=store.get_app) as get_app:
+        assert swimlane.apps.get(name=app_server.raw_app['name']).id == app_server.raw_app['id']
+
+    get_apps.assert_not_called()
+    find_app.assert_not_called()
+    # Only the app matching the light app summary is read
+    get_app.assert_called_once_with(str(swimlane.host), app_server.raw_app['id'])
+
+
+def test_find_app(tmp_path, mock_app):
+    store = AppStore(str(tmp_path / 'apps.db'))
+    other = dict(mock_app._raw, id='other', name='Other', acronym='OTH')
+    store.put_apps('https://one', [mock_app._raw, other])
+
+    assert store.find_app('https://one', 'name', 'Other')[2]['id'] == 'other'
+    assert store.find_app('https://one', 'acronym', mock_app.acronym)[2]['id'] == mock_app.id
+    assert store.find_app('https://one', 'id', 'other')[2]['name'] == 'Other'
+    assert store.find_app('https://one', 'name', 'Missing') is None
+    assert store.find_app('https://two', 'name', 'Other') is None
+
+    with pytest.raises(ValueError):
+        store.find_app('https://one', 'description', 'Other')
+
+
+def test_outdated_schema_recreated(tmp_path, mock_app):
+    path = str(tmp_path / 'apps.db')
+    connection = sqlite3.connect(path)
+    connection.execute('CREATE TABLE apps (host TEXT, id TEXT, modified_date TEXT, stored_at REAL, raw BLOB)')
+    connection.commit()
+    connection.close()
+
+    store = AppStore(path)
+    store.put_apps('https://one', [mock_app._raw])
+
+    assert store.find_app('https://one', 'name', mock_app.name)[2]['id'] == mock_app.id
+
+
+def test_light_list_unsupported(app_server, tmp_path):
+    """Test full app list is downloaded and stored when stored apps cannot be validated"""
+    app_server.light_supported = False
+    store = AppStore(str(tmp_path / 'apps.db'))
+    swimlane = connect(app_server, store)
+
+    assert swimlane.apps.get(name=app_server.raw_app['name']).id == app_server.raw_app['id']
+    swimlane.apps.list()
+
+    # Light list only requested once per client
+    assert app_server.paths == ['/api/app/light', '/api/app', '/api/app']
+    assert set(store.get_apps(str(swimlane.host))) == {app_server.raw_app['id']}
+
+
+def test_revisions_stored(app_server, tmp_path, raw_app_revision_data):
+    app_id = app_server.raw_app['id']
+    app_server.add_route(
+        'GET',
+        r'/api/app/{}/history/(\d+)'.format(app_id),
+        lambda handler, match: (200, raw_app_revision_data[0])
+    )
+    path = str(tmp_path / 'apps.db')
+
+    swimlane = connect(app_server, path)
+    app = swimlane.apps.get(id=app_id)
+    revision = app.revisions.get(3)
+    assert revision.revision_number == 3
+
+    del app_server.paths[:]
+    request_count = app_server.request_count
+    swimlane = connect(app_server, path)
+    app = swimlane.apps.get(id=app_id)
+    revision = app.revisions.get(3)
+
+    assert revision.revision_number == 3
+    assert revision.version.name == raw_app_revision_data[0]['version']['name']
+    # Only login and app requests sent
+    assert app_server.request_count == request_count + 2
+
+
+def test_clear(tmp_path, mock_app):
+    store = AppStore(str(tmp_path / 'apps.db'))
+    store.put_apps('https://one', [mock_app._raw])
+    store.put_apps('https://two', [mock_app._raw])
+    store.put_revisions('https://one', mock_app.id, [{'revisionNumber': 1.0}])
+
+    store.clear('https://one')
+
+    assert store.get_apps('https://one') == {}
+    assert store.get_revision('https://one', mock_app.id, 1) is None
+    assert list(store.get_apps('https://two')) == [mock_app.id]
+
+    store.clear()
+    assert store.get_apps('https://two') == {}
+
+
+def test_invalid_max_age(tmp_path):
+    with pytest.raises(ValueError):
+        AppStore(str(tmp_path / 'apps.db'), max_age=-1)
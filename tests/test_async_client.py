@@ -0,0 +1,181 @@
+import asyncio
+import threading
+import time
+
+import mock
+import pytest
+
+from swimlane.core.async_client import AsyncSwimlane, AsyncApp, AsyncRecord, AsyncReport
+from swimlane.core.resources.record import Record
+from swimlane.core.resources.report import Report
+
+
+@pytest.fixture
+def async_swimlane(mock_swimlane):
+    client = AsyncSwimlane.from_client(mock_swimlane, max_concurrency=4)
+    yield client
+    client.close()
+
+
+def test_invalid_max_concurrency(mock_swimlane):
+    with pytest.raises(ValueError):
+        AsyncSwimlane.from_client(mock_swimlane, max_concurrency=0)
+
+
+def test_get_app(async_swimlane, mock_swimlane, mock_app):
+    """Test apps.get wraps App with async adapters, proxying all other attributes"""
+    with mock.patch.object(mock_swimlane.apps, 'get', return_value=mock_app) as mock_get:
+        app = asyncio.run(async_swimlane.apps.get(name=mock_app.name))
+
+        mock_get.assert_called_once_with(name=mock_app.name)
+
+    assert isinstance(app, AsyncApp)
+    assert app.app is mock_app
+    assert app.id == mock_app.id
+    assert app.get_field_definition_by_name('Numeric') is mock_app.get_field_definition_by_name('Numeric')
+
+
+def test_list_apps(async_swimlane, mock_swimlane, mock_app):
+    """Test lazy app list is iterated on the client thread pool, not on the event loop thread"""
+    threads = []
+
+    def list_apps():
+        threads.append(threading.current_thread())
+        yield mock_app
+
+    with mock.patch.object(mock_swimlane.apps, 'list', side_effect=list_apps):
+        apps = asyncio.run(async_swimlane.apps.list())
+
+    assert [app.app for app in apps] == [mock_app]
+    assert threads and threads[0] is not threading.current_thread()
+
+
+def test_concurrent_record_gets(async_swimlane, mock_app, mock_record):
+    """Test many concurrently awaited operations are bounded by max_concurrency"""
+    app = AsyncApp(async_swimlane, mock_app)
+    lock = threading.Lock()
+    state = {'in_flight': 0, 'max_in_flight': 0}
+
+    def get(id):
+        with lock:
+            state['in_flight'] += 1
+            state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+        time.sleep(0.001)
+        with lock:
+            state['in_flight'] -= 1
+        return mock_record
+
+    async def get_all():
+        return await asyncio.gather(*[app.records.get(id=str(i)) for i in range(200)])
+
+    with mock.patch.object(mock_app.records, 'get', side_effect=get) as mock_get:
+        records = asyncio.run(get_all())
+
+        assert mock_get.call_count == 200
+
+    assert records == [mock_record] * 200
+    assert 1 < state['max_in_flight'] <= 4
+
+
+def test_async_report_iteration(async_swimlane, mock_app, mock_record):
+    """Test async iteration over a report retrieves and parses all pages"""
+    app = AsyncApp(async_swimlane, mock_app)
+    report = app.reports.build('async', limit=25, page_size=10)
+    assert isinstance(report, AsyncReport)
+
+    async def collect():
+        return [record async for record in report]
+
+    with mock.patch.object(Report, '_retrieve_raw_elements', return_value=[mock_record._raw] * 10) as mock_retrieve:
+        records = asyncio.run(collect())
+
+        assert mock_retrieve.call_count == 3
+
+    assert len(records) == 25
+    assert all(isinstance(record, AsyncRecord) and isinstance(record.record, Record) for record in records)
+
+
+def test_async_iter_search(async_swimlane, mock_app, mock_record):
+    """Test iter_search returns a streaming report for async iteration"""
+    app = AsyncApp(async_swimlane, mock_app)
+
+    async def collect():
+        return [record async for record in app.records.iter_search(('Numeric', 'equals', 1), limit=0)]
+
+    pages = [[mock_record._raw] * 1000, [mock_record._raw] * 5]
+    with mock.patch.object(Report, '_retrieve_raw_elements', side_effect=pages):
+        records = asyncio.run(collect())
+
+    assert len(records) == 1005
+
+
+def test_async_report_early_break(async_swimlane, mock_app, mock_record):
+    """Test report iteration is closed on the client thread pool when the consumer stops iterating early"""
+    app = AsyncApp(async_swimlane, mock_app)
+    report = app.reports.build('async', limit=0, page_size=10)
+    closed = []
+
+    def iter_report(self):
+        try:
+            for _ in range(100):
+                yield mock_record
+        finally:
+            closed.append(threading.current_thread())
+
+    async def first():
+        async for record in report:
+            return record
+
+    with mock.patch.object(Report, '__iter__', iter_report):
+        assert asyncio.run(first()).record is mock_record
+
+    assert len(closed) == 1
+    assert closed[0] is not threading.current_thread()
+
+
+def test_async_record_io_on_thread_pool(async_swimlane, mock_app, mock_record):
+    """Test record operations that may send requests run on the client thread pool"""
+    record = AsyncRecord(async_swimlane, mock_record)
+    threads = []
+
+    def save():
+        threads.append(threading.current_thread())
+
+    async def update():
+        await record.set('Numeric', 5)
+        await record.save()
+        return await record.get('Numeric')
+
+    with mock.patch.object(mock_record, 'save', side_effect=save):
+        assert asyncio.run(update()) == 5
+
+    assert threads and threads[0] is not threading.current_thread()
+    assert record.id == mock_record.id
+    assert record.app.app is mock_app
+    assert isinstance(record.revisions, type(record.app.revisions))
+
+    with pytest.raises(TypeError):
+        record['Numeric']
+    with pytest.raises(TypeError):
+        record['Numeric'] = 1
+
+
+def test_async_record_get_resolves_references(async_swimlane, mock_app, mock_record):
+    """Test reading a reference field resolves referenced records on the client thread pool"""
+    field = mock_record.get_field('Reference')
+    field._ReferenceField__target_app = mock_app
+    record = AsyncRecord(async_swimlane, mock_record)
+    threads = []
+
+    def get(id):
+        threads.append(threading.current_thread())
+        return mock_record
+
+    with mock.patch.object(mock_app.records, 'get', side_effect=get):
+        cursor = asyncio.run(record.get('Reference'))
+
+        assert len(threads) == 3
+        assert threading.current_thread() not in threads
+        # No further requests sent iterating resolved cursor
+        assert list(cursor) == [mock_record] * 3
+        assert len(threads) == 3
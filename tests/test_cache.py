@@ -1,13 +1,21 @@
 """Tests for the ResourceCache class"""
 
 import copy
+import gc
+import time
+import tracemalloc
 
 import mock
 import pytest
+from cachetools import Cache, TTLCache
 
-from swimlane.core.cache import ResourcesCache, check_cache
+from swimlane.core import cache as cache_module
+from swimlane.core.cache import LFU, LRU, TTL, CachePolicy, ResourcesCache, check_cache
+from swimlane.core.resources.app import App
 from swimlane.core.resources.base import APIResource
 from swimlane.core.resources.record import Record
+from swimlane.core.resources.usergroup import Group, User
+from swimlane.utils.copy_on_write import deepcopy_raw
 
 
 def test_len(mock_app, mock_record):
@@ -84,6 +92,35 @@ def test_get_item_from_cache(mock_record):
         cached_record = cache[cache_key]
 
 
+def test_cached_snapshot_isolation(mock_record):
+    """Test changes to cached and returned resources, including nested raw data and fields, never reach the cache"""
+    cache = ResourcesCache(5)
+    cache_key = (type(mock_record), 'id', mock_record.id)
+    field_name = 'Numeric'
+    original_value = mock_record[field_name]
+
+    cache.cache(mock_record)
+    raw_values = deepcopy_raw(cache[cache_key]._raw)
+
+    # Changes to resource after caching
+    mock_record[field_name] = 123
+    mock_record._raw['values']['injected'] = True
+
+    first = cache[cache_key]
+    assert first[field_name] == original_value
+
+    first[field_name] = 456
+    first._raw['comments'] = {'injected': []}
+    first._raw['values']['injected'] = True
+
+    second = cache[cache_key]
+    assert second is not first
+    assert second._fields is not first._fields
+    assert second.revisions.record is second
+    assert second[field_name] == original_value
+    assert second._raw == raw_values
+
+
 def test_clear(mock_app, mock_record):
     """Test clearing individual and all resources from cache"""
 
@@ -179,3 +216,225 @@ def test_cache_invalid_index_key(key):
 
     with pytest.raises(TypeError):
         item = cache[key]
+
+
+def make_records(mock_record, count):
+    """Return copies of mock_record with distinct ids"""
+    records = []
+    for i in range(count):
+        record = copy.copy(mock_record)
+        record.id = '{}{}'.format(mock_record.id, i)
+        record.tracking_id = '{}-{}'.format(mock_record.tracking_id, i)
+        records.append(record)
+    return records
+
+
+@pytest.mark.parametrize('policy, evicted', [(LRU, 1), (LFU, 2)])
+def test_cache_policy_eviction(mock_record, policy, evicted):
+    """Test LRU evicts least recently used while LFU evicts least frequently used resources"""
+    cache = ResourcesCache(0, {'Record': CachePolicy(policy, 2)})
+    records = make_records(mock_record, 3)
+
+    cache.cache(records[0])
+    cache.cache(records[1])
+    # Access first record twice, then second record once
+    for record in (records[0], records[0], records[1]):
+        cache[(Record, 'id', record.id)]
+
+    cache.cache(records[2])
+
+    assert len(cache) == 2
+    assert [record in cache for record in records] == [i != evicted - 1 for i in range(3)]
+
+
+def test_cache_policy_ttl(mock_record):
+    """Test resources expire after TTL"""
+    cache = ResourcesCache(0, {Record: CachePolicy(TTL, 5, ttl=0.05)})
+
+    cache.cache(mock_record)
+    assert mock_record in cache
+
+    time.sleep(0.06)
+
+    assert mock_record not in cache
+    assert len(cache) == 0
+
+
+def test_cache_policy_per_type(mock_app, mock_record, mock_user, mock_group):
+    """Test policies apply to subclasses, types without a policy use the default size, and size 0 disables caching"""
+    cache = ResourcesCache(5, {
+        'UserGroup': CachePolicy(LRU, 10),
+        'Group': CachePolicy(TTL, 20, ttl=60),
+        'Record': CachePolicy(LFU, 0)
+    })
+
+    assert cache.get_policy(User).policy == LRU
+    assert cache.get_policy(Group).policy == TTL
+    assert cache.get_policy(App).policy == LFU
+    assert cache.get_policy(App).maxsize == 5
+
+    for resource in (mock_app, mock_record, mock_user, mock_group):
+        cache.cache(resource)
+
+    assert mock_record not in cache
+    assert mock_app in cache and mock_user in cache and mock_group in cache
+
+
+@pytest.mark.parametrize('args, kwargs', [
+    (('unknown', 10), {}),
+    ((LRU, -1), {}),
+    ((TTL, 10), {}),
+    ((TTL, 10), {'ttl': 0}),
+])
+def test_invalid_cache_policy(args, kwargs):
+    with pytest.raises(ValueError):
+        CachePolicy(*args, **kwargs)
+
+
+def test_invalid_cache_policies():
+    with pytest.raises(TypeError):
+        ResourcesCache(0, {'App': 10})
+
+
+def test_stats(mock_app, mock_record):
+    """Test hit, miss, insert, eviction, orphan, and size counters per resource type, and resetting counters"""
+    cache = ResourcesCache(2, {'Record': CachePolicy(LRU, 2)})
+    records = make_records(mock_record, 3)
+
+    assert cache.stats() == {}
+
+    for record in records:
+        cache.cache(record)
+    cache.cache(mock_app)
+
+    cache[(Record, 'id', records[2].id)]
+    cache[(App, 'name', mock_app.name)]
+    with pytest.raises(KeyError):
+        cache[(Record, 'id', 'missing')]
+    with pytest.raises(KeyError):
+        cache[(Record, 'id', records[0].id)]
+    # Expired resource still in index
+    cache._ResourcesCache__cache_index_key_map[(Record, 'id', 'expired')] = 'expired'
+    with pytest.raises(KeyError):
+        cache[(Record, 'id', 'expired')]
+
+    assert cache.stats(reset=True) == {
+        'Record': {'hits': 1, 'misses': 3, 'inserts': 3, 'evictions': 1, 'orphans': 1, 'size': 2, 'index_keys': 4},
+        'App': {'hits': 1, 'misses': 0, 'inserts': 1, 'evictions': 0, 'orphans': 0, 'size': 1, 'index_keys': 3}
+    }
+    assert cache.stats()['Record'] == {
+        'hits': 0, 'misses': 0, 'inserts': 0, 'evictions': 0, 'orphans': 0, 'size': 2, 'index_keys': 4
+    }
+
+
+def test_stats_ttl_expiry(mock_record):
+    """Test expired resources are counted as evictions"""
+    cache = ResourcesCache(0, {'Record': CachePolicy(TTL, 5, ttl=0.05)})
+    records = make_records(mock_record, 2)
+
+    cache.cache(records[0])
+    time.sleep(0.06)
+    cache.cache(records[1])
+
+    assert cache.stats()['Record']['evictions'] == 1
+    assert cache.stats()['Record']['size'] == 1
+
+
+def test_stats_ttl_expiry_legacy_cachetools(mock_record):
+    """Test expired resources are counted as evictions when TTLCache.expire returns None as before cachetools 5.3"""
+    expire = TTLCache.expire
+
+    def legacy_expire(self, time=None):
+        expire(self, time)
+
+    cache = ResourcesCache(0, {'Record': CachePolicy(TTL, 5, ttl=0.05)})
+    records = make_records(mock_record, 3)
+
+    with mock.patch.object(TTLCache, 'expire', legacy_expire), \
+            mock.patch('swimlane.core.cache._TTL_EXPIRE_RETURNS_ITEMS', False):
+        cache.cache(records[0])
+        cache.cache(records[1])
+        time.sleep(0.06)
+        cache.cache(records[2])
+
+    assert cache.stats()['Record']['evictions'] == 2
+    assert cache.stats()['Record']['size'] == 1
+    assert records[2] in cache
+
+
+@pytest.mark.skipif(not cache_module._TTL_EXPIRE_RETURNS_ITEMS, reason='Requires cachetools 5.3 or later')
+def test_ttl_expiry_without_copying_cache(mock_record):
+    """Test stored items are not copied to find expired items when TTLCache.expire returns them"""
+    cache = ResourcesCache(0, {'Record': CachePolicy(TTL, 5, ttl=60)})
+
+    with mock.patch.object(Cache, '__iter__', autospec=True, side_effect=Cache.__iter__) as mock_iter:
+        for record in make_records(mock_record, 3):
+            cache.cache(record)
+        len(cache)
+        cache.stats()
+
+    mock_iter.assert_not_called()
+
+
+def test_index_keys_removed_with_resources(mock_app, mock_record):
+    """Test index keys are removed on eviction, deletion, clearing, and when a cached resource changes its keys"""
+    cache = ResourcesCache(2, {'Record': CachePolicy(LRU, 2)})
+    index_key_map = cache._ResourcesCache__cache_index_key_map
+    records = make_records(mock_record, 3)
+
+    for record in records:
+        cache.cache(record)
+    assert len(index_key_map) == 4
+
+    del cache[records[2]]
+    assert len(index_key_map) == 2
+
+    # Same record with a new tracking ID
+    retracked_record = copy.copy(records[1])
+    retracked_record.tracking_id = 'RA-NEW'
+    cache.cache(retracked_record)
+    assert index_key_map[(Record, 'tracking_id', 'RA-NEW')] == records[1].get_cache_internal_key()
+    assert (Record, 'tracking_id', records[1].tracking_id) not in index_key_map
+    assert len(index_key_map) == 2
+
+    cache.cache(mock_app)
+
+    cache.clear(Record)
+    assert all(key[0] is App for key in index_key_map)
+
+    cache.clear()
+    assert not index_key_map
+    assert not cache._ResourcesCache__resource_index_keys
+
+
+def test_index_keys_memory_bounded(mock_record):
+    """Test memory stays proportional to cache size over a long run of records streamed through the cache"""
+    cache = ResourcesCache(10)
+    index_key_map = cache._ResourcesCache__cache_index_key_map
+
+    def stream(start, count):
+        for i in range(start, start + count):
+            record = copy.copy(mock_record)
+            record.id = 'record{}'.format(i)
+            record.tracking_id = 'RA-{}'.format(i)
+            cache.cache(record)
+
+    stream(0, 1000)
+
+    tracemalloc.start()
+    try:
+        gc.collect()
+        before = tracemalloc.take_snapshot()
+        stream(1000, 10000)
+        # Evicted records with reference cycles are not yet collected
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    growth = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+
+    assert len(cache) == 10
+    assert len(index_key_map) == 20
+    # Unbounded index keys grow by several MB over this run
+    assert growth < 256 * 1024
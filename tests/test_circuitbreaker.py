@@ -0,0 +1,172 @@
+import time
+
+import mock
+import pytest
+import requests
+
+from swimlane.core.circuitbreaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from swimlane.core.client import Swimlane
+from swimlane.exceptions import SwimlaneCircuitOpenError
+
+
+def fail(breaker, count=1):
+    for _ in range(count):
+        breaker.record_result(breaker.before_request(), True)
+
+
+def succeed(breaker, count=1):
+    for _ in range(count):
+        breaker.record_result(breaker.before_request(), False)
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'failure_threshold': 0},
+    {'failure_threshold': 1.5},
+    {'window_size': 0},
+    {'minimum_calls': 0},
+    {'minimum_calls': 30, 'window_size': 20},
+    {'half_open_max_calls': 0},
+    {'recovery_timeout': -1},
+])
+def test_invalid_circuit_breaker(kwargs):
+    with pytest.raises(ValueError):
+        CircuitBreaker(**kwargs)
+
+
+def test_opens_on_failure_rate():
+    """Test breaker opens only once minimum calls are recorded and failure ratio reaches the threshold"""
+    breaker = CircuitBreaker(failure_threshold=0.5, window_size=10, minimum_calls=4)
+
+    # Below minimum calls
+    fail(breaker, 3)
+    assert breaker.state == CLOSED
+    assert breaker.failure_rate == 1.0
+
+    breaker.reset()
+    succeed(breaker, 3)
+    fail(breaker, 2)
+    assert breaker.state == CLOSED
+    assert breaker.failure_rate == pytest.approx(0.4)
+
+    fail(breaker)
+    assert breaker.state == OPEN
+
+    with pytest.raises(SwimlaneCircuitOpenError) as exc_info:
+        breaker.before_request()
+    assert exc_info.value.circuit_breaker is breaker
+    assert 0 < exc_info.value.retry_after <= 30
+    assert isinstance(exc_info.value, requests.ConnectionError)
+
+
+def test_sliding_window():
+    """Test old outcomes drop out of the window"""
+    breaker = CircuitBreaker(failure_threshold=0.5, window_size=4, minimum_calls=4)
+
+    fail(breaker)
+    succeed(breaker, 4)
+    fail(breaker)
+
+    assert breaker.failure_rate == pytest.approx(0.25)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_recovery():
+    """Test limited probes are allowed after recovery timeout, closing after enough successes"""
+    states = []
+    breaker = CircuitBreaker(
+        minimum_calls=1,
+        recovery_timeout=0.05,
+        half_open_max_calls=2,
+        on_state_change=lambda b, old, new: states.append((old, new))
+    )
+
+    fail(breaker)
+    assert breaker.state == OPEN
+    time.sleep(0.06)
+
+    first = breaker.before_request()
+    second = breaker.before_request()
+    assert breaker.state == HALF_OPEN
+    # All probes in flight
+    with pytest.raises(SwimlaneCircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_result(first, False)
+    breaker.record_result(second, False)
+
+    assert breaker.state == CLOSED
+    assert states == [(CLOSED, OPEN), (OPEN, HALF_OPEN), (HALF_OPEN, CLOSED)]
+
+
+def test_half_open_probe_failure_reopens():
+    breaker = CircuitBreaker(minimum_calls=1, recovery_timeout=0.05)
+
+    fail(breaker)
+    time.sleep(0.06)
+    fail(breaker)
+
+    assert breaker.state == OPEN
+
+
+def test_stale_results_ignored():
+    """Test outcomes of requests admitted before a state change are ignored"""
+    breaker = CircuitBreaker(minimum_calls=1, recovery_timeout=0.05, half_open_max_calls=1)
+
+    stale = breaker.before_request()
+    fail(breaker)
+    time.sleep(0.06)
+    probe = breaker.before_request()
+
+    breaker.record_result(stale, True)
+    assert breaker.state == HALF_OPEN
+
+    breaker.record_result(probe, False)
+    assert breaker.state == CLOSED
+
+
+def test_reset():
+    breaker = CircuitBreaker(minimum_calls=1)
+    fail(breaker)
+
+    breaker.reset()
+
+    assert breaker.state == CLOSED
+    assert breaker.failure_rate == 0.0
+    breaker.before_request()
+
+
+def test_client_fails_fast(fake_server):
+    """Test client stops sending requests, including retries, once breaker opens on server errors"""
+    fake_server.add_route('GET', r'/api/broken', lambda handler, match: (503, {}))
+    breaker = CircuitBreaker(failure_threshold=1, window_size=3, minimum_calls=3, recovery_timeout=60)
+    swimlane = Swimlane(
+        fake_server.url, 'admin', 'password',
+        verify_server_version=False,
+        max_retries=10,
+        retry_interval=1,
+        circuit_breaker=breaker
+    )
+
+    with mock.patch('swimlane.core.retry.random.uniform', return_value=0):
+        with pytest.raises(SwimlaneCircuitOpenError):
+            swimlane.request('get', 'broken')
+
+    # Login is not counted as it is sent during the first request
+    assert fake_server.request_count == 4
+    assert breaker.state == OPEN
+
+    with pytest.raises(SwimlaneCircuitOpenError):
+        swimlane.request('get', 'app/{}'.format(fake_server.raw_app['id']))
+    assert fake_server.request_count == 4
+
+
+def test_client_errors_count_as_success(fake_server):
+    breaker = CircuitBreaker(minimum_calls=1)
+    swimlane = Swimlane(fake_server.url, 'admin', 'password', verify_server_version=False, circuit_breaker=breaker)
+
+    with pytest.raises(requests.HTTPError):
+        swimlane.request('get', 'missing')
+    swimlane.request('get', 'app/{}'.format(fake_server.raw_app['id']))
+
+    assert breaker.state == CLOSED
+    assert breaker.failure_rate == 0.0
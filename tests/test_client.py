@@ -1,4 +1,6 @@
 """Tests for custom Swimlane errors"""
+from concurrent.futures import ThreadPoolExecutor
+
 import mock
 import pytest
 from requests import HTTPError
@@ -273,3 +275,49 @@ def test_host_url_scheme_coercion():
             mock_swimlane = Swimlane('HTTP://host', 'user', 'pass', verify_server_version=False)
             assert mock_swimlane.host.scheme == 'http'
 
+
+
+@pytest.mark.parametrize('kwargs', [{'pool_connections': 0}, {'pool_maxsize': 0}, {'pool_maxsize': 'many'}])
+def test_invalid_pool_options(kwargs):
+    with pytest.raises(ValueError):
+        Swimlane('http://host', 'admin', 'password', verify_server_version=False, **kwargs)
+
+
+@pytest.mark.parametrize('reference_batch_size', [0, 2.5, None])
+def test_invalid_reference_batch_size(reference_batch_size):
+    with pytest.raises(ValueError):
+        Swimlane(
+            'http://host', 'admin', 'password',
+            verify_server_version=False,
+            reference_batch_size=reference_batch_size
+        )
+
+
+def test_keep_alive_disabled(mock_swimlane):
+    """Test disabling keep-alive closes connections after each request"""
+    with mock.patch('swimlane.core.client.WrappedSession', mock.MagicMock()):
+        swimlane = Swimlane('http://host', 'admin', 'password', verify_server_version=False, keep_alive=False)
+        swimlane._session.headers.__setitem__.assert_called_once_with('Connection', 'close')
+
+
+@pytest.mark.parametrize('pool_maxsize, reuses_all', [(4, True), (1, False)])
+def test_pool_stats(fake_server, pool_maxsize, reuses_all):
+    """Test pooled connections are reused between threads when the pool is large enough for all threads"""
+    swimlane = Swimlane(fake_server.url, 'admin', 'password', verify_server_version=False, pool_maxsize=pool_maxsize)
+    endpoint = 'app/{}'.format(fake_server.raw_app['id'])
+
+    def work(_):
+        for _ in range(20):
+            swimlane.request('get', endpoint)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(work, range(4)))
+
+    stats = swimlane.pool_stats
+    assert stats['pools'] == 1
+    assert stats['requests'] == 81
+    assert stats['reused_connections'] == stats['requests'] - stats['new_connections']
+    if reuses_all:
+        assert stats['new_connections'] <= 4
+    else:
+        assert stats['new_connections'] > 1
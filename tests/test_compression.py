@@ -0,0 +1,99 @@
+import gzip
+import zlib
+
+import pytest
+
+from swimlane.core.client import Swimlane
+
+
+@pytest.fixture
+def echo_server(fake_server):
+    """Fake server recording request bodies and encodings, responding with a large gzip compressed body"""
+    fake_server.received = []
+
+    def echo(handler, match):
+        fake_server.received.append((handler.headers.get('Content-Encoding'), handler.body))
+        headers = {}
+        if 'gzip' in handler.headers.get('Accept-Encoding', ''):
+            headers['Content-Encoding'] = 'gzip'
+        return 200, {'items': ['value'] * 500}, headers
+
+    fake_server.add_route('POST', r'/api/echo', echo)
+    return fake_server
+
+
+payload = [{'$type': 'Core.Models.Record.Record, Core', 'value': i} for i in range(100)]
+
+
+@pytest.mark.parametrize('compression, decompress', [('gzip', gzip.decompress), ('deflate', zlib.decompress)])
+def test_request_compression(echo_server, compression, decompress):
+    """Test bodies above the minimum size are compressed, and transfer stats reflect compressed and original sizes"""
+    swimlane = Swimlane(
+        echo_server.url, 'admin', 'password',
+        verify_server_version=False,
+        json_backend='json',
+        compression=compression,
+        compression_min_size=100
+    )
+
+    # Log in before measuring
+    swimlane.request('get', 'app/{}'.format(echo_server.raw_app['id']))
+    before = swimlane.transfer_stats
+
+    response = swimlane.request('post', 'echo', json=payload)
+    swimlane.request('post', 'echo', json={'small': True})
+
+    (encoding, body), (small_encoding, small_body) = echo_server.received
+    expected = swimlane._json_backend.dumps(payload)
+    assert encoding == compression
+    assert decompress(body) == expected
+    assert small_encoding is None
+    assert small_body == b'{"small":true}'
+
+    assert response.transfer_stats['request_bytes'] == len(expected)
+    assert response.transfer_stats['request_bytes_sent'] == len(body)
+    assert response.transfer_stats['request_bytes_sent'] * 10 < len(expected)
+
+    stats = {key: value - before[key] for key, value in swimlane.transfer_stats.items()}
+    assert stats['requests'] == 2
+    assert stats['request_bytes'] == len(expected) + len(small_body)
+    assert stats['request_bytes_sent'] == len(body) + len(small_body)
+    assert stats['response_bytes'] > stats['response_bytes_received'] > 0
+
+
+def test_per_request_compression(echo_server):
+    swimlane = Swimlane(echo_server.url, 'admin', 'password', verify_server_version=False, compression_min_size=0)
+
+    swimlane.request('post', 'echo', json=payload)
+    swimlane.request('post', 'echo', json=payload, compression='gzip')
+    with pytest.raises(ValueError):
+        swimlane.request('post', 'echo', json=payload, compression='br')
+
+    assert [encoding for encoding, _ in echo_server.received] == [None, 'gzip']
+
+
+@pytest.mark.parametrize('compressed_responses', [True, False])
+def test_response_compression(echo_server, compressed_responses):
+    """Test compressed responses are negotiated and decompressed, counting bytes received before decompression"""
+    swimlane = Swimlane(
+        echo_server.url, 'admin', 'password',
+        verify_server_version=False,
+        compressed_responses=compressed_responses
+    )
+
+    response = swimlane.request('post', 'echo', json={})
+
+    assert response.json() == {'items': ['value'] * 500}
+    assert response.transfer_stats['response_bytes'] == len(response.content)
+    if compressed_responses:
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert response.transfer_stats['response_bytes_received'] * 10 < len(response.content)
+    else:
+        assert 'Content-Encoding' not in response.headers
+        assert response.transfer_stats['response_bytes_received'] == len(response.content)
+
+
+@pytest.mark.parametrize('kwargs', [{'compression': 'br'}, {'compression_min_size': -1}])
+def test_invalid_compression(kwargs):
+    with pytest.raises(ValueError):
+        Swimlane('http://host', 'admin', 'password', verify_server_version=False, **kwargs)
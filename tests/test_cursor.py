@@ -27,3 +27,71 @@ def test_paginated_cursor_hooks():
 
     # Noop parse hook
     assert cursor._parse_raw_element(1) == 1
+
+
+class _PagesCursor(PaginatedCursor):
+    """Paginated cursor over a fixed number of elements, recording each requested page"""
+
+    def __init__(self, total, **kwargs):
+        super(_PagesCursor, self).__init__(**kwargs)
+        self.total = total
+        self.requested_pages = []
+
+    def _retrieve_raw_elements(self, page):
+        self.requested_pages.append(page)
+        start = page * self.page_size
+        return list(range(start, min(start + self.page_size, self.total)))
+
+
+@pytest.mark.parametrize('prefetch', [0, 1, 4])
+def test_paginated_cursor_prefetch_order(prefetch):
+    """Test prefetching pages still yields elements in page order"""
+    cursor = _PagesCursor(95, page_size=10, prefetch=prefetch)
+
+    assert list(cursor) == list(range(95))
+
+
+def test_paginated_cursor_prefetch_stops_on_short_page():
+    """Test no further pages are requested once a short page is returned"""
+    cursor = _PagesCursor(25, page_size=10, prefetch=2)
+
+    assert len(cursor) == 25
+    # Pages 0-2 contain results, page 3 may already be in flight when the short page 2 is received
+    assert sorted(cursor.requested_pages)[:3] == [0, 1, 2]
+    assert max(cursor.requested_pages) <= 3
+
+
+def test_paginated_cursor_prefetch_respects_limit():
+    """Test pages beyond the limit are never requested"""
+    cursor = _PagesCursor(1000, limit=25, page_size=10, prefetch=8)
+
+    assert list(cursor) == list(range(25))
+    assert sorted(cursor.requested_pages) == [0, 1, 2]
+
+
+@pytest.mark.parametrize('prefetch', [-1, 1.5, None])
+def test_paginated_cursor_invalid_prefetch(prefetch):
+    with pytest.raises(ValueError):
+        PaginatedCursor(prefetch=prefetch)
+
+
+def test_paginated_cursor_stream():
+    """Test streaming cursor yields all elements without retaining them, retrieving again on each iteration"""
+    cursor = _PagesCursor(25, page_size=10, stream=True)
+
+    assert list(cursor) == list(range(25))
+    assert cursor._elements == []
+    assert cursor.requested_pages == [0, 1, 2]
+
+    assert list(cursor) == list(range(25))
+    assert cursor.requested_pages == [0, 1, 2, 0, 1, 2]
+
+    with pytest.raises(TypeError):
+        len(cursor)
+
+
+def test_paginated_cursor_stream_limit():
+    cursor = _PagesCursor(1000, limit=15, page_size=10, stream=True)
+
+    assert list(cursor) == list(range(15))
+    assert cursor._elements == []
@@ -0,0 +1,92 @@
+import pytest
+import requests
+
+from swimlane.core import jsonbackend
+from swimlane.core.client import Swimlane
+from swimlane.core.jsonbackend import (
+    ORJSON, STDLIB, UJSON, JsonBackend, OrjsonBackend, get_json_backend
+)
+from swimlane.core.wrappedsession import JsonResponse
+
+installed_backends = [name for name in (ORJSON, UJSON, STDLIB) if jsonbackend._backends[name][1] is not None]
+
+payload = {'b': [1, 2.5, None, True], 'a': 'unicode é中', 'c': {'z': 1, 'y': {}}}
+
+
+def test_default_backend():
+    """Test fastest installed backend is selected by default"""
+    assert get_json_backend().name == installed_backends[0]
+
+
+def test_backend_instance_returned():
+    backend = JsonBackend()
+    assert get_json_backend(backend) is backend
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_json_backend('simplejson')
+
+
+@pytest.mark.parametrize('name', installed_backends)
+def test_round_trip(name):
+    backend = get_json_backend(name)
+
+    encoded = backend.dumps(payload)
+
+    assert isinstance(encoded, bytes)
+    assert backend.loads(encoded) == payload
+    assert backend.loads(encoded.decode('utf-8')) == payload
+
+
+@pytest.mark.parametrize('name', installed_backends)
+def test_sort_keys(name):
+    backend = get_json_backend(name)
+
+    assert backend.dumps(payload, sort_keys=True) == JsonBackend().dumps(payload, sort_keys=True)
+    assert backend.dumps(payload, sort_keys=True).startswith(b'{"a":')
+
+
+@pytest.mark.skipif(ORJSON not in installed_backends, reason='orjson not installed')
+def test_orjson_fallback():
+    """Test values unsupported by orjson are serialized by the standard library"""
+    assert OrjsonBackend().dumps({'big': 2 ** 70}) == b'{"big":1180591620717411303424}'
+
+
+def make_response(content, backend):
+    response = JsonResponse()
+    response._content = content
+    response.json_backend = backend
+    return response
+
+
+@pytest.mark.parametrize('name', installed_backends)
+def test_json_response(name):
+    backend = get_json_backend(name)
+
+    assert make_response(backend.dumps(payload), backend).json() == payload
+    # Non UTF-8 bodies decoded by requests
+    assert make_response('{"a": 1}'.encode('utf-16'), backend).json() == {'a': 1}
+
+    with pytest.raises(requests.JSONDecodeError):
+        make_response(b'not json', backend).json()
+
+
+@pytest.mark.parametrize('name', installed_backends)
+def test_client_json_backend(fake_server, name):
+    """Test client encodes payloads and decodes responses with the configured backend"""
+    received = []
+
+    def echo(handler, match):
+        received.append(handler.body)
+        return 200, {'echo': True}
+
+    fake_server.add_route('POST', r'/api/echo', echo)
+    swimlane = Swimlane(fake_server.url, 'admin', 'password', verify_server_version=False, json_backend=name)
+
+    response = swimlane.request('post', 'echo', json=payload)
+
+    assert isinstance(response, JsonResponse)
+    assert response.json_backend.name == name
+    assert response.json() == {'echo': True}
+    assert received == [get_json_backend(name).dumps(payload)]
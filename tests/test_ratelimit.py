@@ -0,0 +1,176 @@
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import mock
+import pytest
+import requests
+
+from swimlane.core.client import Swimlane
+from swimlane.core.resources.attachment import Attachment
+from swimlane.core.ratelimit import (
+    ATTACHMENT, RECORD_WRITE, SEARCH, RateLimit, TokenBucket, get_endpoint_class
+)
+
+
+@pytest.mark.parametrize('method, endpoint, expected', [
+    ('post', 'search', SEARCH),
+    ('get', 'attachment/abc/def/ghi', ATTACHMENT),
+    ('post', 'attachment/abc/def', ATTACHMENT),
+    ('post', 'app/abc/record', RECORD_WRITE),
+    ('put', 'app/abc/record/batch', RECORD_WRITE),
+    ('DELETE', 'app/abc/record/def', RECORD_WRITE),
+    ('get', 'app/abc/record/def', None),
+    ('get', 'app/abc', None),
+    ('get', 'user/search?query=admin', None),
+])
+def test_get_endpoint_class(method, endpoint, expected):
+    assert get_endpoint_class(method, endpoint) == expected
+
+
+def test_token_bucket():
+    """Test bursts are allowed up to bucket size, after which callers are queued at the configured rate"""
+    with mock.patch('swimlane.core.ratelimit.time.monotonic', return_value=100.0) as monotonic:
+        bucket = TokenBucket(10, burst=2)
+
+        delays = [bucket._reserve() for _ in range(4)]
+
+        assert delays[:2] == [0, 0]
+        assert delays[2] == pytest.approx(0.1)
+        assert delays[3] == pytest.approx(0.2)
+
+        # Tokens refilled at configured rate, paying back queued callers first
+        monotonic.return_value = 100.25
+        assert bucket._reserve() == pytest.approx(0.05)
+
+        monotonic.return_value = 110
+        assert [bucket._reserve() for _ in range(3)] == [0, 0, pytest.approx(0.1)]
+
+
+@pytest.mark.parametrize('kwargs', [{'rate': 0}, {'rate': 1, 'burst': 0}, {'max_in_flight': 0}])
+def test_invalid_rate_limit(kwargs):
+    with pytest.raises(ValueError):
+        RateLimit(**kwargs)
+
+
+def test_invalid_endpoint_class():
+    with pytest.raises(ValueError):
+        Swimlane(
+            'http://host', 'admin', 'password',
+            verify_server_version=False,
+            endpoint_rate_limits={'unknown': RateLimit(rate=1)}
+        )
+
+
+@pytest.fixture
+def slow_record_server(fake_server):
+    """Fake server tracking max number of concurrent record write requests"""
+    state = {'in_flight': 0, 'max_in_flight': 0}
+    lock = threading.Lock()
+
+    def write_record(handler, match):
+        with lock:
+            state['in_flight'] += 1
+            state['max_in_flight'] = max(state['max_in_flight'], state['in_flight'])
+        time.sleep(0.02)
+        with lock:
+            state['in_flight'] -= 1
+        return 200, {}
+
+    fake_server.add_route('PUT', r'/api/app/\w+/record/\w+', write_record)
+    fake_server.state = state
+    return fake_server
+
+
+def test_max_in_flight(slow_record_server):
+    """Test global and endpoint class concurrency limits, with nested auth requests admitted while holding limits"""
+    swimlane = Swimlane(
+        slow_record_server.url, 'admin', 'password',
+        verify_server_version=False,
+        rate_limit=RateLimit(max_in_flight=1),
+        endpoint_rate_limits={RECORD_WRITE: RateLimit(max_in_flight=1)}
+    )
+    app_id = slow_record_server.raw_app['id']
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: swimlane.request('put', 'app/{}/record/{}'.format(app_id, i)), range(16)))
+
+    assert slow_record_server.login_count == 1
+    assert slow_record_server.state['max_in_flight'] == 1
+
+    # Unlimited endpoint classes only use global limits
+    swimlane.rate_limit = None
+    swimlane.endpoint_rate_limits = {SEARCH: RateLimit(max_in_flight=1)}
+    slow_record_server.state['max_in_flight'] = 0
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: swimlane.request('put', 'app/{}/record/{}'.format(app_id, i)), range(16)))
+
+    assert slow_record_server.state['max_in_flight'] > 1
+
+
+def test_rate(fake_server):
+    """Test requests are sent no faster than the configured rate after the initial burst"""
+    swimlane = Swimlane(
+        fake_server.url, 'admin', 'password',
+        verify_server_version=False,
+        rate_limit=RateLimit(rate=50, burst=1)
+    )
+    endpoint = 'app/{}'.format(fake_server.raw_app['id'])
+    swimlane.request('get', endpoint)
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: swimlane.request('get', endpoint), range(10)))
+
+    assert time.monotonic() - start >= 0.18
+
+
+def streamed_response(body):
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def is_available(semaphore):
+    if not semaphore.acquire(blocking=False):
+        return False
+    semaphore.release()
+    return True
+
+
+@pytest.mark.parametrize('consume', [
+    lambda response: b''.join(response.iter_content(4)),
+    lambda response: response.content,
+    lambda response: response.close()
+])
+def test_streamed_response_holds_limit(mock_swimlane, consume):
+    """Test in-flight limits of streamed requests are held until the response body is consumed or closed"""
+    limit = RateLimit(max_in_flight=1)
+    mock_swimlane.endpoint_rate_limits = {ATTACHMENT: limit}
+    mock_swimlane._session.request.return_value = streamed_response(b'x' * 10)
+
+    response = mock_swimlane.request('get', 'attachment/abc/def/ghi', stream=True)
+    assert not is_available(limit._semaphore)
+
+    # Other requests on the same thread are still limited
+    mock_swimlane._session.request.return_value = streamed_response(b'')
+    with mock.patch.object(limit._semaphore, 'acquire', return_value=True) as mock_acquire, \
+            mock.patch.object(limit._semaphore, 'release'):
+        mock_swimlane.request('get', 'attachment/abc/def/jkl')
+        mock_acquire.assert_called_once_with()
+
+    consume(response)
+    assert is_available(limit._semaphore)
+
+
+def test_attachment_download_releases_limit(mock_swimlane, mock_record):
+    limit = RateLimit(max_in_flight=1)
+    mock_swimlane.endpoint_rate_limits = {ATTACHMENT: limit}
+    mock_swimlane._session.request.return_value = streamed_response(b'attachment')
+    attachment = mock.MagicMock(record_id='abc', field_id='def', file_id='ghi', _swimlane=mock_swimlane)
+
+    assert Attachment.download(attachment).read() == b'attachment'
+    assert is_available(limit._semaphore)
@@ -0,0 +1,171 @@
+import email.utils
+import time
+
+import mock
+import pytest
+import requests
+
+from swimlane.core.client import Swimlane
+from swimlane.core.retry import RetryPolicy
+
+
+def mock_response(status_code, headers=None):
+    response = mock.MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+def test_exponential_backoff():
+    """Test delays double on each attempt up to backoff_max, and stop after max_retries"""
+    policy = RetryPolicy(max_retries=5, backoff_base=1, backoff_max=5, jitter=False)
+
+    assert [policy.get_delay(attempt, 0) for attempt in range(6)] == [1, 2, 4, 5, 5, None]
+
+
+def test_full_jitter():
+    """Test jittered delays fall between 0 and the exponential backoff delay"""
+    policy = RetryPolicy(max_retries=10, backoff_base=1, backoff_max=8)
+
+    for attempt in range(10):
+        for _ in range(20):
+            assert 0 <= policy.get_delay(attempt, 0) <= min(8, 2 ** attempt)
+
+
+def test_deadline():
+    """Test no more retries are allowed once a delay would exceed the deadline"""
+    policy = RetryPolicy(backoff_base=2, jitter=False, deadline=10)
+
+    assert policy.get_delay(0, 7) == 2
+    assert policy.get_delay(1, 7) is None
+
+
+def test_retry_after():
+    """Test Retry-After header seconds and HTTP dates override computed delays"""
+    policy = RetryPolicy(backoff_base=1, jitter=False)
+
+    assert policy.get_delay(0, 0, mock_response(503, {'Retry-After': '7'})) == 7
+
+    retry_date = email.utils.formatdate(time.time() + 30, usegmt=True)
+    assert 28 <= policy.get_delay(0, 0, mock_response(503, {'Retry-After': retry_date})) <= 30
+
+    assert policy.get_delay(0, 0, mock_response(503, {'Retry-After': 'invalid'})) == 1
+
+    assert policy.replace(respect_retry_after=False).get_delay(0, 0, mock_response(503, {'Retry-After': '7'})) == 1
+    assert policy.replace(deadline=5).get_delay(0, 0, mock_response(503, {'Retry-After': '7'})) is None
+
+
+def test_retry_after_limit():
+    """Test Retry-After delays are limited to max_retry_after, defaulting to backoff_max"""
+    policy = RetryPolicy(backoff_max=20, jitter=False)
+
+    assert policy.get_delay(0, 0, mock_response(503, {'Retry-After': '86400'})) == 20
+
+    retry_date = email.utils.formatdate(time.time() + 86400, usegmt=True)
+    assert policy.get_delay(0, 0, mock_response(429, {'Retry-After': retry_date})) == 20
+
+    policy = policy.replace(max_retry_after=60)
+    assert policy.get_delay(0, 0, mock_response(503, {'Retry-After': '86400'})) == 60
+    assert policy.get_delay(0, 0, mock_response(503, {'Retry-After': '7'})) == 7
+    assert policy.get_delay(0, 0, mock_response(503, {'Retry-After': '-5'})) == 0
+
+    with pytest.raises(ValueError):
+        RetryPolicy(max_retry_after=-1)
+
+
+@pytest.mark.parametrize('retry_after', ['nan', 'inf', '-inf', 'NaN'])
+def test_retry_after_not_finite(retry_after):
+    """Test non-finite Retry-After values are ignored, falling back to the backoff delay"""
+    policy = RetryPolicy(backoff_base=1, jitter=False)
+
+    assert policy.get_delay(0, 0, mock_response(503, {'Retry-After': retry_after})) == 1
+
+
+def test_is_retryable():
+    """Test configurable retryable status codes, methods, and idempotent methods for connection errors"""
+    policy = RetryPolicy()
+
+    assert policy.is_retryable('post', response=mock_response(503))
+    assert policy.is_retryable('get', response=mock_response(429))
+    assert not policy.is_retryable('get', response=mock_response(404))
+
+    assert policy.is_retryable('get', error=requests.ConnectionError())
+    assert not policy.is_retryable('post', error=requests.ConnectionError())
+
+    policy = RetryPolicy(retry_statuses=[503], retry_methods=['get'], idempotent_methods=['get', 'post'])
+    assert policy.is_retryable('get', response=mock_response(503))
+    assert not policy.is_retryable('get', response=mock_response(500))
+    assert not policy.is_retryable('post', response=mock_response(503))
+    assert policy.is_retryable('post', error=requests.ConnectionError())
+
+
+@pytest.mark.parametrize('kwargs', [{'max_retries': -1}, {'max_retries': 1.5}, {'backoff_base': -1}, {'deadline': -1}])
+def test_invalid_policy(kwargs):
+    with pytest.raises(ValueError):
+        RetryPolicy(**kwargs)
+
+
+def test_request_retry_after(fake_server):
+    """Test client waits for Retry-After on throttled responses before retrying"""
+    responses = [
+        (429, {}, {'Retry-After': '2'}),
+        (503, {}, {'Retry-After': '0'}),
+        (200, {'apiVersion': '10.0'})
+    ]
+    fake_server.add_route('GET', '/api/settings', lambda handler, match: responses.pop(0))
+
+    swimlane = Swimlane(fake_server.url, 'admin', 'password', verify_server_version=False)
+
+    with mock.patch('swimlane.core.client.time.sleep') as mock_sleep:
+        assert swimlane.request('get', 'settings').json() == {'apiVersion': '10.0'}
+
+    # Ignore fake server login delay sharing the patched time module
+    assert mock_sleep.call_args_list[-2:] == [mock.call(2), mock.call(0)]
+
+
+def test_request_max_retries_exceeded(mock_swimlane):
+    """Test ConnectionError is raised once all retries have failed"""
+    error_response = mock_response(500)
+    error_response.raise_for_status.side_effect = requests.HTTPError(response=error_response)
+
+    policy = RetryPolicy(max_retries=3, backoff_base=0.5, jitter=False)
+
+    with mock.patch.object(mock_swimlane._session, 'request', return_value=error_response) as mock_request:
+        with mock.patch('swimlane.core.client.time.sleep') as mock_sleep:
+            with pytest.raises(requests.ConnectionError, match='Max retries exceeded'):
+                mock_swimlane.request('get', 'settings', retry_policy=policy)
+
+            assert mock_request.call_count == 4
+            assert mock_sleep.call_args_list == [mock.call(0.5), mock.call(1.0), mock.call(2.0)]
+
+            # Retries disabled raises error immediately
+            with pytest.raises(requests.HTTPError):
+                mock_swimlane.request('get', 'settings', retry=False)
+
+            assert mock_request.call_count == 5
+
+
+def test_request_connection_error_idempotent_only(mock_swimlane):
+    """Test connection errors are only retried for idempotent methods"""
+    with mock.patch.object(mock_swimlane._session, 'request', side_effect=requests.ConnectionError) as mock_request:
+        with mock.patch('swimlane.core.client.time.sleep'):
+            with pytest.raises(requests.ConnectionError):
+                mock_swimlane.request('post', 'record', max_retries=2)
+
+            assert mock_request.call_count == 1
+
+            with pytest.raises(requests.ConnectionError):
+                mock_swimlane.request('get', 'record', max_retries=2)
+
+            assert mock_request.call_count == 4
+
+
+@pytest.mark.parametrize('kwargs, error', [
+    ({'max_retries': 'many'}, TypeError),
+    ({'max_retries': 0}, ValueError),
+    ({'retry_interval': 0.5}, TypeError),
+    ({'retry_interval': -1}, ValueError),
+])
+def test_request_invalid_retry_args(mock_swimlane, kwargs, error):
+    with pytest.raises(error):
+        mock_swimlane.request('get', 'settings', **kwargs)
@@ -0,0 +1,35 @@
+"""Multi-threaded stress tests of a shared Swimlane client against a local fake server"""
+from concurrent.futures import ThreadPoolExecutor
+
+from swimlane.core.client import Swimlane
+from swimlane.core.resources.app import App
+from swimlane.core.resources.record import Record
+
+
+def test_shared_client_stress(fake_server):
+    """Test concurrent requests, cache hits, and cache inserts from many threads on one client with a single login"""
+    swimlane = Swimlane(fake_server.url, 'admin', 'password', verify_server_version=False, resource_cache_size=20)
+    app_id = fake_server.raw_app['id']
+    record_ids = ['record{}'.format(i) for i in range(40)]
+
+    def work(worker):
+        results = []
+        for i in range(25):
+            app = swimlane.apps.get(id=app_id)
+            record = app.records.get(id=record_ids[(worker * 7 + i) % len(record_ids)])
+            results.append((app, record, record['Numeric']))
+        return results
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = [result for worker_results in executor.map(work, range(16)) for result in worker_results]
+
+    assert len(results) == 400
+    for app, record, numeric in results:
+        assert isinstance(app, App) and app.id == app_id
+        assert isinstance(record, Record) and record.id in record_ids
+        assert numeric == record['Numeric']
+
+    # Only one login for all threads, and cached resources avoided most requests
+    assert fake_server.login_count == 1
+    assert fake_server.request_count < 400
+    assert len(swimlane.resources_cache) <= 40
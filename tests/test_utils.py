@@ -1,3 +1,5 @@
+import copy
+import json
 import os
 import string
 import sys
@@ -17,6 +19,7 @@ from swimlane.utils import (
     import_submodules,
     one_of_keyword_only
 )
+from swimlane.utils.copy_on_write import CopyOnWriteDict, deepcopy_raw
 from swimlane.utils.version import (
     compare_versions,
     requires_swimlane_version,
@@ -227,3 +230,44 @@ class TestRequiresSwimlaneVersion(object):
         kwargs = {'a': 'A', 'b': 'B'}
 
         assert resolver.func(*args, **kwargs) == (args, kwargs)
+
+
+def test_deepcopy_raw():
+    raw = {'a': [{'b': 1}, (2, {'c': 3})], 'd': 'e'}
+
+    copied = deepcopy_raw(raw)
+
+    assert copied == raw
+    assert copied['a'] is not raw['a']
+    assert copied['a'][0] is not raw['a'][0]
+    assert copied['a'][1][1] is not raw['a'][1][1]
+
+
+def test_copy_on_write_dict():
+    """Test modifications through a view never reach the snapshot, while serialization sees the same data"""
+    snapshot = {'values': {'a': [1, 2], 'b': {'c': 1}}, 'comments': [], 'id': 'abc'}
+    expected = deepcopy_raw(snapshot)
+    view = CopyOnWriteDict(snapshot)
+
+    assert json.dumps(view, sort_keys=True) == json.dumps(snapshot, sort_keys=True)
+
+    view['values']['a'].append(3)
+    view['values']['b']['c'] = 2
+    view.get('comments').append('comment')
+    view.setdefault('new', {})['key'] = 'value'
+    view['id'] = 'def'
+    view.pop('values')['d'] = 4
+
+    assert snapshot == expected
+    assert view == {'comments': ['comment'], 'new': {'key': 'value'}, 'id': 'def'}
+
+    # Copies keep sharing the snapshot
+    other = copy.copy(CopyOnWriteDict(snapshot))
+    other['values']['a'].append(3)
+    assert isinstance(other, CopyOnWriteDict)
+    assert snapshot == expected
+
+    deep = copy.deepcopy(CopyOnWriteDict(snapshot))
+    assert type(deep) is dict
+    assert deep == expected
+